@@ -0,0 +1,114 @@
+import numpy as np
+
+from src.core.calculations.batch import evaluate_valid, feasible, max_intensities, total_lengths
+from src.core.calculations.horizontal_wells import (
+    TwoInterval, ThreeInterval, TangentialFourInterval, TangentialFiveInterval, FourInterval,
+    Tangential, Descending, Ascending, Undulant
+)
+from src.core.calculations.profile_arrays import ProfileArray
+
+
+# Виды частей профиля в порядке переключателей формы горизонтальной скважины
+DIRECTIONAL_TYPES = (TwoInterval, ThreeInterval, TangentialFourInterval, TangentialFiveInterval, FourInterval)
+HORIZONTAL_TYPES = (Tangential, Descending, Ascending, Undulant)
+
+# Параметры горизонтальной части, совпадающие с точкой посадки направляющей части
+LANDING = ('H', 'A', 'a')
+
+
+class AutoDesignResult:
+    """
+    Класс, описывающий результат автоподбора видов профиля для списка целей.
+    Массивы сочетаний имеют форму (число целей, число видов направляющей части, число видов
+    горизонтальной части); для недопустимых сочетаний длина и интенсивность - nan.
+    :атрибут directional_types, horizontal_types: рассмотренные виды частей профиля;
+    :атрибут lengths: длина ствола в конце профиля, м;
+    :атрибут intensities: наибольшая по модулю интенсивность искривления, град/10м;
+    :атрибут ranking: номера сочетаний (направляющая * число горизонтальных + горизонтальная)
+    для каждой цели по возрастанию длины, затем интенсивности; недопустимые - в конце;
+    :атрибут counts: число допустимых сочетаний для каждой цели;
+    """
+
+    __slots__ = ('directional_types', 'horizontal_types', 'lengths', 'intensities', 'ranking', 'counts')
+
+    def __init__(self, directional_types, horizontal_types, lengths, intensities, ranking, counts):
+        self.directional_types = directional_types
+        self.horizontal_types = horizontal_types
+        self.lengths = lengths
+        self.intensities = intensities
+        self.ranking = ranking
+        self.counts = counts
+
+    def __len__(self):
+        return len(self.lengths)
+
+    def combination(self, index):
+        """Метод для получения видов частей профиля по номеру сочетания"""
+        i, j = divmod(int(index), len(self.horizontal_types))
+        return self.directional_types[i], self.horizontal_types[j]
+
+    @property
+    def best(self):
+        """Свойство для получения номера лучшего сочетания каждой цели (-1, если допустимых нет)"""
+        return np.where(self.counts > 0, self.ranking[:, 0], -1)
+
+    def ranked(self, row):
+        """Метод для получения списка допустимых сочетаний цели: (направляющая, горизонтальная, длина, интенсивность)"""
+        lengths, intensities = self.lengths[row].ravel(), self.intensities[row].ravel()
+        return [
+            (*self.combination(index), lengths[index], intensities[index])
+            for index in self.ranking[row, :self.counts[row]]
+        ]
+
+
+def _part_metrics(profile_cls, columns, size):
+    """
+    Функция для расчёта длины ствола, интенсивности и допустимости всех целей для одного вида части.
+    Если для вида не заданы все параметры, все цели для него недопустимы.
+    """
+    if any(name not in columns for name in profile_cls._PARAMS):
+        return np.full(size, np.nan), np.full(size, np.nan)
+
+    designs = ProfileArray.from_columns(
+        profile_cls, **{name: np.broadcast_to(columns[name], size) for name in profile_cls._PARAMS}
+    )
+    table, _ = evaluate_valid(designs)
+    mask = feasible(table)
+    return np.where(mask, total_lengths(table), np.nan), np.where(mask, max_intensities(table), np.nan)
+
+
+def auto_design(directional, horizontal, directional_types=DIRECTIONAL_TYPES, horizontal_types=HORIZONTAL_TYPES):
+    """
+    Функция для автоподбора видов профиля: для каждой цели рассматриваются все сочетания видов
+    направляющей и горизонтальной частей, недопустимые отбрасываются, остальные упорядочиваются
+    по длине ствола в конце профиля, затем по наибольшей интенсивности.
+    directional - словарь колонок параметров направляющей части (H, A, a, a1, R1, ...),
+    horizontal - словарь колонок параметров горизонтальной части (S_l, T1, T2, R1); H, A, a
+    горизонтальной части берутся из направляющей. Колонки - массивы по целям или скаляры.
+    Части профиля не зависят друг от друга, поэтому рассчитывается по одному пакету на вид части
+    (5 + 4 пакета), а сочетания получаются сложением длин с трансляцией.
+    """
+    size = np.broadcast(*(np.atleast_1d(value) for value in directional.values())).shape[0]
+    horizontal = {**horizontal, **{name: directional[name] for name in LANDING if name in directional}}
+
+    d_lengths, d_intensities = np.stack([
+        _part_metrics(profile_cls, directional, size) for profile_cls in directional_types
+    ], axis=-1)
+    h_lengths, h_intensities = np.stack([
+        _part_metrics(profile_cls, horizontal, size) for profile_cls in horizontal_types
+    ], axis=-1)
+
+    # Длины стволов горизонтальной части отсчитываются от конца направляющей части
+    lengths = d_lengths[:, :, None] + h_lengths[:, None, :]
+    intensities = np.fmax(d_intensities[:, :, None], h_intensities[:, None, :])
+    intensities[np.isnan(lengths)] = np.nan
+
+    flat_lengths = lengths.reshape(size, -1)
+    flat_intensities = intensities.reshape(size, -1)
+    # Сортировка по длине, затем по интенсивности; nan (недопустимые) уходят в конец
+    ranking = np.lexsort((flat_intensities, flat_lengths), axis=-1)
+    counts = np.isfinite(flat_lengths).sum(axis=-1)
+
+    return AutoDesignResult(
+        tuple(directional_types), tuple(horizontal_types), lengths, intensities, ranking, counts
+    )
@@ -0,0 +1,232 @@
+import warnings
+
+import numpy as np
+
+from src.core.calculations.profile_arrays import ProfileArray
+from src.core.calculations.validation import Reason, validate_designs
+
+
+# Колонки таблицы участков - совпадают с именами свойств классов профилей
+SEGMENT_FIELDS = (
+    'depths',
+    'lengths_of_the_bores',
+    'lengths_of_the_intervals',
+    'dislocations',
+    'angles',
+    'radii',
+    'intensities'
+)
+
+DEPTH, BORE, INTERVAL, DISLOCATION, ANGLE, RADIUS, INTENSITY = range(len(SEGMENT_FIELDS))
+
+# Допустимое относительное отклонение результатов float32 от float64 при отборе проектов
+FLOAT32_TOLERANCE = 1e-4
+
+
+def segment_table(profile, dtype=None):
+    """
+    Функция для получения таблицы участков профиля.
+    Для профиля со скалярными параметрами возвращается массив формы (k, 7),
+    для профиля, параметры которого - массивы длины n, - массив формы (n, k, 7),
+    где k - количество участков, 7 - колонки SEGMENT_FIELDS.
+    """
+    fields = [[np.asarray(value, dtype=dtype) for value in getattr(profile, name)] for name in SEGMENT_FIELDS]
+    shape = np.broadcast_shapes(*(value.shape for values in fields for value in values))
+
+    return np.stack([
+        np.stack([np.broadcast_to(value, shape) for value in values], axis=-1)
+        for values in fields
+    ], axis=-1)
+
+
+def evaluate(designs, dtype=None):
+    """
+    Функция для векторного расчёта таблиц участков для всех проектов хранилища ProfileArray.
+    Формулы те же, что и у скалярных классов профилей: объект профиля создаётся с колонками
+    хранилища в качестве параметров. Недопустимые значения параметров дают nan/inf в строке.
+    """
+    if dtype is not None and np.dtype(dtype) != designs.dtype:
+        designs = designs.astype(dtype)
+
+    profile = designs.profile_cls(*designs.data)
+    with np.errstate(all='ignore'):
+        return segment_table(profile, designs.dtype)
+
+
+def evaluate_valid(designs, dtype=None):
+    """
+    Функция для расчёта таблиц участков только для проектов, прошедших проверку областей
+    определения (validation.validate): недопустимые строки не рассчитываются, их таблицы - nan.
+    Возвращает таблицы и коды причин по строкам, включая причины по рассчитанным таблицам.
+    """
+    codes = validate_designs(designs)
+    valid = np.flatnonzero(codes == 0)
+    if len(valid) == len(designs):
+        table = evaluate(designs, dtype)
+    else:
+        part = evaluate(designs[valid], dtype)
+        table = np.full((len(designs),) + part.shape[1:], np.nan, dtype=part.dtype)
+        table[valid] = part
+        if not len(valid):
+            return table, codes
+    codes[valid] |= table_reasons(table[valid])
+    return table, codes
+
+
+def segment_count(designs):
+    """
+    Функция для получения числа участков в таблицах проектов хранилища ProfileArray.
+    У классов с переменным числом участков (величина segment_count, например волнообразный
+    профиль) берётся наибольшее по всем проектам, у остальных - число участков первого проекта.
+    """
+    if not len(designs):
+        return 0
+    if hasattr(designs.profile_cls, 'segment_count'):
+        with np.errstate(all='ignore'):
+            return int(designs.profile_cls(*designs.data).segment_count)
+    return evaluate(designs[:1]).shape[-2]
+
+
+def pad_segments(table, count):
+    """
+    Функция для дополнения таблиц участков до count строк участками нулевой длины
+    в конечной точке профиля (форма траектории при этом не меняется).
+    """
+    missing = count - table.shape[-2]
+    if missing <= 0:
+        return table
+    tail = np.repeat(table[..., -1:, :], missing, axis=-2)
+    tail[..., [INTERVAL, RADIUS, INTENSITY]] = 0
+    return np.concatenate([table, tail], axis=-2)
+
+
+def total_lengths(table):
+    """Функция для получения длины ствола в конце профиля по таблицам участков"""
+    return table[..., -1, BORE]
+
+
+def max_intensities(table):
+    """Функция для получения максимальной по модулю интенсивности искривления по таблицам участков"""
+    return np.abs(table[..., INTENSITY]).max(axis=-1)
+
+
+def feasible(table):
+    """Функция для получения маски допустимых проектов: все величины конечны, длины интервалов неотрицательны"""
+    finite = np.isfinite(table).all(axis=(-2, -1))
+    with np.errstate(invalid='ignore'):
+        return finite & (table[..., INTERVAL] >= 0).all(axis=-1)
+
+
+def table_reasons(table):
+    """Функция для получения кодов причин validation.Reason по рассчитанным таблицам участков"""
+    finite = np.isfinite(table).all(axis=(-2, -1))
+    codes = np.where(finite, 0, Reason.NOT_FINITE_RESULT).astype(np.uint16)
+    with np.errstate(invalid='ignore'):
+        codes[finite & (table[..., INTERVAL] < 0).any(axis=-1)] |= np.uint16(Reason.NEGATIVE_INTERVAL)
+    return codes
+
+
+METRICS = {
+    'total_length': total_lengths,
+    'max_intensity': max_intensities
+}
+
+
+def design_map(profile_cls, fixed, x_name, x_values, y_name, y_values, dtype=None):
+    """
+    Функция для расчёта карты проектов по сетке двух параметров: строки - значения y_values
+    параметра y_name, столбцы - значения x_values параметра x_name, остальные параметры
+    берутся из словаря fixed. Возвращает длину ствола в конце профиля формы (len(y), len(x)),
+    недопустимые проекты (см. feasible) получают nan.
+    """
+    x, y = np.meshgrid(np.asarray(x_values), np.asarray(y_values))
+    columns = {**fixed, x_name: x.ravel(), y_name: y.ravel()}
+    designs = ProfileArray.from_columns(profile_cls, dtype or np.float64, **columns)
+    table, _ = evaluate_valid(designs)
+    lengths = np.where(feasible(table), total_lengths(table), np.nan)
+    return lengths.reshape(x.shape)
+
+
+class ScreeningResult:
+    """
+    Класс, описывающий результат отбора лучших проектов.
+    :атрибут indices: номера отобранных проектов в исходном хранилище (по возрастанию метрики);
+    :атрибут tables: таблицы участков отобранных проектов, пересчитанные в float64;
+    :атрибут values: значения метрики отобранных проектов (float64);
+    :атрибут screening_values: значения метрики всех проектов, полученные при отборе;
+    :атрибут rechecked: количество проектов, пересчитанных в float64;
+    :атрибут max_error: наибольшее относительное отклонение float32 от float64 среди пересчитанных;
+    :атрибут codes: коды причин недопустимости всех проектов (validation.Reason, 0 - допустим);
+    """
+
+    __slots__ = ('indices', 'tables', 'values', 'screening_values', 'rechecked', 'max_error', 'codes')
+
+    def __init__(self, indices, tables, values, screening_values, rechecked, max_error, codes):
+        self.indices = indices
+        self.tables = tables
+        self.values = values
+        self.screening_values = screening_values
+        self.rechecked = rechecked
+        self.max_error = max_error
+        self.codes = codes
+
+
+def screen(designs, top=100, metric='total_length', dtype=np.float32, tolerance=FLOAT32_TOLERANCE):
+    """
+    Функция для отбора top лучших (по наименьшему значению метрики) допустимых проектов.
+    Все проекты рассчитываются с пониженной точностью dtype, затем в float64 пересчитываются
+    отобранные и пограничные проекты: значение метрики которых отличается от порогового
+    меньше, чем на tolerance, или допустимость которых под вопросом при той же погрешности.
+    Итоговые значения отобранных проектов совпадают со скалярным расчётом DirectionalProfile
+    с точностью до округления float64. Если фактическое отклонение float32 на пересчитанных
+    проектах превышает tolerance, отбор повторяется полностью в float64.
+    """
+    metric_func = METRICS[metric] if isinstance(metric, str) else metric
+
+    # Проекты вне областей определения параметров не рассчитываются
+    table, codes = evaluate_valid(designs, dtype)
+    values = metric_func(table).astype(np.float64)
+    mask = feasible(table)
+
+    # Проекты, допустимость которых может измениться из-за погрешности пониженной точности
+    with np.errstate(invalid='ignore'):
+        scale = np.abs(table[..., BORE]).max(axis=-1)
+        margin = table[..., INTERVAL].min(axis=-1)
+        borderline = np.isfinite(margin) & (np.abs(margin) <= tolerance * scale)
+
+    candidates = np.flatnonzero(mask)
+    limit = np.inf
+    if len(candidates) > top:
+        threshold = np.partition(values[candidates], top - 1)[top - 1]
+        limit = threshold + tolerance * abs(threshold)
+        candidates = candidates[values[candidates] <= limit]
+    recheck = np.union1d(candidates, np.flatnonzero(borderline & ~(values > limit)))
+
+    exact = evaluate(designs[recheck], np.float64)
+    exact_values = metric_func(exact)
+    exact_mask = feasible(exact)
+
+    both = exact_mask & mask[recheck]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        errors = np.abs(values[recheck][both] - exact_values[both]) / np.abs(exact_values[both])
+    max_error = float(errors.max(initial=0.0))
+
+    if max_error > tolerance and np.dtype(dtype) != np.float64:
+        warnings.warn(
+            f"Отклонение {np.dtype(dtype).name} ({max_error:.2e}) превышает допуск {tolerance:.2e}, "
+            f"отбор выполнен в float64"
+        )
+        return screen(designs, top, metric_func, np.float64, tolerance)
+
+    order = np.argsort(np.where(exact_mask, exact_values, np.inf), kind='stable')
+    order = order[exact_mask[order]][:top]
+
+    return ScreeningResult(
+        indices=recheck[order],
+        tables=exact[order],
+        values=exact_values[order],
+        screening_values=values,
+        rechecked=len(recheck),
+        max_error=max_error,
+        codes=codes
+    )
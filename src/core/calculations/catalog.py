@@ -0,0 +1,247 @@
+import heapq
+
+import numpy as np
+
+from src.core.calculations.horizontal_wells import directional_profiles, horizontal_profiles
+
+
+# Ключи индекса: точка посадки направляющей части и конец горизонтального участка
+KEYS = ('H', 'A', 'a', 'H_h', 'A_h')
+
+# Масштабы ключей при поиске ближайших проектов: 1 градус угла приравнивается к 10 м
+KEY_SCALES = {'H': 1.0, 'A': 1.0, 'a': 10.0, 'H_h': 1.0, 'A_h': 1.0}
+
+DIRECTIONAL_CLASSES = {cls.__name__: cls for cls in directional_profiles.DirectionalProfile.__subclasses__()}
+HORIZONTAL_CLASSES = {cls.__name__: cls for cls in horizontal_profiles.HorizontalProfile.__subclasses__()}
+
+
+class KDTree:
+    """
+    Класс, описывающий статическое k-d дерево над точками формы (n, d), хранящееся в массивах.
+    Каждый узел хранит диапазон [start, stop) в перестановке order и ограничивающий
+    прямоугольник точек; листья просматриваются векторно.
+    Параметры, необходимые для создания объекта:
+    :параметр points: массив точек формы (n, d);
+    :параметр leaf_size: int, наибольшее число точек в листе;
+    """
+
+    __slots__ = ('points', 'order', 'start', 'stop', 'left', 'right', 'lower', 'upper')
+
+    def __init__(self, points, leaf_size=32, nodes=None):
+        self.points = np.asarray(points, dtype=np.float64)
+        if nodes is not None:
+            self.order, self.start, self.stop, self.left, self.right, self.lower, self.upper = nodes
+            return
+
+        n, d = self.points.shape
+        self.order = np.arange(n)
+        start, stop, left, right, lower, upper = [], [], [], [], [], []
+
+        def build(begin, end):
+            node = len(start)
+            subset = self.points[self.order[begin:end]]
+            start.append(begin)
+            stop.append(end)
+            left.append(-1)
+            right.append(-1)
+            lower.append(subset.min(axis=0) if end > begin else np.full(d, np.inf))
+            upper.append(subset.max(axis=0) if end > begin else np.full(d, -np.inf))
+
+            if end - begin > leaf_size:
+                dim = int(np.argmax(upper[node] - lower[node]))
+                middle = (end - begin) // 2
+                part = np.argpartition(subset[:, dim], middle)
+                self.order[begin:end] = self.order[begin:end][part]
+                left[node] = build(begin, begin + middle)
+                right[node] = build(begin + middle, end)
+            return node
+
+        build(0, n)
+        self.start, self.stop = np.array(start), np.array(stop)
+        self.left, self.right = np.array(left), np.array(right)
+        self.lower, self.upper = np.array(lower).reshape(-1, d), np.array(upper).reshape(-1, d)
+
+    @property
+    def nodes(self):
+        return self.order, self.start, self.stop, self.left, self.right, self.lower, self.upper
+
+    def query_range(self, lower, upper):
+        """Метод для поиска индексов точек внутри прямоугольника [lower, upper] (границы - массивы длины d)"""
+        lower, upper = np.asarray(lower, dtype=np.float64), np.asarray(upper, dtype=np.float64)
+        found, stack = [], [0]
+        while stack:
+            node = stack.pop()
+            if (self.upper[node] < lower).any() or (self.lower[node] > upper).any():
+                continue
+            index = self.order[self.start[node]:self.stop[node]]
+            if (self.lower[node] >= lower).all() and (self.upper[node] <= upper).all():
+                found.append(index)
+            elif self.left[node] < 0:
+                points = self.points[index]
+                found.append(index[((points >= lower) & (points <= upper)).all(axis=1)])
+            else:
+                stack.extend((self.left[node], self.right[node]))
+        return np.sort(np.concatenate(found)) if found else np.empty(0, dtype=np.intp)
+
+    def query_nearest(self, point, k=1, weights=None):
+        """
+        Метод для поиска k ближайших точек. weights - веса координат (0 исключает координату).
+        Возвращает массивы расстояний и индексов по возрастанию расстояния.
+        """
+        point = np.asarray(point, dtype=np.float64)
+        weights = np.ones_like(point) if weights is None else np.asarray(weights, dtype=np.float64)
+        point = np.where(weights > 0, point, 0.0)
+
+        best_distances, best_index = np.full(k, np.inf), np.full(k, -1, dtype=np.intp)
+        worst = np.inf  # наибольшее расстояние^2 среди k лучших
+        queue = [(0.0, 0)]
+        while queue:
+            bound, node = heapq.heappop(queue)
+            if bound >= worst:
+                break
+            left = self.left[node]
+            if left < 0:
+                index = self.order[self.start[node]:self.stop[node]]
+                distances = np.concatenate([best_distances, (((self.points[index] - point) * weights) ** 2).sum(axis=1)])
+                index = np.concatenate([best_index, index])
+                keep = np.argpartition(distances, k - 1)[:k]
+                best_distances, best_index = distances[keep], index[keep]
+                worst = best_distances.max()
+                continue
+            children = (left, self.right[node])
+            gaps = np.maximum(self.lower[children, ] - point, 0.0) + np.maximum(point - self.upper[children, ], 0.0)
+            for child, bound in zip(children, (((gaps * weights) ** 2).sum(axis=1)).tolist()):
+                if bound < worst:
+                    heapq.heappush(queue, (bound, child))
+
+        order = np.argsort(best_distances)
+        found = best_index[order] >= 0
+        return np.sqrt(best_distances[order][found]), best_index[order][found]
+
+
+class ProfileCatalog:
+    """
+    Класс, описывающий каталог утверждённых проектов профилей с многомерным индексом
+    по ключам KEYS (H, A, a направляющей части и H_h, A_h конца горизонтального участка).
+    Индекс строится при первом запросе после добавления проектов и сохраняется вместе с каталогом.
+    """
+
+    def __init__(self):
+        self.names = []
+        self.directional_types = []
+        self.horizontal_types = []
+        self.directional_params = np.empty((0, len(directional_profiles.DirectionalProfile._NAMES)))
+        self.horizontal_params = np.empty((0, len(horizontal_profiles.HorizontalProfile._NAMES)))
+        self.keys = np.empty((0, len(KEYS)))
+        self._tree = None
+
+    def __len__(self):
+        return len(self.names)
+
+    def add(self, directional_profile, horizontal_profile, name=''):
+        """Метод для добавления решённого проекта в каталог; возвращает номер записи"""
+        self.add_many([(directional_profile, horizontal_profile, name)])
+        return len(self) - 1
+
+    def add_many(self, designs):
+        """Метод для добавления списка проектов (направляющая часть, горизонтальная часть, имя)"""
+        rows_d, rows_h, keys = [], [], []
+        for directional_profile, horizontal_profile, name in designs:
+            rows_d.append(_params(directional_profile))
+            rows_h.append(_params(horizontal_profile))
+            keys.append([
+                directional_profile.H, directional_profile.A, directional_profile.a,
+                horizontal_profile.H_h, horizontal_profile.A_h
+            ])
+            self.names.append(name)
+            self.directional_types.append(type(directional_profile).__name__)
+            self.horizontal_types.append(type(horizontal_profile).__name__)
+
+        if keys:
+            self.directional_params = np.vstack([self.directional_params, rows_d])
+            self.horizontal_params = np.vstack([self.horizontal_params, rows_h])
+            self.keys = np.vstack([self.keys, np.asarray(keys, dtype=np.float64)])
+            self._tree = None
+
+    def profiles(self, index):
+        """Метод для восстановления объектов профилей записи каталога"""
+        directional_cls = DIRECTIONAL_CLASSES[self.directional_types[index]]
+        horizontal_cls = HORIZONTAL_CLASSES[self.horizontal_types[index]]
+        return (
+            directional_cls(*_values(directional_cls, self.directional_params[index])),
+            horizontal_cls(*_values(horizontal_cls, self.horizontal_params[index]))
+        )
+
+    @property
+    def tree(self):
+        if self._tree is None:
+            self._tree = KDTree(self.keys)
+        return self._tree
+
+    def range(self, **bounds):
+        """
+        Метод для поиска проектов по диапазонам ключей, например
+        catalog.range(H=(2500, 2600), A=(800, None)); None - граница не задана.
+        Возвращает номера записей.
+        """
+        lower, upper = np.full(len(KEYS), -np.inf), np.full(len(KEYS), np.inf)
+        for key, (low, high) in bounds.items():
+            i = KEYS.index(key)
+            lower[i] = -np.inf if low is None else low
+            upper[i] = np.inf if high is None else high
+        if not len(self):
+            return np.empty(0, dtype=np.intp)
+        return self.tree.query_range(lower, upper)
+
+    def nearest(self, k=1, scales=None, **point):
+        """
+        Метод для поиска k ближайших проектов к точке, заданной частью ключей, например
+        catalog.nearest(5, H=2550, A=900, a=88). Расстояние считается по заданным ключам
+        с масштабами scales (по умолчанию KEY_SCALES). Возвращает расстояния и номера записей.
+        """
+        scales = {**KEY_SCALES, **(scales or {})}
+        values = np.array([point.get(key, 0.0) for key in KEYS], dtype=np.float64)
+        weights = np.array([scales[key] if key in point else 0.0 for key in KEYS])
+        if not len(self):
+            return np.empty(0), np.empty(0, dtype=np.intp)
+        return self.tree.query_nearest(values, min(k, len(self)), weights)
+
+    def save(self, path):
+        """Метод для сохранения каталога вместе с индексом (формат .npz)"""
+        tree = self.tree if len(self) else None
+        nodes = tree.nodes if tree is not None else ()
+        np.savez(
+            path,
+            names=np.array(self.names, dtype=str),
+            directional_types=np.array(self.directional_types, dtype=str),
+            horizontal_types=np.array(self.horizontal_types, dtype=str),
+            directional_params=self.directional_params,
+            horizontal_params=self.horizontal_params,
+            keys=self.keys,
+            **{f"tree_{i}": array for i, array in enumerate(nodes)}
+        )
+
+    @classmethod
+    def load(cls, path):
+        """Метод для загрузки каталога; сохранённый индекс используется без перестроения"""
+        catalog = cls()
+        with np.load(path) as data:
+            catalog.names = data['names'].tolist()
+            catalog.directional_types = data['directional_types'].tolist()
+            catalog.horizontal_types = data['horizontal_types'].tolist()
+            catalog.directional_params = data['directional_params']
+            catalog.horizontal_params = data['horizontal_params']
+            catalog.keys = data['keys']
+            if 'tree_0' in data:
+                catalog._tree = KDTree(catalog.keys, nodes=tuple(data[f"tree_{i}"] for i in range(7)))
+        return catalog
+
+
+def _params(profile):
+    """Функция для получения полного набора параметров профиля (nan для неиспользуемых)"""
+    return [getattr(profile, name, np.nan) for name in profile._NAMES]
+
+
+def _values(profile_cls, row):
+    """Функция для выбора из полного набора параметров (порядок _NAMES) значений в порядке _PARAMS"""
+    return [float(row[profile_cls._NAMES.index(name)]) for name in profile_cls._PARAMS]
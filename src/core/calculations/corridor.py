@@ -0,0 +1,182 @@
+import struct
+
+import numpy as np
+
+
+# Заголовок двоичного файла сетки: сигнатура, версия, nx, ny, x0, y0, dx, dy, значение "нет данных"
+GRID_MAGIC = b'DNGRID'
+GRID_VERSION = 1
+GRID_HEADER = struct.Struct('<6sHII5d')
+
+
+class Surface:
+    """
+    Класс, описывающий структурную поверхность (кровлю или подошву пласта), заданную на регулярной сетке.
+    Значения - глубины по вертикали (м, вниз положительно) в узлах сетки; values[j, i] - узел
+    с координатами x = x0 + i * dx, y = y0 + j * dy.
+    Параметры, необходимые для создания объекта:
+    :параметр values: массив формы (ny, nx), может быть np.memmap;
+    :параметр x0, y0: float, координаты первого узла сетки, м;
+    :параметр dx, dy: float, dx > 0, dy > 0, шаг сетки, м;
+    :параметр nodata: float, значение, обозначающее отсутствие данных в узле;
+    """
+
+    __slots__ = ('values', 'x0', 'y0', 'dx', 'dy', 'nodata')
+
+    def __init__(self, values, x0, y0, dx, dy, nodata=-9999.0):
+        self.values = values
+        self.x0, self.y0 = x0, y0
+        self.dx, self.dy = dx, dy
+        self.nodata = nodata
+
+    @classmethod
+    def load(cls, path):
+        """Метод для загрузки поверхности: ESRI ASCII (.asc) или двоичный формат (memory-map)"""
+        if str(path).lower().endswith('.asc'):
+            return cls.load_ascii(path)
+        return cls.load_binary(path)
+
+    @classmethod
+    def load_binary(cls, path):
+        """Метод для отображения двоичной сетки в память без чтения узлов (np.memmap)"""
+        with open(path, 'rb') as file:
+            magic, version, nx, ny, x0, y0, dx, dy, nodata = GRID_HEADER.unpack(file.read(GRID_HEADER.size))
+        if magic != GRID_MAGIC or version != GRID_VERSION:
+            raise ValueError(f"Неподдерживаемый формат сетки: {path}")
+
+        values = np.memmap(path, dtype='<f4', mode='r', offset=GRID_HEADER.size, shape=(ny, nx))
+        return cls(values, x0, y0, dx, dy, nodata)
+
+    @classmethod
+    def load_ascii(cls, path):
+        """
+        Метод для чтения сетки в формате ESRI ASCII Grid (строки записаны с севера на юг).
+        Файл читается построчно в заранее выделенный массив, текст целиком в памяти не хранится.
+        """
+        header = {}
+        with open(path) as file:
+            line = file.readline()
+            while line and line.strip()[:1].isalpha():
+                key, value = line.split()[:2]
+                header[key.lower()] = float(value)
+                line = file.readline()
+
+            nx, ny = int(header['ncols']), int(header['nrows'])
+            values = np.empty(nx * ny, dtype=np.float32)
+            filled = 0
+            while line and filled < len(values):
+                row = np.fromstring(line, dtype=np.float32, sep=' ')[:len(values) - filled]
+                values[filled:filled + len(row)] = row
+                filled += len(row)
+                line = file.readline()
+        if filled < len(values):
+            raise ValueError(f"В файле сетки {path} недостаточно значений: {filled} из {len(values)}")
+
+        cell = header['cellsize']
+        # Координаты в заголовке - угол или центр нижней левой ячейки
+        x0 = header.get('xllcenter', header.get('xllcorner', 0.0) + cell / 2)
+        y0 = header.get('yllcenter', header.get('yllcorner', 0.0) + cell / 2)
+        return cls(values.reshape(ny, nx)[::-1], x0, y0, cell, cell, header.get('nodata_value', -9999.0))
+
+    def save(self, path):
+        """Метод для записи поверхности в двоичный формат, пригодный для отображения в память"""
+        ny, nx = self.values.shape
+        with open(path, 'wb') as file:
+            file.write(GRID_HEADER.pack(GRID_MAGIC, GRID_VERSION, nx, ny, self.x0, self.y0, self.dx, self.dy, self.nodata))
+            np.ascontiguousarray(self.values, dtype='<f4').tofile(file)
+
+    def sample(self, x, y):
+        """
+        Метод для векторной билинейной интерполяции глубины поверхности в точках (x, y).
+        Вне сетки и в ячейках с отсутствующими данными возвращается nan.
+        Читаются только узлы четырёх ячеек вокруг каждой точки.
+        """
+        x, y = np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64)
+        ny, nx = self.values.shape
+
+        u = (x - self.x0) / self.dx
+        v = (y - self.y0) / self.dy
+        inside = (u >= 0) & (u <= nx - 1) & (v >= 0) & (v <= ny - 1)
+
+        i = np.clip(np.floor(u).astype(np.intp), 0, max(nx - 2, 0))
+        j = np.clip(np.floor(v).astype(np.intp), 0, max(ny - 2, 0))
+        fu = np.clip(u - i, 0.0, 1.0)
+        fv = np.clip(v - j, 0.0, 1.0)
+
+        i1, j1 = np.minimum(i + 1, nx - 1), np.minimum(j + 1, ny - 1)
+        corners = [self.values[j, i], self.values[j, i1], self.values[j1, i], self.values[j1, i1]]
+
+        # Значение "нет данных" сравнивается в типе узлов сетки (float32 для файлов сетки)
+        nodata = np.asarray(self.nodata, dtype=self.values.dtype)
+        missing = np.logical_or.reduce([corner == nodata for corner in corners])
+
+        z00, z10, z01, z11 = (corner.astype(np.float64) for corner in corners)
+        z = (z00 * (1 - fu) + z10 * fu) * (1 - fv) + (z01 * (1 - fu) + z11 * fu) * fv
+        return np.where(inside & ~missing, z, np.nan)
+
+
+class CorridorResult:
+    """
+    Класс, описывающий результат проверки нахождения ствола в целевом коридоре.
+    :атрибут md, tvd: длина ствола и глубина по вертикали станций, м;
+    :атрибут top, bottom: глубина кровли и подошвы пласта под станциями, м;
+    :атрибут inside: маска станций внутри коридора;
+    :атрибут exits: список выходов из коридора (начальная длина ствола, конечная длина ствола, сторона);
+    """
+
+    __slots__ = ('md', 'tvd', 'top', 'bottom', 'inside', 'exits')
+
+    def __init__(self, md, tvd, top, bottom, inside, exits):
+        self.md, self.tvd = md, tvd
+        self.top, self.bottom = top, bottom
+        self.inside = inside
+        self.exits = exits
+
+    @property
+    def in_target(self):
+        """Свойство: весь проверенный интервал находится в коридоре"""
+        return not self.exits
+
+    @property
+    def fraction_inside(self):
+        """Свойство для получения доли станций, находящихся в коридоре"""
+        return float(self.inside.mean()) if len(self.inside) else 1.0
+
+
+def map_coordinates(offset, wellhead=(0.0, 0.0), azimuth=0.0):
+    """Функция для пересчёта смещения ствола в плановые координаты по устью и азимуту (град) плоскости профиля"""
+    x0, y0 = wellhead
+    azimuth = np.radians(azimuth)
+    return x0 + offset * np.sin(azimuth), y0 + offset * np.cos(azimuth)
+
+
+def check_corridor(trajectory, top, bottom, md_start=None, md_end=None, step=1.0,
+                   wellhead=(0.0, 0.0), azimuth=0.0, margin_top=0.0, margin_bottom=0.0):
+    """
+    Функция для проверки нахождения ствола между поверхностями кровли top и подошвы bottom
+    на интервале [md_start, md_end] с шагом step. Допуски margin_top и margin_bottom
+    сужают коридор от кровли и подошвы соответственно. Станции, для которых поверхность
+    не определена, считаются вне коридора со стороной 'нет данных'.
+    """
+    md, tvd, offset, _ = trajectory.stations(step, md_start, md_end)
+    x, y = map_coordinates(offset, wellhead, azimuth)
+    top_depth, bottom_depth = top.sample(x, y), bottom.sample(x, y)
+
+    with np.errstate(invalid='ignore'):
+        above = tvd < top_depth + margin_top
+        below = tvd > bottom_depth - margin_bottom
+    missing = np.isnan(top_depth) | np.isnan(bottom_depth)
+    inside = ~(above | below | missing)
+
+    # Код стороны выхода для каждой станции: 0 - в коридоре, 1 - выше, 2 - ниже, 3 - нет данных
+    side = np.select([missing, above, below], [3, 1, 2], 0)
+    changes = np.flatnonzero(np.diff(side)) + 1
+    starts = np.concatenate([[0], changes])
+    stops = np.concatenate([changes, [len(side)]]) - 1
+
+    names = {1: 'выше кровли', 2: 'ниже подошвы', 3: 'нет данных'}
+    exits = [
+        (float(md[begin]), float(md[end]), names[side[begin]])
+        for begin, end in zip(starts, stops) if side[begin]
+    ]
+    return CorridorResult(md, tvd, top_depth, bottom_depth, inside, exits)
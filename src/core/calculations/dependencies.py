@@ -0,0 +1,127 @@
+from collections import defaultdict
+
+
+class Parameter:
+    """
+    Дескриптор входного параметра профиля. Значение хранится в слоте класса,
+    при изменении значения из кэша удаляются все зависящие от параметра величины.
+    """
+
+    __slots__ = ('name', 'slot')
+
+    def __init__(self, name, slot):
+        self.name = name
+        self.slot = slot
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        instance._track(self.name)
+        return self.slot.__get__(instance, owner)
+
+    def __set__(self, instance, value):
+        self.slot.__set__(instance, value)
+        instance._invalidate(self.name)
+
+    def __delete__(self, instance):
+        self.slot.__delete__(instance)
+        instance._invalidate(self.name)
+
+
+class quantity:
+    """
+    Дескриптор вычисляемой величины профиля (замена property с кэшированием).
+    Значение вычисляется при первом обращении и хранится до изменения любого
+    параметра, от которого величина зависит прямо или через другие величины.
+    Зависимости записываются в граф класса автоматически во время вычисления.
+    Величины-списки (значения по участкам) возвращаются кортежами.
+    """
+
+    def __init__(self, func):
+        self.func = func
+        self.name = func.__name__
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        instance._track(self.name)
+
+        values = instance._values
+        if self.name in values:
+            return values[self.name]
+
+        instance._computing.append(self.name)
+        try:
+            value = self.func(instance)
+        finally:
+            instance._computing.pop()
+        # Списки хранятся кортежами: изменение полученного значения не должно портить кэш
+        if isinstance(value, list):
+            value = tuple(value)
+        values[self.name] = value
+        return value
+
+
+class Reactive:
+    """
+    Базовый класс профиля с явным графом зависимостей между параметрами и величинами.
+    Граф общий для класса: ребро "величина или параметр -> зависящая величина" добавляется,
+    когда при вычислении величины читается другой параметр или другая величина.
+    Изменение параметра делает недействительными только величины, лежащие ниже по графу.
+    """
+
+    __slots__ = ('_values', '_computing')
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._dependents = defaultdict(set)
+        # Слоты параметров, объявленные классом, оборачиваются дескриптором Parameter
+        for name in getattr(cls, '_NAMES', ()):
+            slot = cls.__dict__.get(name)
+            if slot is not None and not isinstance(slot, Parameter):
+                setattr(cls, name, Parameter(name, slot))
+
+    def __init__(self):
+        self._values = {}
+        self._computing = []
+
+    def _track(self, name):
+        """Метод для записи зависимости вычисляемой сейчас величины от name"""
+        computing = self._computing
+        if computing:
+            type(self)._dependents[name].add(computing[-1])
+
+    def _invalidate(self, name):
+        """Метод для удаления из кэша всех величин, зависящих от name"""
+        values = getattr(self, '_values', None)
+        if not values:
+            return
+        graph = type(self)._dependents
+        stack = list(graph.get(name, ()))
+        while stack:
+            dependent = stack.pop()
+            # Величина, которой нет в кэше, не могла быть прочитана кэшированными величинами ниже по графу
+            if dependent in values:
+                del values[dependent]
+                stack.extend(graph.get(dependent, ()))
+
+    def invalidate(self):
+        """Метод для полной очистки кэша величин"""
+        self._values.clear()
+
+    @classmethod
+    def dependency_graph(cls):
+        """Метод для получения графа зависимостей класса: {величина: множество её входов}"""
+        inputs = defaultdict(set)
+        for name, dependents in cls._dependents.items():
+            for dependent in dependents:
+                inputs[dependent].add(name)
+        return dict(inputs)
+
+    def cached(self):
+        """Метод для получения имён величин, значения которых сейчас хранятся в кэше"""
+        return set(self._values)
@@ -0,0 +1,286 @@
+import os
+import time
+
+import numpy as np
+from openpyxl import Workbook
+
+from src.core.calculations.batch import SEGMENT_FIELDS, evaluate_valid
+from src.core.calculations.log_conversion import format_rows
+
+
+# Число строк в одном блоке потоковой записи (ограничивает расход памяти)
+CHUNK_ROWS = 100_000
+
+# Наибольшее число строк на листе XLSX (с учётом строки заголовка)
+XLSX_MAX_ROWS = 1_048_576
+
+STATION_COLUMNS = ('MD', 'TVD', 'VS', 'INC')
+# Колонки таблиц участков export_tables: номер проекта и номер участка записываются целыми числами
+TABLE_COLUMNS = ('DESIGN', 'SEGMENT') + SEGMENT_FIELDS
+TABLE_PRECISION = (0, 0) + (3,) * len(SEGMENT_FIELDS)
+LAS_CURVES = (('DEPT', 'M', 'Длина ствола'), ('TVD', 'M', 'Глубина по вертикали'),
+              ('VS', 'M', 'Смещение'), ('INC', 'DEG', 'Зенитный угол'))
+
+
+class StreamWriter:
+    """
+    Базовый класс потоковой записи таблиц: блоки строк записываются по мере поступления,
+    поэтому расход памяти не зависит от общего числа строк. Ведётся учёт строк и времени.
+    Используется как контекстный менеджер; метод write принимает массив (строки, колонки)
+    и (необязательно) метку - имя скважины, записываемое первой колонкой, если она предусмотрена.
+    """
+
+    def __init__(self):
+        self.rows = 0
+        self.started = time.perf_counter()
+        self.elapsed = 0.0
+
+    def write(self, values, label=None):
+        values = np.asarray(values, dtype=np.float64)
+        if len(values):
+            self.write_block(values, label)
+            self.rows += len(values)
+
+    def write_block(self, values, label):
+        raise NotImplementedError
+
+    def close(self):
+        self.elapsed = time.perf_counter() - self.started
+
+    @property
+    def rows_per_second(self):
+        """Свойство для получения скорости записи, строк/с"""
+        elapsed = self.elapsed or time.perf_counter() - self.started
+        return self.rows / elapsed if elapsed > 0 else 0.0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class CsvWriter(StreamWriter):
+    """
+    Класс потоковой записи в CSV. Блок форматируется одной операцией (format_rows).
+    Параметры, необходимые для создания объекта:
+    :параметр path: путь к файлу;
+    :параметр names: имена числовых колонок;
+    :параметр label: имя колонки метки (например, 'WELL') или None - без колонки метки;
+    :параметр precision: число знаков после запятой для всех колонок или по колонкам (0 - целые);
+    """
+
+    def __init__(self, path, names, label=None, precision=3, delimiter=','):
+        super().__init__()
+        self.file = open(path, 'wb')
+        self.label = label
+        self.precision = precision
+        self.delimiter = delimiter
+        self.file.write((delimiter.join(([label] if label else []) + list(names)) + '\n').encode())
+
+    def write_block(self, values, label):
+        block = format_rows(values, self.precision, self.delimiter)
+        if self.label:
+            # Метка добавляется в начало каждой строки блока без построчного цикла
+            prefix = f"{label}{self.delimiter}".encode()
+            block = prefix + block[:-1].replace(b'\n', b'\n' + prefix) + b'\n'
+        self.file.write(block)
+
+    def close(self):
+        self.file.close()
+        super().close()
+
+
+class XlsxWriter(StreamWriter):
+    """
+    Класс потоковой записи в XLSX в режиме write-only openpyxl: строки сразу сбрасываются
+    во временный файл листа, книга в памяти не накапливается. При заполнении листа
+    (XLSX_MAX_ROWS строк) создаётся следующий лист.
+    Параметры, необходимые для создания объекта:
+    :параметр path: путь к файлу;
+    :параметр names: имена числовых колонок;
+    :параметр label: имя колонки метки или None;
+    :параметр sheet: имя листа (следующие листы получают номер);
+    :параметр precision: None или точность по колонкам (колонки с точностью 0 записываются целыми);
+    """
+
+    def __init__(self, path, names, label=None, sheet='Данные', precision=None):
+        super().__init__()
+        self.path = path
+        self.integers = [] if np.ndim(precision) == 0 else [i for i, digits in enumerate(precision) if digits == 0]
+        self.workbook = Workbook(write_only=True)
+        self.header = ([label] if label else []) + list(names)
+        self.label = label
+        self.sheet_name = sheet
+        self.sheets = 0
+        self.sheet_rows = XLSX_MAX_ROWS
+        self.sheet = None
+
+    def new_sheet(self):
+        self.sheets += 1
+        title = self.sheet_name if self.sheets == 1 else f"{self.sheet_name} {self.sheets}"
+        self.sheet = self.workbook.create_sheet(title)
+        self.sheet.append(self.header)
+        self.sheet_rows = 1
+
+    def write_block(self, values, label):
+        # Отсутствующие значения записываются пустыми ячейками
+        finite = np.isfinite(values)
+        cells = values.astype(object)
+        for column in self.integers:
+            cells[:, column] = np.where(finite[:, column], values[:, column], 0).astype(np.int64).tolist()
+        cells[~finite] = None
+        rows = cells.tolist()
+        start = 0
+        while start < len(rows):
+            if self.sheet_rows >= XLSX_MAX_ROWS:
+                self.new_sheet()
+            stop = min(len(rows), start + XLSX_MAX_ROWS - self.sheet_rows)
+            append = self.sheet.append
+            if self.label:
+                for row in rows[start:stop]:
+                    append([label] + row)
+            else:
+                for row in rows[start:stop]:
+                    append(row)
+            self.sheet_rows += stop - start
+            start = stop
+
+    def close(self):
+        if self.sheet is None:
+            self.new_sheet()
+        self.workbook.save(self.path)
+        super().close()
+
+
+class LasWriter(StreamWriter):
+    """
+    Класс потоковой записи одной скважины в LAS 2.0. Начальная и конечная глубины (STRT, STOP)
+    известны только после записи всех строк, поэтому в заголовке под них резервируются поля
+    фиксированной ширины, которые заполняются при закрытии файла. Имя скважины (WELL), если оно
+    не задано, берётся из метки записываемых блоков; блоки с другой меткой - ошибка (ValueError),
+    так как секция ~A содержит одну скважину с монотонной глубиной.
+    Параметры, необходимые для создания объекта:
+    :параметр path: путь к файлу;
+    :параметр curves: список (мнемоника, единица, описание); первая кривая - глубина;
+    :параметр well: имя скважины;
+    :параметр step: шаг по глубине (0 - переменный);
+    :параметр null: значение "нет данных";
+    """
+
+    FIELD = 20
+    WELL_FIELD = 40
+
+    def __init__(self, path, curves=LAS_CURVES, well='', step=0.0, null=-999.25, precision=4):
+        super().__init__()
+        self.file = open(path, 'wb')
+        self.well = well
+        self.label = None
+        self.null = null
+        self.precision = precision
+        self.first = self.last = None
+
+        unit = curves[0][1]
+        lines = [
+            "~Version information",
+            " VERS.                 2.0 : CWLS LOG ASCII STANDARD - VERSION 2.0",
+            " WRAP.                  NO : ONE LINE PER DEPTH STEP",
+            "~Well information",
+        ]
+        self.file.write(('\n'.join(lines) + '\n').encode('utf-8'))
+        # Позиции зарезервированных полей STRT и STOP
+        self.positions = []
+        for mnemonic in ('STRT', 'STOP'):
+            self.positions.append(self.reserve(f" {mnemonic}.{unit} ", self.FIELD, mnemonic))
+
+        lines = [
+            f" STEP.{unit} {step:{self.FIELD}.4f} : STEP",
+            f" NULL. {null:{self.FIELD}.4f} : NULL VALUE",
+        ]
+        self.file.write(('\n'.join(lines) + '\n').encode('utf-8'))
+        self.well_position = self.reserve(" WELL. ", self.WELL_FIELD, "WELL")
+
+        lines = [
+            "~Curve information",
+            *(f" {name:<8}.{curve_unit:<8} : {description}" for name, curve_unit, description in curves),
+            "~A " + ' '.join(name for name, _, _ in curves),
+        ]
+        self.file.write(('\n'.join(lines) + '\n').encode('utf-8'))
+
+    def reserve(self, prefix, width, description):
+        """Метод для записи строки заголовка с пустым полем width байт; возвращает позицию поля"""
+        position = self.file.tell() + len(prefix.encode('utf-8'))
+        self.file.write(f"{prefix}{' ' * width} : {description}\n".encode('utf-8'))
+        return position
+
+    def write_block(self, values, label):
+        if label is not None:
+            if self.label is None:
+                self.label = label
+            elif label != self.label:
+                raise ValueError(f"Файл LAS содержит одну скважину: '{self.label}', получена '{label}'")
+        if self.first is None:
+            self.first = values[0, 0]
+        self.last = values[-1, 0]
+        values = np.where(np.isfinite(values), values, self.null)
+        self.file.write(format_rows(values, self.precision, ' '))
+
+    def close(self):
+        for position, value in zip(self.positions, (self.first, self.last)):
+            self.file.seek(position)
+            self.file.write(f"{self.null if value is None else value:{self.FIELD}.4f}".encode())
+        # Имя скважины выравнивается вправо в поле (ширина - в байтах); длинное имя обрезается
+        well = str(self.well or self.label or '').encode('utf-8')[:self.WELL_FIELD]
+        well = well.decode('utf-8', 'ignore').encode('utf-8')
+        self.file.seek(self.well_position)
+        self.file.write(well.rjust(self.WELL_FIELD))
+        self.file.close()
+        super().close()
+
+
+def open_writer(path, names, label=None, **kwargs):
+    """Функция для создания потокового писателя по расширению файла (.csv, .xlsx, .las)"""
+    extension = os.path.splitext(str(path))[1].lower()
+    if extension == '.xlsx':
+        return XlsxWriter(path, names, label, **kwargs)
+    if extension == '.las':
+        # Для LAS кривые можно задать явно (curves); по умолчанию - имена колонок без единиц
+        curves = kwargs.pop('curves', [(name, '', name) for name in names])
+        return LasWriter(path, curves, **kwargs)
+    return CsvWriter(path, names, label, **kwargs)
+
+
+def export_stations(writer, wells, step=1.0, chunk=CHUNK_ROWS):
+    """
+    Функция для потоковой записи станций скважин: wells - последовательность (имя, Trajectory).
+    Станции рассчитываются блоками (Trajectory.iter_stations). Возвращает число строк.
+    LAS содержит одну скважину: для нескольких скважин LasWriter вызывает ValueError.
+    """
+    for name, trajectory in wells:
+        for md, tvd, offset, angle in trajectory.iter_stations(step, chunk):
+            writer.write(np.column_stack([md, tvd, offset, angle]), name)
+    return writer.rows
+
+
+def open_table_writer(path, **kwargs):
+    """Функция для создания писателя таблиц участков: колонки TABLE_COLUMNS, номера - целыми числами"""
+    return open_writer(path, TABLE_COLUMNS, precision=TABLE_PRECISION, **kwargs)
+
+
+def export_tables(writer, designs, chunk=CHUNK_ROWS):
+    """
+    Функция для потоковой записи таблиц участков проектов хранилища ProfileArray:
+    проекты рассчитываются блоками по chunk, строка файла - номер проекта, номер участка и
+    колонки SEGMENT_FIELDS (писатель - open_table_writer). Недопустимые проекты
+    (см. batch.evaluate_valid) пропускаются.
+    """
+    for start in range(0, len(designs), chunk):
+        table, codes = evaluate_valid(designs[start:start + chunk])
+        valid = np.flatnonzero(codes == 0)
+        if not len(valid):
+            continue
+        table = table[valid]
+        index = np.broadcast_to((start + valid)[:, None], table.shape[:2])
+        segment = np.broadcast_to(np.arange(table.shape[1]), table.shape[:2])
+        writer.write(np.column_stack([index.ravel(), segment.ravel(), table.reshape(-1, len(SEGMENT_FIELDS))]))
+    return writer.rows
@@ -1,11 +1,16 @@
-from math import *
+from numpy import sin, cos, radians, pi
 from abc import ABC, abstractmethod
 
+from src.core.calculations.dependencies import Reactive, quantity
 
-class DirectionalProfile(ABC):
+
+class DirectionalProfile(Reactive, ABC):
     """Абстрактный класс, описывающий направляющую часть профиля скважины"""
 
     _NAMES = ['H', 'A', 'a', 'a1', 'R1', 'R3', 'a3', 'R4']
+    _PARAMS = () # параметры, необходимые для расчёта конкретного вида профиля
+
+    __slots__ = tuple(_NAMES)
 
     H: float # проектная глубина направляющей части профиля
     A: float # проектное смещение скважины на проектной глубине
@@ -17,7 +22,9 @@ class DirectionalProfile(ABC):
     R4: float # величина радиуса 4-ого участка
 
     def __init__(self, *args):
-        self.__dict__.update(zip(self._NAMES, args))
+        super().__init__()
+        for name, value in zip(self._NAMES, args):
+            setattr(self, name, value)
 
     @property
     @abstractmethod
@@ -89,61 +96,64 @@ class TwoInterval(DirectionalProfile):
     :параметр a: float, 0 <= a <= 90, угол вхождения в пласт (градусы);
     """
 
-    @property
+    _PARAMS = ('H', 'A', 'a')
+    __slots__ = ()
+
+    @quantity
     def R(self):
         return self.A / (1 - cos(radians(self.a)))
 
-    @property
+    @quantity
     def H_v(self):
         return self.H - self.R * sin(radians(self.a))
 
-    @property
+    @quantity
     def L(self):
         return super().L
 
-    @property
+    @quantity
     def radii(self):
         return [
             0.0,
             self.R
         ]
 
-    @property
+    @quantity
     def depths(self):
         return [
             self.H_v,
             self.H
         ]
 
-    @property
+    @quantity
     def lengths_of_the_bores(self):
         return [
             self.H_v,
             self.H_v + (pi * self.R * self.a) / 180
         ]
 
-    @property
+    @quantity
     def lengths_of_the_intervals(self):
         return [
             self.H_v,
             self.lengths_of_the_bores[1] - self.lengths_of_the_bores[0]
         ]
 
-    @property
+    @quantity
     def dislocations(self):
         return [
             0.0,
             self.A
         ]
 
-    @property
+    @quantity
     def angles(self):
         return [
             0.0,
             self.a
         ]
 
-    @property
+    @quantity
     def intensities(self):
         return [
             0.0,
@@ -161,19 +171,22 @@ class ThreeInterval(DirectionalProfile):
     :параметр a1: float, 0 <= a <= 90, начальный зенитный угол;
     """
 
-    @property
+    _PARAMS = ('H', 'A', 'a', 'a1', 'R1')
+    __slots__ = ()
+
+    @quantity
     def R(self):
-        return self.A - ((self.R1 * (1 - cos(radians(self.a1)))) / (cos(radians(self.a1)) - cos(radians(self.a))))
+        return (self.A - self.R1 * (1 - cos(radians(self.a1)))) / (cos(radians(self.a1)) - cos(radians(self.a)))
 
-    @property
+    @quantity
     def H_v(self):
         return self.H - self.R1 * sin(radians(self.a1)) - self.R * abs(sin(radians(self.a)) - sin(radians(self.a1)))
 
-    @property
+    @quantity
     def L(self):
         return super().L
 
-    @property
+    @quantity
     def radii(self):
         return [
             0.0,
@@ -181,7 +194,7 @@ class ThreeInterval(DirectionalProfile):
             self.R
         ]
 
-    @property
+    @quantity
     def depths(self):
         return [
             self.H_v,
@@ -189,7 +202,7 @@ class ThreeInterval(DirectionalProfile):
             self.H
         ]
 
-    @property
+    @quantity
     def lengths_of_the_bores(self):
         return [
             self.H_v,
@@ -197,7 +210,7 @@ class ThreeInterval(DirectionalProfile):
             self.H_v + (pi * (self.R1 * self.a1 + self.R * (self.a - self.a1))) / 180
         ]
 
-    @property
+    @quantity
     def lengths_of_the_intervals(self):
         return [
             self.H_v,
@@ -205,7 +218,7 @@ class ThreeInterval(DirectionalProfile):
             self.lengths_of_the_bores[2] - self.lengths_of_the_bores[1]
         ]
 
-    @property
+    @quantity
     def dislocations(self):
         return [
             0.0,
@@ -213,7 +226,7 @@ class ThreeInterval(DirectionalProfile):
             self.A
         ]
 
-    @property
+    @quantity
     def angles(self):
         return [
             0.0,
@@ -221,7 +234,7 @@ class ThreeInterval(DirectionalProfile):
             self.a
         ]
 
-    @property
+    @quantity
     def intensities(self):
         return [
             0.0,
@@ -242,21 +255,24 @@ class TangentialFourInterval(DirectionalProfile):
     :параметр R3: float, R3 > 0, величина радиуса 3-ого участка;
     """
 
-    @property
+    _PARAMS = ('H', 'A', 'a', 'a1', 'R1', 'R3')
+    __slots__ = ()
+
+    @quantity
     def R(self):
         return super().R
 
-    @property
+    @quantity
     def H_v(self):
         W = sin(radians(self.a)) - sin(radians(self.a1))
         return self.H - self.R1 * sin(radians(self.a1)) - self.R3 * abs(W) - self.L * cos(radians(self.a1))
 
-    @property
+    @quantity
     def L(self):
         V = cos(radians(self.a1)) - cos(radians(self.a))
-        return (self.A - self.R1 * (1 - cos(radians(self.a1))) - self.R3 * abs(V)) / sin(radians(self.a))
+        return (self.A - self.R1 * (1 - cos(radians(self.a1))) - self.R3 * abs(V)) / sin(radians(self.a1))
 
-    @property
+    @quantity
     def radii(self):
         return [
             0.0,
@@ -265,7 +281,7 @@ class TangentialFourInterval(DirectionalProfile):
             self.R3
         ]
 
-    @property
+    @quantity
     def depths(self):
         return [
             self.H_v,
@@ -274,7 +290,7 @@ class TangentialFourInterval(DirectionalProfile):
             self.H
         ]
 
-    @property
+    @quantity
     def lengths_of_the_bores(self):
         return [
             self.H_v,
@@ -283,7 +299,7 @@ class TangentialFourInterval(DirectionalProfile):
             self.H_v + self.L + (pi * (self.R1 * self.a1 + self.R3 * (self.a - self.a1))) / 180
         ]
 
-    @property
+    @quantity
     def lengths_of_the_intervals(self):
         return [
             self.H_v,
@@ -292,7 +308,7 @@ class TangentialFourInterval(DirectionalProfile):
             self.lengths_of_the_bores[3] - self.lengths_of_the_bores[2]
         ]
 
-    @property
+    @quantity
     def dislocations(self):
         return [
             0.0,
@@ -301,7 +317,7 @@ class TangentialFourInterval(DirectionalProfile):
             self.A
         ]
 
-    @property
+    @quantity
     def angles(self):
         return [
             0.0,
@@ -310,7 +326,7 @@ class TangentialFourInterval(DirectionalProfile):
             self.a
         ]
 
-    @property
+    @quantity
     def intensities(self):
         return [
             0.0,
@@ -334,21 +350,24 @@ class TangentialFiveInterval(DirectionalProfile):
     :параметр R4: float, R4 > 0, величина радиуса;
     """
 
-    @property
+    _PARAMS = ('H', 'A', 'a', 'a1', 'R1', 'R3', 'a3', 'R4')
+    __slots__ = ()
+
+    @quantity
     def R(self):
         return super().R
 
-    @property
+    @quantity
     def H_v(self):
         W2, W3 = sin(radians(self.a3)) - sin(radians(self.a1)), sin(radians(self.a)) - sin(radians(self.a3))
         return self.H - self.R1 * sin(radians(self.a1)) - self.R3 * abs(W2)  - self.L * cos(radians(self.a1)) - self.R4 * abs(W3)
 
-    @property
+    @quantity
     def L(self):
         V2, V3 = cos(radians(self.a1)) - cos(radians(self.a3)), cos(radians(self.a3)) - cos(radians(self.a))
         return (self.A - self.R1 * (1 - cos(radians(self.a1))) - self.R3 * abs(V2) - self.R4 * abs(V3)) / sin(radians(self.a1))
 
-    @property
+    @quantity
     def radii(self):
         return [
             0.0,
@@ -358,7 +377,7 @@ class TangentialFiveInterval(DirectionalProfile):
             self.R4
         ]
 
-    @property
+    @quantity
     def depths(self):
         W2 = sin(radians(self.a3)) - sin(radians(self.a1))
         return [
@@ -369,7 +388,7 @@ class TangentialFiveInterval(DirectionalProfile):
             self.H
         ]
 
-    @property
+    @quantity
     def lengths_of_the_bores(self):
         return [
             self.H_v,
@@ -379,7 +398,7 @@ class TangentialFiveInterval(DirectionalProfile):
             self.H_v + self.L + (pi * (self.R1 * self.a1 + self.R3 * (self.a3 - self.a1) + self.R4 * (self.a - self.a3))) / 180,
         ]
 
-    @property
+    @quantity
     def lengths_of_the_intervals(self):
         return [
             self.H_v,
@@ -389,7 +408,7 @@ class TangentialFiveInterval(DirectionalProfile):
             self.lengths_of_the_bores[4] - self.lengths_of_the_bores[3]
         ]
 
-    @property
+    @quantity
     def dislocations(self):
         return [
             0.0,
@@ -399,7 +418,7 @@ class TangentialFiveInterval(DirectionalProfile):
             self.A
         ]
 
-    @property
+    @quantity
     def angles(self):
         return [
             0.0,
@@ -409,7 +428,7 @@ class TangentialFiveInterval(DirectionalProfile):
             self.a
         ]
 
-    @property
+    @quantity
     def intensities(self):
         return [
             0.0,
@@ -433,21 +452,24 @@ class FourInterval(DirectionalProfile):
     :параметр а3: float, 0 <= a3 <= 90, зенитный угол в конце 3-ого участка;
     """
 
-    @property
+    _PARAMS = ('H', 'A', 'a', 'a1', 'R1', 'R3', 'a3')
+    __slots__ = ()
+
+    @quantity
     def R(self):
         V4, V5 = cos(radians(self.a1)) - cos(radians(self.a3)), cos(radians(self.a3)) - cos(radians(self.a))
         return (self.A - self.R1 * (1 - cos(radians(self.a1))) - self.R3 * abs(V4)) / abs(V5)
 
-    @property
+    @quantity
     def H_v(self):
         W4, W5 = sin(radians(self.a3)) - sin(radians(self.a1)), sin(radians(self.a)) - sin(radians(self.a3))
         return self.H - self.R1 * sin(radians(self.a1)) - self.R3 * abs(W4) - self.R * abs(W5)
 
-    @property
+    @quantity
     def L(self):
         return super().L
 
-    @property
+    @quantity
     def radii(self):
         return [
             0.0,
@@ -456,7 +478,7 @@ class FourInterval(DirectionalProfile):
             self.R
         ]
 
-    @property
+    @quantity
     def depths(self):
         W4 = sin(radians(self.a3)) - sin(radians(self.a1))
         return [
@@ -466,7 +488,7 @@ class FourInterval(DirectionalProfile):
             self.H
         ]
 
-    @property
+    @quantity
     def lengths_of_the_bores(self):
         return [
             self.H_v,
@@ -475,7 +497,7 @@ class FourInterval(DirectionalProfile):
             self.H_v + (pi * (self.R1 * self.a1 + self.R3 * (self.a3 - self.a1) + self.R * (self.a - self.a3))) / 180,
         ]
 
-    @property
+    @quantity
     def lengths_of_the_intervals(self):
         return [
             self.H_v,
@@ -484,7 +506,7 @@ class FourInterval(DirectionalProfile):
             self.lengths_of_the_bores[3] - self.lengths_of_the_bores[2]
         ]
 
-    @property
+    @quantity
     def dislocations(self):
         return [
             0.0,
@@ -493,7 +515,7 @@ class FourInterval(DirectionalProfile):
             self.A
         ]
 
-    @property
+    @quantity
     def angles(self):
         return [
             0.0,
@@ -502,7 +524,7 @@ class FourInterval(DirectionalProfile):
             self.a
         ]
 
-    @property
+    @quantity
     def intensities(self):
         return [
             0.0,
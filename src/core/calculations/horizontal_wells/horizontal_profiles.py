@@ -1,13 +1,20 @@
-from math import *
+from numpy import sin, cos, radians, degrees, sqrt, arcsin as asin, arctan as atan, pi
+from numpy import (
+    arccos, arange, asarray, broadcast_to, concatenate, cumsum, diff, errstate, floor,
+    isfinite, moveaxis, nanmax, stack, where, zeros_like
+)
 from abc import ABC, abstractmethod
 
-from numpy.ma.core import arccos
+from src.core.calculations.dependencies import Reactive, quantity
 
 
-class HorizontalProfile(ABC):
+class HorizontalProfile(Reactive, ABC):
     """Абстрактный класс, описывающий горизонтальную часть профиля скважины"""
 
     _NAMES = ['H', 'A', 'a', 'S_l', 'T1', 'T2', 'R1']
+    _PARAMS = () # параметры, необходимые для расчёта конкретного вида профиля
+
+    __slots__ = tuple(_NAMES)
 
     H: float # проектная глубина направляющей части профиля
     A: float # проектное смещение скважины на проектной глубине
@@ -18,7 +25,9 @@ class HorizontalProfile(ABC):
     R1: float # радиус кривизны 1-ого участка волнообразного профиля
 
     def __init__(self, *args):
-        self.__dict__.update(zip(self._NAMES, args))
+        super().__init__()
+        for name, value in zip(self._NAMES, args):
+            setattr(self, name, value)
 
     @property
     @abstractmethod
@@ -98,63 +107,66 @@ class Tangential(HorizontalProfile):
     Класс, описывающий тангенциальный профиль
     """
 
-    @property
+    _PARAMS = ('H', 'A', 'a', 'S_l')
+    __slots__ = ()
+
+    @quantity
     def H_h(self):
         return self.S_l * cos(radians(self.a)) + self.H
 
-    @property
+    @quantity
     def A_h(self):
         return self.S_l * sin(radians(self.a)) + self.A
     
-    @property
+    @quantity
     def L_h(self):
-        return super().L_h
+        return self.S_l
     
-    @property
+    @quantity
     def R_h(self):
         return super().R_h
 
-    @property
+    @quantity
     def a_h(self):
-        return super().a_h
+        return self.a
 
-    @property
+    @quantity
     def depths(self):
         return [
             self.H_h
         ]
 
-    @property
+    @quantity
     def lengths_of_the_bores(self):
         return [
             self.S_l
         ]
 
-    @property
+    @quantity
     def lengths_of_the_intervals(self):
         return [
             self.S_l
         ]
 
-    @property
+    @quantity
     def dislocations(self):
         return [
             self.A_h
         ]
 
-    @property
+    @quantity
     def angles(self):
         return [
-            0.0
+            self.a
         ]
 
-    @property
+    @quantity
     def radii(self):
         return [
             0.0
         ]
 
-    @property
+    @quantity
     def intensities(self):
         return [
             0.0
@@ -165,63 +177,66 @@ class Descending(HorizontalProfile):
     Класс, описывающий нисходящий профиль
     """
 
-    @property
+    _PARAMS = ('H', 'A', 'a', 'S_l', 'T1')
+    __slots__ = ()
+
+    @quantity
     def R_h(self):
         return (self.S_l**2 + self.T1**2) / (2 * self.T1)
 
-    @property
+    @quantity
     def H_h(self):
         return self.S_l * cos(radians(self.a)) + self.T1 * sin(radians(self.a)) + self.H
 
-    @property
+    @quantity
     def A_h(self):
         return self.S_l * sin(radians(self.a)) - self.T1 * cos(radians(self.a)) + self.A
 
-    @property
+    @quantity
     def a_h(self):
         return self.a - degrees(asin(self.S_l / self.R_h))
     
-    @property
+    @quantity
     def L_h(self):
         return -pi / 180 * (self.a_h - self.a) * self.R_h
 
-    @property
+    @quantity
     def depths(self):
         return [
             self.H_h
         ]
 
-    @property
+    @quantity
     def lengths_of_the_bores(self):
         return [
             self.L_h
         ]
 
-    @property
+    @quantity
     def lengths_of_the_intervals(self):
         return [
             self.L_h
         ]
 
-    @property
+    @quantity
     def dislocations(self):
         return [
             self.A_h
         ]
 
-    @property
+    @quantity
     def angles(self):
         return [
             self.a_h
         ]
 
-    @property
+    @quantity
     def radii(self):
         return [
             self.R_h
         ]
 
-    @property
+    @quantity
     def intensities(self):
         return [
             -57.3 /  (self.R_h / 10)
@@ -232,63 +247,66 @@ class Ascending(HorizontalProfile):
     Класс, описывающий восходящий профиль
     """
 
-    @property
+    _PARAMS = ('H', 'A', 'a', 'S_l', 'T1')
+    __slots__ = ()
+
+    @quantity
     def R_h(self):
         return (self.S_l**2 + self.T1**2) / (2 * self.T1)
 
-    @property
+    @quantity
     def H_h(self):
         return self.S_l * cos(radians(self.a)) - self.T1 * sin(radians(self.a)) + self.H
 
-    @property
+    @quantity
     def A_h(self):
         return self.S_l * sin(radians(self.a)) + self.T1 * cos(radians(self.a)) + self.A
 
-    @property
+    @quantity
     def a_h(self):
         return self.a + degrees(asin(self.S_l / self.R_h))
     
-    @property
+    @quantity
     def L_h(self):
         return pi / 180 * (self.a_h - self.a) * self.R_h
 
-    @property
+    @quantity
     def depths(self):
         return [
             self.H_h
         ]
 
-    @property
+    @quantity
     def lengths_of_the_bores(self):
         return [
             self.L_h
         ]
 
-    @property
+    @quantity
     def lengths_of_the_intervals(self):
         return [
             self.L_h
         ]
 
-    @property
+    @quantity
     def dislocations(self):
         return [
             self.A_h
         ]
 
-    @property
+    @quantity
     def angles(self):
         return [
             self.a_h
         ]
 
-    @property
+    @quantity
     def radii(self):
         return [
             self.R_h
         ]
 
-    @property
+    @quantity
     def intensities(self):
         return [
             57.3 /  (self.R_h / 10)
@@ -297,64 +315,151 @@ class Ascending(HorizontalProfile):
 
 class Undulant(HorizontalProfile):
     """
-    Класс, описывающий волнообразный
+    Класс, описывающий волнообразный профиль.
+    Ствол колеблется около оси пласта, направленной под углом a: первая полуволна уводит его
+    на T2 вниз, каждая следующая - между отметками T2 ниже оси и T1 выше оси. Полуволна
+    состоит из двух дуг радиуса R1 (отклонение от оси и возврат к её направлению), поэтому
+    каждая полуволна заканчивается с зенитным углом a. Полуволны добавляются, пока укладываются
+    в протяжённость S_l, остаток проходится прямолинейно вдоль оси.
+    Параметры, необходимые для расчёта свойств объекта:
+    :параметр S_l: float, S_l > 0, протяжённость горизонтального участка по пласту;
+    :параметр T1: float, T1 >= 0, предельное смещение вверх от оси пласта;
+    :параметр T2: float, T2 >= 0, предельное смещение вниз от оси пласта;
+    :параметр R1: float, R1 > 0, радиус дуг волны, 2 * R1 >= T1 + T2;
     """
 
-    @property
+    _PARAMS = ('H', 'A', 'a', 'S_l', 'T1', 'T2', 'R1')
+    __slots__ = ()
+
+    @quantity
+    def theta_0(self):
+        """Угол отклонения ствола от оси пласта (град) в первой полуволне"""
+        return degrees(arccos(1 - self.T2 / (2 * self.R1)))
+
+    @quantity
+    def theta(self):
+        """Угол отклонения ствола от оси пласта (град) в остальных полуволнах"""
+        return degrees(arccos(1 - (self.T1 + self.T2) / (2 * self.R1)))
+
+    @quantity
+    def waves(self):
+        """Количество полуволн, укладывающихся в протяжённость S_l"""
+        first = 2 * self.R1 * sin(radians(self.theta_0))
+        step = 2 * self.R1 * sin(radians(self.theta))
+        with errstate(divide='ignore', invalid='ignore'):
+            rest = where(step > 0, floor((self.S_l - first) / step), 0)
+        return where(first > self.S_l, 0, 1 + rest)
+
+    @quantity
+    def segment_count(self):
+        """Количество строк таблицы участков: две дуги на полуволну и прямолинейный остаток"""
+        waves = asarray(self.waves)
+        return 2 * (int(nanmax(waves)) if isfinite(waves).any() else 0) + 1
+
+    @quantity
+    def wave_table(self):
+        """
+        Таблица концов дуг волны: продольная координата вдоль оси, отклонение от оси (вниз -
+        положительное), угол ствола к оси (вниз - положительный, град) и длина ствола.
+        Дуги всех полуволн рассчитываются одной векторной операцией; при расчёте массива
+        профилей число строк задаётся наибольшим количеством полуволн, у остальных профилей
+        лишние дуги имеют нулевую длину.
+        """
+        count = (self.segment_count - 1) // 2
+        j = arange(count)
+        active = j < _rows(self.waves)
+
+        sign = where(j % 2 == 0, 1.0, -1.0)
+        amplitude = where(j == 0, _rows(self.T2), _rows(self.T1 + self.T2)) * active
+        turn = where(j == 0, _rows(self.theta_0), _rows(self.theta)) * active
+        R1 = _rows(self.R1)
+
+        half = R1 * sin(radians(turn))     # продвижение вдоль оси на одной дуге
+        arc = pi * R1 * turn / 180         # длина ствола одной дуги
+        u_end = cumsum(2 * half, axis=-1)
+        w_end = cumsum(sign * amplitude, axis=-1)
+        md_end = cumsum(2 * arc, axis=-1)
+
+        # Строки дуг чередуются: середина полуволны (отклонение turn), конец полуволны (вдоль оси)
+        u = stack([u_end - half, u_end], axis=-1).reshape(*u_end.shape[:-1], 2 * count)
+        w = stack([w_end - sign * amplitude / 2, w_end], axis=-1).reshape(*w_end.shape[:-1], 2 * count)
+        phi = stack([sign * turn, zeros_like(turn)], axis=-1).reshape(*turn.shape[:-1], 2 * count)
+        md = stack([md_end - arc, md_end], axis=-1).reshape(*md_end.shape[:-1], 2 * count)
+        curvature = stack([-sign * active, sign * active], axis=-1).reshape(*turn.shape[:-1], 2 * count)
+
+        # Прямолинейный остаток вдоль оси до протяжённости S_l следует сразу за последней полуволной
+        # проекта; строки после него (у проектов с меньшим числом полуволн) повторяют конечную точку
+        S_l = _rows(self.S_l)
+        u_last = u[..., -1:] if count else zeros_like(S_l)
+        w_last = w[..., -1:] if count else zeros_like(S_l)
+        md_last = md[..., -1:] if count else zeros_like(S_l)
+        tail = arange(2 * count + 1) >= 2 * _rows(self.waves)
+        u = concatenate([u, u_last], axis=-1)
+        md = concatenate([md, md_last], axis=-1)
+        return (
+            where(tail, S_l, u),
+            concatenate([w, w_last], axis=-1),
+            concatenate([phi, zeros_like(w_last)], axis=-1),
+            where(tail, md_last + S_l - u_last, md),
+            concatenate([curvature, zeros_like(w_last)], axis=-1)
+        )
+
+    @quantity
     def R_h(self):
-        AB = self.R1 * sqrt(2 - cos(radians(self.a)))
-        a = sqrt(AB ** 2 - self.T1 ** 2)
-        fetta = atan(a / self.T1)
-        return (self.S_l - a) / (2 * cos(fetta))
+        return self.R1
 
-    @property
+    @quantity
     def H_h(self):
-        return self.S_l * cos(radians(self.a)) + self.T2 * sin(radians(self.a)) + self.H
+        return self.depths[-1]
 
-    @property
+    @quantity
     def A_h(self):
-        return self.S_l * sin(radians(self.a)) - self.T2 * cos(radians(self.a)) + self.A
+        return self.dislocations[-1]
 
-    @property
+    @quantity
     def a_h(self):
-        return self.a - asin(sqrt(2 * self.R_h * (self.T1 + self.T2) - (self.T1 - self.T2) ** 2) / self.R_h)
+        return self.angles[-1]
 
-    @property
+    @quantity
     def L_h(self):
-        return super().L_h
+        return self.lengths_of_the_bores[-1]
 
-    @property
+    @quantity
     def depths(self):
-        return [
-        ]
+        u, w = self.wave_table[:2]
+        a = radians(_rows(self.a))
+        return list(moveaxis(_rows(self.H) + u * cos(a) + w * sin(a), -1, 0))
 
-    @property
+    @quantity
     def lengths_of_the_bores(self):
-        return [
-        ]
+        return list(moveaxis(self.wave_table[3], -1, 0))
 
-    @property
+    @quantity
     def lengths_of_the_intervals(self):
-        return [
-        ]
+        md = self.wave_table[3]
+        return list(moveaxis(diff(md, axis=-1, prepend=0.0), -1, 0))
 
-    @property
+    @quantity
     def dislocations(self):
-        return [
-        ]
+        u, w = self.wave_table[:2]
+        a = radians(_rows(self.a))
+        return list(moveaxis(_rows(self.A) + u * sin(a) - w * cos(a), -1, 0))
 
-    @property
+    @quantity
     def angles(self):
-        return [
-        ]
+        return list(moveaxis(_rows(self.a) - self.wave_table[2], -1, 0))
 
-    @property
+    @quantity
     def radii(self):
-        return [
-            self.R_h
-        ]
+        curvature = self.wave_table[4]
+        return list(moveaxis(abs(curvature) * _rows(self.R1), -1, 0))
 
-    @property
+    @quantity
     def intensities(self):
-        return [
-        ]
\ No newline at end of file
+        curvature = self.wave_table[4]
+        return list(moveaxis(curvature * 57.3 / (_rows(self.R1) / 10), -1, 0))
+
+
+def _rows(value):
+    """Функция для приведения параметра (числа или массива проектов) к форме (..., 1) для расчёта по строкам волны"""
+    return asarray(value)[..., None]
@@ -0,0 +1 @@
+from .inclined_profiles import TangentialThreeInterval, TangentialFourInterval, JShaped, SShaped
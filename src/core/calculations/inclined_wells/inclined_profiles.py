@@ -0,0 +1,506 @@
+from numpy import sin, cos, radians, degrees, sqrt, arccos as acos, arctan2 as atan2, pi
+from abc import ABC, abstractmethod
+
+from src.core.calculations.dependencies import Reactive, quantity
+
+
+class InclinedProfile(Reactive, ABC):
+    """
+    Абстрактный класс, описывающий профиль наклонно направленной скважины.
+    Профиль проходит через проектную точку (H, A) и продолжается с постоянным
+    зенитным углом до конечной глубины H1. Параметры передаются в порядке _PARAMS
+    (в том же порядке, что и поля ввода окна наклонной скважины).
+    """
+
+    _NAMES = ['H', 'A', 'H1', 'L_v', 'R2', 'a1', 'R3', 'R4']
+    _PARAMS = () # параметры, необходимые для расчёта конкретного вида профиля
+
+    __slots__ = tuple(_NAMES)
+
+    H: float # проектная глубина профиля (глубина цели)
+    A: float # проектное смещение скважины на проектной глубине
+    H1: float # конечная глубина профиля
+    L_v: float # длина вертикального участка
+    R2: float # величина радиуса 2-ого участка (набор зенитного угла)
+    a1: float # величина зенитного угла, задаваемая для участка стабилизации или в конце профиля
+    R3: float # величина радиуса 3-его участка
+    R4: float # величина радиуса 4-ого участка
+
+    def __init__(self, *args):
+        super().__init__()
+        for name, value in zip(self._PARAMS, args):
+            setattr(self, name, value)
+
+    @property
+    @abstractmethod
+    def a(self):
+        """Абстрактное свойство для расчёта зенитного угла на проектной глубине"""
+        raise NotImplementedError
+
+    @property
+    @abstractmethod
+    def L(self):
+        """Абстрактное свойство для расчёта длины участка стабилизации"""
+        raise NotImplementedError
+
+    @quantity
+    def L_end(self):
+        """Длина ствола участка от проектной до конечной глубины"""
+        return (self.H1 - self.H) / cos(radians(self.a))
+
+    @quantity
+    def A_end(self):
+        """Смещение на конечной глубине"""
+        return self.A + self.L_end * sin(radians(self.a))
+
+    @property
+    @abstractmethod
+    def radii(self):
+        """Абстрактное свойство для получения массива радиусов"""
+        raise NotImplementedError
+
+    @property
+    @abstractmethod
+    def depths(self):
+        """Абстрактное свойство для расчёта глубин по участкам"""
+        raise NotImplementedError
+
+    @property
+    @abstractmethod
+    def lengths_of_the_bores(self):
+        """Абстрактное свойство для расчёта длин стволов по участкам"""
+        raise NotImplementedError
+
+    @property
+    @abstractmethod
+    def lengths_of_the_intervals(self):
+        """Абстрактное свойство для расчёта длин участков"""
+        raise NotImplementedError
+
+    @property
+    @abstractmethod
+    def dislocations(self):
+        """Абстрактное свойства для расчёта смещения по участкам"""
+        raise NotImplementedError
+
+    @property
+    @abstractmethod
+    def angles(self):
+        """Абстрактное свойство для расчёта зенитных углов по участкам"""
+        raise NotImplementedError
+
+    @property
+    @abstractmethod
+    def intensities(self):
+        """Абстрактное свойство для расчёта интенсивности искривления участков"""
+        raise NotImplementedError
+
+
+class TangentialThreeInterval(InclinedProfile):
+    """
+    Класс, описывающий тангенциальный трёхинтервальный профиль: вертикальный участок,
+    набор зенитного угла радиусом R2 и участок стабилизации до проектной точки.
+    Параметры, необходимые для расчёта свойств объекта:
+    :параметр H: float, H > 0, проектная глубина профиля;
+    :параметр A: float, A > 0, проектное смещение скважины на проектной глубине;
+    :параметр H1: float, H1 >= H, конечная глубина профиля;
+    :параметр L_v: float, 0 <= L_v < H, длина вертикального участка;
+    :параметр R2: float, R2 > 0, величина радиуса 2-ого участка;
+    """
+
+    _PARAMS = ('H', 'A', 'H1', 'L_v', 'R2')
+    __slots__ = ()
+
+    @quantity
+    def L(self):
+        # Участок стабилизации - касательная из проектной точки к окружности набора угла
+        return sqrt((self.A - self.R2) ** 2 + (self.H - self.L_v) ** 2 - self.R2 ** 2)
+
+    @quantity
+    def a(self):
+        return degrees(atan2(self.H - self.L_v, self.R2 - self.A) - atan2(self.L, self.R2))
+
+    @quantity
+    def radii(self):
+        return [
+            0.0,
+            self.R2,
+            0.0,
+            0.0
+        ]
+
+    @quantity
+    def depths(self):
+        return [
+            self.L_v,
+            self.L_v + self.R2 * sin(radians(self.a)),
+            self.H,
+            self.H1
+        ]
+
+    @quantity
+    def lengths_of_the_bores(self):
+        return [
+            self.L_v,
+            self.L_v + (pi * self.R2 * self.a) / 180,
+            self.L_v + self.L + (pi * self.R2 * self.a) / 180,
+            self.L_v + self.L + self.L_end + (pi * self.R2 * self.a) / 180
+        ]
+
+    @quantity
+    def lengths_of_the_intervals(self):
+        return [
+            self.L_v,
+            self.lengths_of_the_bores[1] - self.lengths_of_the_bores[0],
+            self.lengths_of_the_bores[2] - self.lengths_of_the_bores[1],
+            self.lengths_of_the_bores[3] - self.lengths_of_the_bores[2]
+        ]
+
+    @quantity
+    def dislocations(self):
+        return [
+            0.0,
+            self.R2 * (1 - cos(radians(self.a))),
+            self.A,
+            self.A_end
+        ]
+
+    @quantity
+    def angles(self):
+        return [
+            0.0,
+            self.a,
+            self.a,
+            self.a
+        ]
+
+    @quantity
+    def intensities(self):
+        return [
+            0.0,
+            57.3 / (self.R2 / 10),
+            0.0,
+            0.0
+        ]
+
+
+class TangentialFourInterval(InclinedProfile):
+    """
+    Класс, описывающий тангенциальный четырёхинтервальный профиль: вертикальный участок,
+    набор зенитного угла радиусом R2, участок стабилизации и снижение зенитного угла
+    радиусом R3 до величины a1 в проектной точке.
+    Параметры, необходимые для расчёта свойств объекта:
+    :параметр H: float, H > 0, проектная глубина профиля;
+    :параметр A: float, A > 0, проектное смещение скважины на проектной глубине;
+    :параметр H1: float, H1 >= H, конечная глубина профиля;
+    :параметр L_v: float, 0 <= L_v < H, длина вертикального участка;
+    :параметр R2: float, R2 > 0, величина радиуса 2-ого участка;
+    :параметр a1: float, 0 <= a1 < 90, зенитный угол на проектной глубине;
+    :параметр R3: float, R3 > 0, величина радиуса 3-его участка;
+    """
+
+    _PARAMS = ('H', 'A', 'H1', 'L_v', 'R2', 'a1', 'R3')
+    __slots__ = ()
+
+    @quantity
+    def a(self):
+        return self.a1
+
+    @quantity
+    def L(self):
+        # Набор и снижение угла сводятся к касательной к окружности радиуса R2 + R3
+        X = self.A - self.R2 - self.R3 * cos(radians(self.a1))
+        Z = self.H - self.L_v + self.R3 * sin(radians(self.a1))
+        return sqrt(X ** 2 + Z ** 2 - (self.R2 + self.R3) ** 2)
+
+    @quantity
+    def a2(self):
+        """Зенитный угол участка стабилизации"""
+        X = self.A - self.R2 - self.R3 * cos(radians(self.a1))
+        Z = self.H - self.L_v + self.R3 * sin(radians(self.a1))
+        return degrees(atan2(Z, -X) - atan2(self.L, self.R2 + self.R3))
+
+    @quantity
+    def radii(self):
+        return [
+            0.0,
+            self.R2,
+            0.0,
+            self.R3,
+            0.0
+        ]
+
+    @quantity
+    def depths(self):
+        return [
+            self.L_v,
+            self.L_v + self.R2 * sin(radians(self.a2)),
+            self.L_v + self.R2 * sin(radians(self.a2)) + self.L * cos(radians(self.a2)),
+            self.H,
+            self.H1
+        ]
+
+    @quantity
+    def lengths_of_the_bores(self):
+        return [
+            self.L_v,
+            self.L_v + (pi * self.R2 * self.a2) / 180,
+            self.L_v + self.L + (pi * self.R2 * self.a2) / 180,
+            self.L_v + self.L + (pi * (self.R2 * self.a2 + self.R3 * (self.a2 - self.a1))) / 180,
+            self.L_v + self.L + self.L_end + (pi * (self.R2 * self.a2 + self.R3 * (self.a2 - self.a1))) / 180
+        ]
+
+    @quantity
+    def lengths_of_the_intervals(self):
+        return [
+            self.L_v,
+            self.lengths_of_the_bores[1] - self.lengths_of_the_bores[0],
+            self.lengths_of_the_bores[2] - self.lengths_of_the_bores[1],
+            self.lengths_of_the_bores[3] - self.lengths_of_the_bores[2],
+            self.lengths_of_the_bores[4] - self.lengths_of_the_bores[3]
+        ]
+
+    @quantity
+    def dislocations(self):
+        return [
+            0.0,
+            self.R2 * (1 - cos(radians(self.a2))),
+            self.R2 * (1 - cos(radians(self.a2))) + self.L * sin(radians(self.a2)),
+            self.A,
+            self.A_end
+        ]
+
+    @quantity
+    def angles(self):
+        return [
+            0.0,
+            self.a2,
+            self.a2,
+            self.a1,
+            self.a1
+        ]
+
+    @quantity
+    def intensities(self):
+        return [
+            0.0,
+            57.3 / (self.R2 / 10),
+            0.0,
+            -57.3 / (self.R3 / 10),
+            0.0
+        ]
+
+
+class JShaped(InclinedProfile):
+    """
+    Класс, описывающий J-образный профиль: вертикальный участок, набор зенитного угла
+    радиусом R2 до a1, участок стабилизации и дальнейший набор угла радиусом R4
+    до проектной точки.
+    Параметры, необходимые для расчёта свойств объекта:
+    :параметр H: float, H > 0, проектная глубина профиля;
+    :параметр A: float, A > 0, проектное смещение скважины на проектной глубине;
+    :параметр H1: float, H1 >= H, конечная глубина профиля;
+    :параметр L_v: float, 0 <= L_v < H, длина вертикального участка;
+    :параметр R2: float, R2 > 0, величина радиуса 2-ого участка;
+    :параметр a1: float, 0 < a1 < 90, зенитный угол участка стабилизации;
+    :параметр R4: float, R4 > 0, величина радиуса 4-ого участка;
+    """
+
+    _PARAMS = ('H', 'A', 'H1', 'L_v', 'R2', 'a1', 'R4')
+    __slots__ = ()
+
+    @quantity
+    def X(self):
+        """Смещение проектной точки относительно конца набора угла, приведённое к центру дуги R4"""
+        return self.A - self.R2 * (1 - cos(radians(self.a1))) - self.R4 * cos(radians(self.a1))
+
+    @quantity
+    def Z(self):
+        """Глубина проектной точки относительно конца набора угла, приведённая к центру дуги R4"""
+        return self.H - self.L_v - self.R2 * sin(radians(self.a1)) + self.R4 * sin(radians(self.a1))
+
+    @quantity
+    def a(self):
+        W = self.Z * sin(radians(self.a1)) - self.X * cos(radians(self.a1))
+        return self.a1 + degrees(acos(W / self.R4))
+
+    @quantity
+    def L(self):
+        return self.X * sin(radians(self.a1)) + self.Z * cos(radians(self.a1)) - self.R4 * sin(radians(self.a - self.a1))
+
+    @quantity
+    def radii(self):
+        return [
+            0.0,
+            self.R2,
+            0.0,
+            self.R4,
+            0.0
+        ]
+
+    @quantity
+    def depths(self):
+        return [
+            self.L_v,
+            self.L_v + self.R2 * sin(radians(self.a1)),
+            self.L_v + self.R2 * sin(radians(self.a1)) + self.L * cos(radians(self.a1)),
+            self.H,
+            self.H1
+        ]
+
+    @quantity
+    def lengths_of_the_bores(self):
+        return [
+            self.L_v,
+            self.L_v + (pi * self.R2 * self.a1) / 180,
+            self.L_v + self.L + (pi * self.R2 * self.a1) / 180,
+            self.L_v + self.L + (pi * (self.R2 * self.a1 + self.R4 * (self.a - self.a1))) / 180,
+            self.L_v + self.L + self.L_end + (pi * (self.R2 * self.a1 + self.R4 * (self.a - self.a1))) / 180
+        ]
+
+    @quantity
+    def lengths_of_the_intervals(self):
+        return [
+            self.L_v,
+            self.lengths_of_the_bores[1] - self.lengths_of_the_bores[0],
+            self.lengths_of_the_bores[2] - self.lengths_of_the_bores[1],
+            self.lengths_of_the_bores[3] - self.lengths_of_the_bores[2],
+            self.lengths_of_the_bores[4] - self.lengths_of_the_bores[3]
+        ]
+
+    @quantity
+    def dislocations(self):
+        return [
+            0.0,
+            self.R2 * (1 - cos(radians(self.a1))),
+            self.R2 * (1 - cos(radians(self.a1))) + self.L * sin(radians(self.a1)),
+            self.A,
+            self.A_end
+        ]
+
+    @quantity
+    def angles(self):
+        return [
+            0.0,
+            self.a1,
+            self.a1,
+            self.a,
+            self.a
+        ]
+
+    @quantity
+    def intensities(self):
+        return [
+            0.0,
+            57.3 / (self.R2 / 10),
+            0.0,
+            57.3 / (self.R4 / 10),
+            0.0
+        ]
+
+
+class SShaped(InclinedProfile):
+    """
+    Класс, описывающий S-образный профиль: вертикальный участок, набор зенитного угла
+    радиусом R2 до a1, участок стабилизации и снижение угла радиусом R4 до проектной точки.
+    Параметры, необходимые для расчёта свойств объекта:
+    :параметр H: float, H > 0, проектная глубина профиля;
+    :параметр A: float, A > 0, проектное смещение скважины на проектной глубине;
+    :параметр H1: float, H1 >= H, конечная глубина профиля;
+    :параметр L_v: float, 0 <= L_v < H, длина вертикального участка;
+    :параметр R2: float, R2 > 0, величина радиуса 2-ого участка;
+    :параметр a1: float, 0 < a1 < 90, зенитный угол участка стабилизации;
+    :параметр R4: float, R4 > 0, величина радиуса 4-ого участка;
+    """
+
+    _PARAMS = ('H', 'A', 'H1', 'L_v', 'R2', 'a1', 'R4')
+    __slots__ = ()
+
+    @quantity
+    def X(self):
+        """Смещение проектной точки относительно конца набора угла, приведённое к центру дуги R4"""
+        return self.A - self.R2 * (1 - cos(radians(self.a1))) + self.R4 * cos(radians(self.a1))
+
+    @quantity
+    def Z(self):
+        """Глубина проектной точки относительно конца набора угла, приведённая к центру дуги R4"""
+        return self.H - self.L_v - self.R2 * sin(radians(self.a1)) - self.R4 * sin(radians(self.a1))
+
+    @quantity
+    def a(self):
+        W = self.X * cos(radians(self.a1)) - self.Z * sin(radians(self.a1))
+        return self.a1 - degrees(acos(W / self.R4))
+
+    @quantity
+    def L(self):
+        return self.X * sin(radians(self.a1)) + self.Z * cos(radians(self.a1)) - self.R4 * sin(radians(self.a1 - self.a))
+
+    @quantity
+    def radii(self):
+        return [
+            0.0,
+            self.R2,
+            0.0,
+            self.R4,
+            0.0
+        ]
+
+    @quantity
+    def depths(self):
+        return [
+            self.L_v,
+            self.L_v + self.R2 * sin(radians(self.a1)),
+            self.L_v + self.R2 * sin(radians(self.a1)) + self.L * cos(radians(self.a1)),
+            self.H,
+            self.H1
+        ]
+
+    @quantity
+    def lengths_of_the_bores(self):
+        return [
+            self.L_v,
+            self.L_v + (pi * self.R2 * self.a1) / 180,
+            self.L_v + self.L + (pi * self.R2 * self.a1) / 180,
+            self.L_v + self.L + (pi * (self.R2 * self.a1 + self.R4 * (self.a1 - self.a))) / 180,
+            self.L_v + self.L + self.L_end + (pi * (self.R2 * self.a1 + self.R4 * (self.a1 - self.a))) / 180
+        ]
+
+    @quantity
+    def lengths_of_the_intervals(self):
+        return [
+            self.L_v,
+            self.lengths_of_the_bores[1] - self.lengths_of_the_bores[0],
+            self.lengths_of_the_bores[2] - self.lengths_of_the_bores[1],
+            self.lengths_of_the_bores[3] - self.lengths_of_the_bores[2],
+            self.lengths_of_the_bores[4] - self.lengths_of_the_bores[3]
+        ]
+
+    @quantity
+    def dislocations(self):
+        return [
+            0.0,
+            self.R2 * (1 - cos(radians(self.a1))),
+            self.R2 * (1 - cos(radians(self.a1))) + self.L * sin(radians(self.a1)),
+            self.A,
+            self.A_end
+        ]
+
+    @quantity
+    def angles(self):
+        return [
+            0.0,
+            self.a1,
+            self.a1,
+            self.a,
+            self.a
+        ]
+
+    @quantity
+    def intensities(self):
+        return [
+            0.0,
+            57.3 / (self.R2 / 10),
+            0.0,
+            -57.3 / (self.R4 / 10),
+            0.0
+        ]
@@ -0,0 +1,100 @@
+import numpy as np
+
+
+class PrefixIntegral:
+    """
+    Класс, описывающий интеграл величины по длине ствола на основе префиксных сумм.
+    После построения за O(n) интеграл по любому интервалу [md1, md2] вычисляется за O(1)
+    при равномерном шаге станций (индекс участка - деление на шаг) и за O(log n) иначе.
+    Запросы векторные: md1 и md2 могут быть массивами любой формы.
+    Параметры, необходимые для создания объекта:
+    :параметр md: массив длин ствола в узлах (по возрастанию), м;
+    :параметр values: значения в узлах (длина n, линейная интерполяция между узлами) или
+                      на участках (длина n - 1, постоянное значение на участке);
+                      вторая размерность (n, m) - несколько величин сразу;
+    """
+
+    __slots__ = ('md', 'base', 'slopes', 'prefix', 'step')
+
+    def __init__(self, md, values):
+        self.md = np.asarray(md, dtype=np.float64)
+        values = np.asarray(values, dtype=np.float64)
+        lengths = np.diff(self.md)
+        h = np.reshape(lengths, (-1,) + (1,) * (values.ndim - 1))
+
+        if len(values) == len(self.md) - 1:
+            self.base = values
+            self.slopes = np.zeros_like(values)
+        elif len(values) == len(self.md):
+            self.base = values[:-1]
+            with np.errstate(divide='ignore', invalid='ignore'):
+                self.slopes = np.where(h > 0, np.diff(values, axis=0) / h, 0.0)
+        else:
+            raise ValueError("Количество значений должно совпадать с числом узлов или участков")
+
+        increments = self.base * h + self.slopes * h ** 2 / 2
+        self.prefix = np.concatenate([np.zeros((1, *values.shape[1:])), np.cumsum(increments, axis=0)])
+
+        # Станции Trajectory.stations идут с постоянным шагом, последний участок может быть короче
+        self.step = None
+        if len(lengths) > 1 and lengths[0] > 0 and np.allclose(lengths[:-1], lengths[0], rtol=1e-9, atol=0):
+            if lengths[-1] <= lengths[0] * (1 + 1e-9):
+                self.step = lengths[0]
+
+    @property
+    def total(self):
+        """Свойство для получения интеграла по всей длине"""
+        return self.prefix[-1]
+
+    def locate(self, md):
+        """Метод для поиска номеров участков, содержащих md"""
+        if self.step is not None:
+            index = ((md - self.md[0]) / self.step).astype(np.intp)
+        else:
+            index = np.searchsorted(self.md, md, side='right') - 1
+        return np.clip(index, 0, len(self.md) - 2)
+
+    def cumulative(self, md):
+        """Метод для расчёта интеграла от начала до md (за пределами узлов значение постоянно)"""
+        md = np.clip(np.asarray(md, dtype=np.float64), self.md[0], self.md[-1])
+        index = self.locate(md)
+        s = np.reshape(md - self.md[index], md.shape + (1,) * (self.base.ndim - 1))
+        return self.prefix[index] + self.base[index] * s + self.slopes[index] * s ** 2 / 2
+
+    def integral(self, md1, md2):
+        """Метод для расчёта интеграла по интервалам [md1, md2]"""
+        return self.cumulative(md2) - self.cumulative(md1)
+
+    def mean(self, md1, md2):
+        """Метод для расчёта среднего значения величины на интервалах [md1, md2]"""
+        md1, md2 = np.asarray(md1, dtype=np.float64), np.asarray(md2, dtype=np.float64)
+        length = md2 - md1
+        length = np.reshape(length, length.shape + (1,) * (self.base.ndim - 1))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return self.integral(md1, md2) / length
+
+
+def cross_section_area(diameter, inner_diameter=0.0):
+    """Функция для расчёта площади сечения (кольцевого при inner_diameter > 0), м^2 при диаметрах в м"""
+    return np.pi / 4 * (np.asarray(diameter, dtype=np.float64) ** 2 - np.asarray(inner_diameter, dtype=np.float64) ** 2)
+
+
+def dogleg_integral(trajectory):
+    """
+    Функция для построения интеграла интенсивности искривления по траектории.
+    Участки траектории - дуги постоянной кривизны, поэтому интенсивность на участке
+    постоянна и интеграл по интервалу равен суммарному изменению зенитного угла (град).
+    """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rates = np.abs(np.diff(trajectory.angle)) / np.diff(trajectory.md)
+    return PrefixIntegral(trajectory.md, np.where(np.isfinite(rates), rates, 0.0))
+
+
+def vertical_integral(trajectory, step=1.0):
+    """
+    Функция для построения интеграла cos(зенитного угла) по станциям траектории с шагом step.
+    Интеграл по интервалу - приращение глубины по вертикали; умноженный на погонный вес
+    колонны - вес колонны на интервале в жидкости без учёта трения.
+    """
+    md, _, _, angle = trajectory.stations(step)
+    return PrefixIntegral(md, np.cos(np.radians(angle)))
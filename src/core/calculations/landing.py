@@ -0,0 +1,106 @@
+import numpy as np
+
+from src.core.calculations.batch import evaluate_valid
+from src.core.calculations.profile_arrays import ProfileArray
+
+
+# Наибольшее число уточнений протяжённости для профилей, у которых отклонение конца от оси
+# зависит от протяжённости (волнообразный профиль: конец ниже или выше оси по числу полуволн)
+MAX_ITERATIONS = 8
+
+
+class LandingResult:
+    """
+    Класс, описывающий результат совместного расчёта направляющей и горизонтальной частей.
+    :атрибут a: зенитный угол в точке посадки (начало горизонтального участка), град;
+    :атрибут S_l: протяжённость горизонтального участка по пласту, м;
+    :атрибут directional, horizontal: хранилища ProfileArray проектов обеих частей;
+    :атрибут directional_tables, horizontal_tables: таблицы участков (nan для недопустимых строк);
+    :атрибут codes: коды причин недопустимости validation.Reason по строкам (0 - допустим);
+    """
+
+    __slots__ = ('a', 'S_l', 'directional', 'horizontal', 'directional_tables', 'horizontal_tables', 'codes')
+
+    def __init__(self, a, S_l, directional, horizontal, directional_tables, horizontal_tables, codes):
+        self.a = a
+        self.S_l = S_l
+        self.directional = directional
+        self.horizontal = horizontal
+        self.directional_tables = directional_tables
+        self.horizontal_tables = horizontal_tables
+        self.codes = codes
+
+    def __len__(self):
+        return len(self.a)
+
+    def profiles(self, index):
+        """Метод для получения объектов обеих частей профиля для строки index"""
+        return self.directional.profile(index), self.horizontal.profile(index)
+
+
+def lateral_offsets(horizontal_cls, S_l, **params):
+    """
+    Функция для расчёта отклонения конца горизонтального участка от оси пласта (вниз - положительное)
+    при протяжённости S_l. Вдоль оси конец участка всегда отстоит на S_l, поэтому отклонение
+    получается расчётом профиля с горизонтальной осью (a = 90 град) из начала координат.
+    """
+    columns = {**params, 'H': 0.0, 'A': 0.0, 'a': 90.0, 'S_l': S_l}
+    profile = horizontal_cls(*(np.asarray(columns[name], dtype=np.float64) for name in horizontal_cls._PARAMS))
+    with np.errstate(all='ignore'):
+        return np.broadcast_to(profile.H_h, np.shape(S_l)).astype(np.float64)
+
+
+def solve_lateral(start, end, horizontal_cls, **params):
+    """
+    Функция для векторного расчёта зенитного угла в точке посадки a и протяжённости S_l
+    по началу start = (H, A) и концу end горизонтального участка.
+    Конец участка - поворот на угол a локального смещения (S_l вдоль оси, w поперёк),
+    поэтому длина хорды D = sqrt(S_l^2 + w^2), а угол хорды отличается от a на atan(w / S_l).
+    Для профилей с постоянным w (тангенциальный, нисходящий, восходящий) решение точное,
+    для волнообразного протяжённость уточняется, пока не перестанет меняться сторона конца волны.
+    """
+    H_s, A_s = (np.asarray(value, dtype=np.float64) for value in start)
+    H_e, A_e = (np.asarray(value, dtype=np.float64) for value in end)
+    dH, dA = np.broadcast_arrays(H_e - H_s, A_e - A_s)
+    chord = np.hypot(dH, dA)
+
+    with np.errstate(invalid='ignore'):
+        S_l = chord.copy()
+        for _ in range(MAX_ITERATIONS):
+            w = lateral_offsets(horizontal_cls, S_l, **params)
+            updated = np.sqrt(chord ** 2 - w ** 2)
+            if np.array_equal(updated, S_l, equal_nan=True):
+                break
+            S_l = updated
+
+        # Строки, для которых сторона конца волны при найденной протяжённости не совпала с принятой
+        w = lateral_offsets(horizontal_cls, S_l, **params)
+        S_l = np.where(np.isclose(S_l ** 2 + w ** 2, chord ** 2), S_l, np.nan)
+        a = np.degrees(np.arctan2(dA, dH) + np.arctan2(w, S_l))
+    return a, S_l
+
+
+def solve_landing(start, end, directional_cls, horizontal_cls, directional_params=None, horizontal_params=None):
+    """
+    Функция для совместного расчёта направляющей и горизонтальной частей по началу start = (H, A)
+    и концу end горизонтального участка. Зенитный угол посадки и протяжённость находятся по
+    геометрии горизонтального участка (solve_lateral), после чего направляющая часть строится
+    в точку start с найденным углом, так что обе части сопрягаются по положению и углу.
+    directional_params, horizontal_params - словари остальных параметров частей (a1, R1, ...;
+    T1, T2, R1); значения - скаляры или массивы по скважинам.
+    """
+    directional_params = directional_params or {}
+    horizontal_params = horizontal_params or {}
+    a, S_l = solve_lateral(start, end, horizontal_cls, **horizontal_params)
+    H, A = (np.broadcast_to(value, a.shape) for value in start)
+
+    landing = {'H': H, 'A': A, 'a': a}
+    directional = ProfileArray.from_columns(directional_cls, **{**directional_params, **landing})
+    horizontal = ProfileArray.from_columns(horizontal_cls, **{**horizontal_params, **landing, 'S_l': S_l})
+
+    directional_tables, directional_codes = evaluate_valid(directional)
+    horizontal_tables, horizontal_codes = evaluate_valid(horizontal)
+    return LandingResult(
+        a, S_l, directional, horizontal, directional_tables, horizontal_tables,
+        directional_codes | horizontal_codes
+    )
@@ -0,0 +1,193 @@
+import mmap
+import os
+import re
+
+import numpy as np
+
+
+# Размер блока файла, разбираемого за один шаг (ограничивает расход памяти при конвертации)
+CHUNK_BYTES = 4 * 1024 * 1024
+
+
+class LogHeader:
+    """
+    Класс, описывающий заголовок каротажного файла.
+    :атрибут curves: список мнемоник кривых (первая, как правило, - глубина по стволу);
+    :атрибут units: список единиц измерения кривых;
+    :атрибут null: значение, обозначающее отсутствие данных;
+    :атрибут lines: строки заголовка LAS до секции ~A (для переноса в выходной файл);
+    :атрибут data_offset: смещение начала данных в файле, байт;
+    :атрибут delimiter: разделитель значений (b' ' для LAS, b',' для CSV);
+    """
+
+    __slots__ = ('curves', 'units', 'null', 'lines', 'data_offset', 'delimiter')
+
+    def __init__(self, curves, units, null, lines, data_offset, delimiter):
+        self.curves, self.units = curves, units
+        self.null = null
+        self.lines = lines
+        self.data_offset = data_offset
+        self.delimiter = delimiter
+
+
+def read_header(path):
+    """Функция для чтения заголовка каротажного файла в формате LAS 2.0 или CSV (по расширению)"""
+    with open(path, 'rb') as file:
+        if not str(path).lower().endswith('.las'):
+            line = file.readline()
+            curves = [name.strip() for name in line.decode().strip().split(',')]
+            return LogHeader(curves, [''] * len(curves), None, [], file.tell(), b',')
+
+        curves, units, lines = [], [], []
+        null, section, wrapped = None, '', False
+        while True:
+            line = file.readline()
+            if not line:
+                raise ValueError(f"В файле {path} нет секции данных ~A")
+            text = line.decode('utf-8', 'surrogateescape').rstrip('\r\n')
+            if text.startswith('~'):
+                section = text[1:2].upper()
+                if section == 'A':
+                    break
+            elif text.strip() and not text.lstrip().startswith('#'):
+                mnemonic, _, rest = text.partition('.')
+                unit = rest.split(None, 1)[0] if rest[:1].strip() else ''
+                value = rest.split(':', 1)[0][len(unit):].strip()
+                if section == 'W' and mnemonic.strip().upper() == 'NULL':
+                    null = float(value)
+                if section == 'V' and mnemonic.strip().upper() == 'WRAP':
+                    wrapped = value.upper().startswith('Y')
+                if section == 'C':
+                    curves.append(mnemonic.strip())
+                    units.append(unit)
+            lines.append(text)
+
+        if wrapped:
+            raise ValueError("Файлы LAS в режиме WRAP не поддерживаются")
+        return LogHeader(curves, units, null, lines, file.tell(), b' ')
+
+
+# Пустое поле CSV (в начале, в середине или в конце строки) - отсутствующее значение
+EMPTY_FIELD = re.compile(rb'(^|,)[ \t]*(?=,|$)', re.MULTILINE)
+
+# Значение "нет данных" для выходного файла, если во входном оно не задано
+DEFAULT_NULL = -999.25
+
+
+def read_log_lines(path, header=None, chunk_bytes=CHUNK_BYTES):
+    """
+    Генератор блоков строк данных каротажного файла (без пустых строк, в исходном виде).
+    Файл отображается в память, за один шаг берётся не более chunk_bytes байт,
+    поэтому расход памяти не зависит от размера файла.
+    """
+    header = header or read_header(path)
+    if os.path.getsize(path) <= header.data_offset:
+        return
+
+    with open(path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        start, size = header.data_offset, len(data)
+        while start < size:
+            stop = min(start + chunk_bytes, size)
+            if stop < size:
+                # Блок заканчивается на границе строки
+                stop = data.rfind(b'\n', start, stop) + 1 or data.find(b'\n', stop) + 1 or size
+
+            lines = [line for line in data[start:stop].replace(b'\r', b'').split(b'\n') if line.strip()]
+            start = stop
+            if lines:
+                yield lines
+
+
+def parse_lines(lines, header):
+    """
+    Функция для разбора блока строк данных в массив формы (строки, кривые).
+    Пустые поля CSV и значения, равные NULL заголовка, заменяются на nan.
+    """
+    columns = len(header.curves)
+    block = b'\n'.join(lines)
+    if header.delimiter != b' ':
+        block = EMPTY_FIELD.sub(rb'\1nan', block).replace(b'\n', header.delimiter)
+    values = np.fromstring(block, dtype=np.float64, sep=header.delimiter.decode())
+
+    if len(values) != len(lines) * columns:
+        raise ValueError(f"Число значений в блоке не совпадает с числом кривых ({columns}) в строках")
+    values = values.reshape(-1, columns)
+    if header.null is not None:
+        values[values == header.null] = np.nan
+    return values
+
+
+def read_log_chunks(path, header=None, chunk_bytes=CHUNK_BYTES):
+    """Генератор блоков данных каротажного файла в виде массивов формы (строки, кривые)"""
+    header = header or read_header(path)
+    for lines in read_log_lines(path, header, chunk_bytes):
+        yield parse_lines(lines, header)
+
+
+def write_header(file, header, extra_curves):
+    """Функция для записи заголовка выходного файла с добавленными в конец секции ~C кривыми"""
+    curves = header.curves + [name for name, _, _ in extra_curves]
+    if header.delimiter != b' ':
+        file.write((','.join(curves) + '\n').encode())
+        return
+
+    extra = [f"{name:<8}.{unit:<8} : {description}" for name, unit, description in extra_curves]
+    lines, section = [], ''
+    for line in header.lines:
+        if line.startswith('~'):
+            if section == 'C':
+                lines.extend(extra)
+            section = line[1:2].upper()
+        lines.append(line)
+    if section == 'C':
+        lines.extend(extra)
+
+    lines.append('~A ' + ' '.join(curves))
+    file.write(('\n'.join(lines) + '\n').encode('utf-8', 'surrogateescape'))
+
+
+def format_rows(values, precision=4, delimiter=' '):
+    """
+    Функция для форматирования блока значений в строки файла одной операцией форматирования.
+    precision - число знаков после запятой для всех колонок или по колонкам (0 - целые числа).
+    """
+    precisions = [precision] * values.shape[1] if np.ndim(precision) == 0 else precision
+    row = delimiter.join(f'%.{digits}f' for digits in precisions) + '\n'
+    return ((row * len(values)) % tuple(values.ravel().tolist())).encode()
+
+
+def convert_log(source, target, trajectory, md_curve=0, chunk_bytes=CHUNK_BYTES, precision=4):
+    """
+    Функция для потоковой конвертации каротажа, записанного по длине ствола (MD),
+    с добавлением глубины по вертикали (TVD) и смещения (VS) по траектории trajectory.
+    Исходные кривые переносятся в выходной файл без изменения текста, форматируются
+    только добавленные кривые. Положение каждого отсчёта определяется векторным поиском
+    по узлам траектории, отсчёты за пределами траектории получают значение NULL
+    входного файла (DEFAULT_NULL, если оно не задано).
+    Возвращает число обработанных отсчётов.
+    """
+    header = read_header(source)
+    if isinstance(md_curve, str):
+        md_curve = header.curves.index(md_curve)
+
+    extra_curves = [('TVD', 'M', 'Глубина по вертикали'), ('VS', 'M', 'Смещение')]
+    null = header.null if header.null is not None else DEFAULT_NULL
+    delimiter = header.delimiter.decode()
+    rows = 0
+
+    with open(target, 'wb') as file:
+        write_header(file, header, extra_curves)
+        for lines in read_log_lines(source, header, chunk_bytes):
+            md = parse_lines(lines, header)[:, md_curve]
+            tvd, offset, _ = trajectory.position_at(md)
+            outside = ~((md >= trajectory.md[0]) & (md <= trajectory.md[-1]))
+            tvd[outside] = offset[outside] = np.nan
+
+            extra = np.column_stack([tvd, offset])
+            extra[np.isnan(extra)] = null
+            extra_lines = format_rows(extra, precision, delimiter).split(b'\n')
+            separator = header.delimiter
+            file.write(b''.join(line + separator + added + b'\n' for line, added in zip(lines, extra_lines)))
+            rows += len(lines)
+
+    return rows
@@ -0,0 +1,173 @@
+import numpy as np
+
+from src.core.calculations.batch import evaluate, feasible, total_lengths, max_intensities
+from src.core.calculations.profile_arrays import ProfileArray
+
+
+# Стоимость недопустимой пары "слот - цель" при решении задачи о назначениях
+INFEASIBLE_COST = 1e12
+
+
+def solve_assignment(cost):
+    """
+    Функция для решения задачи о назначениях (венгерский алгоритм с потенциалами, O(n^2 m)).
+    cost - матрица стоимостей формы (n, m). Возвращает массив cols длины n, где cols[i] -
+    колонка, назначенная строке i (при n > m часть строк получает -1).
+    Внутренний цикл по колонкам векторизован.
+    """
+    cost = np.asarray(cost, dtype=np.float64)
+    transposed = cost.shape[0] > cost.shape[1]
+    if transposed:
+        cost = cost.T
+    n, m = cost.shape
+
+    u, v = np.zeros(n + 1), np.zeros(m + 1)
+    p = np.zeros(m + 1, dtype=np.intp)    # p[j] - строка (с 1), назначенная колонке j
+    way = np.zeros(m + 1, dtype=np.intp)
+
+    for i in range(1, n + 1):
+        p[0] = i
+        j0 = 0
+        minv = np.full(m + 1, np.inf)
+        used = np.zeros(m + 1, dtype=bool)
+        while True:
+            used[j0] = True
+            i0 = p[j0]
+            free = ~used[1:]
+
+            current = cost[i0 - 1] - u[i0] - v[1:]
+            better = free & (current < minv[1:])
+            minv[1:][better] = current[better]
+            way[1:][better] = j0
+
+            candidates = np.where(free, minv[1:], np.inf)
+            j1 = int(np.argmin(candidates)) + 1
+            delta = candidates[j1 - 1]
+
+            u[p[used]] += delta
+            v[used] -= delta
+            minv[1:][free] -= delta
+
+            j0 = j1
+            if p[j0] == 0:
+                break
+
+        while j0:
+            j1 = way[j0]
+            p[j0] = p[j1]
+            j0 = j1
+
+    rows = np.full(n, -1, dtype=np.intp)
+    assigned = np.flatnonzero(p[1:])
+    rows[p[1:][assigned] - 1] = assigned
+
+    if not transposed:
+        return rows
+
+    cols = np.full(m, -1, dtype=np.intp)
+    cols[rows] = np.arange(n)
+    return cols
+
+
+class PadAssignment:
+    """
+    Класс, описывающий результат распределения целей по слотам куста.
+    :атрибут targets: targets[i] - номер цели, назначенной слоту i (-1 - слот не используется);
+    :атрибут profiles: profiles[i] - номер вида профиля (в списке templates) для слота i;
+    :атрибут lengths: длина ствола по слоту (nan для неиспользуемых слотов), м;
+    :атрибут intensities: максимальная интенсивность искривления по слоту, град/10м;
+    :атрибут cost: полная стоимость назначения;
+    :атрибут feasible: все назначенные пары допустимы;
+    """
+
+    __slots__ = ('targets', 'profiles', 'lengths', 'intensities', 'cost', 'feasible')
+
+    def __init__(self, targets, profiles, lengths, intensities, cost, feasible):
+        self.targets = targets
+        self.profiles = profiles
+        self.lengths = lengths
+        self.intensities = intensities
+        self.cost = cost
+        self.feasible = feasible
+
+
+def pair_costs(slots, targets, templates, max_intensity=None, intensity_weight=0.0):
+    """
+    Функция для построения матрицы стоимостей "слот x цель" по векторному расчёту профилей.
+    slots - массив (n, 2) плановых координат слотов; targets - массив (m, 4): плановые координаты,
+    глубина по вертикали и угол вхождения в пласт a; templates - список пар (класс профиля,
+    словарь фиксированных параметров, например {'a1': 20, 'R1': 500}).
+    Для каждой пары выбирается вид профиля с наименьшей стоимостью: длина ствола плюс
+    intensity_weight на единицу максимальной интенсивности. Недопустимые пары и пары
+    с интенсивностью выше max_intensity получают стоимость INFEASIBLE_COST.
+    Возвращает матрицы стоимости, номера видов профилей, длин стволов и интенсивностей.
+    """
+    slots, targets = np.asarray(slots, dtype=np.float64), np.asarray(targets, dtype=np.float64)
+    n, m = len(slots), len(targets)
+
+    # Все пары в одной колонке: строка k соответствует слоту k // m и цели k % m
+    dx = targets[None, :, 0] - slots[:, None, 0]
+    dy = targets[None, :, 1] - slots[:, None, 1]
+    columns = {
+        'H': np.broadcast_to(targets[None, :, 2], (n, m)).ravel(),
+        'A': np.hypot(dx, dy).ravel(),
+        'a': np.broadcast_to(targets[None, :, 3], (n, m)).ravel()
+    }
+
+    best = np.full(n * m, np.inf)
+    choice = np.full(n * m, -1, dtype=np.intp)
+    lengths = np.full(n * m, np.nan)
+    intensities = np.full(n * m, np.nan)
+
+    for index, (profile_cls, params) in enumerate(templates):
+        designs = ProfileArray.from_columns(profile_cls, **columns, **params)
+        table = evaluate(designs)
+        length, intensity = total_lengths(table), max_intensities(table)
+
+        mask = feasible(table)
+        if max_intensity is not None:
+            mask &= intensity <= max_intensity
+        cost = np.where(mask, length + intensity_weight * intensity, np.inf)
+
+        better = cost < best
+        best[better] = cost[better]
+        choice[better] = index
+        lengths[better] = length[better]
+        intensities[better] = intensity[better]
+
+    best[~np.isfinite(best)] = INFEASIBLE_COST
+    shape = (n, m)
+    return best.reshape(shape), choice.reshape(shape), lengths.reshape(shape), intensities.reshape(shape)
+
+
+def assign_targets(slots, targets, templates, max_intensity=None, intensity_weight=0.0):
+    """
+    Функция для оптимального распределения целей по слотам куста, минимизирующего
+    суммарную стоимость (см. pair_costs). Число слотов должно быть не меньше числа целей.
+    """
+    if len(slots) < len(targets):
+        raise ValueError("Число слотов меньше числа целей")
+
+    cost, choice, lengths, intensities = pair_costs(slots, targets, templates, max_intensity, intensity_weight)
+    assigned = solve_assignment(cost)
+
+    used = assigned >= 0
+    slot_index = np.flatnonzero(used)
+    target_index = assigned[used]
+
+    profiles = np.full(len(slots), -1, dtype=np.intp)
+    slot_lengths = np.full(len(slots), np.nan)
+    slot_intensities = np.full(len(slots), np.nan)
+    profiles[used] = choice[slot_index, target_index]
+    slot_lengths[used] = lengths[slot_index, target_index]
+    slot_intensities[used] = intensities[slot_index, target_index]
+
+    total = cost[slot_index, target_index]
+    return PadAssignment(
+        targets=assigned,
+        profiles=profiles,
+        lengths=slot_lengths,
+        intensities=slot_intensities,
+        cost=float(total.sum()),
+        feasible=bool((total < INFEASIBLE_COST).all())
+    )
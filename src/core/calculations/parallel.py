@@ -0,0 +1,114 @@
+import os
+import sys
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from src.core.calculations.batch import SEGMENT_FIELDS, evaluate, pad_segments, segment_count
+from src.core.calculations.profile_arrays import ProfileArray
+
+
+# Описание массива в разделяемой памяти - единственное, что передаётся между процессами
+SharedArrayDescriptor = namedtuple('SharedArrayDescriptor', ['name', 'shape', 'dtype'])
+
+
+class SharedArray:
+    """
+    Класс, описывающий массив numpy, размещённый в блоке multiprocessing.shared_memory.
+    Создатель массива (owner=True) удаляет блок при закрытии, остальные процессы только отключаются.
+    """
+
+    __slots__ = ('shm', 'array', 'owner')
+
+    def __init__(self, shape, dtype, name=None):
+        dtype = np.dtype(dtype)
+        self.owner = name is None
+        if self.owner:
+            size = max(int(np.prod(shape)) * dtype.itemsize, 1)
+            self.shm = shared_memory.SharedMemory(create=True, size=size)
+        else:
+            self.shm = _attach(name)
+        self.array = np.ndarray(shape, dtype=dtype, buffer=self.shm.buf)
+
+    @classmethod
+    def from_descriptor(cls, descriptor):
+        """Метод для подключения к существующему блоку по его описанию"""
+        return cls(descriptor.shape, descriptor.dtype, descriptor.name)
+
+    @property
+    def descriptor(self):
+        return SharedArrayDescriptor(self.shm.name, self.array.shape, self.array.dtype.str)
+
+    def close(self):
+        """Метод для отключения от блока (и его удаления, если массив создан этим процессом)"""
+        self.array = None
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _attach(name):
+    """Функция для подключения к блоку разделяемой памяти, созданному другим процессом"""
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    # Рабочие процессы пула используют трекер ресурсов родителя, повторная регистрация блока безвредна
+    return shared_memory.SharedMemory(name=name)
+
+
+def _evaluate_chunk(profile_cls, params, table, start, stop):
+    """Функция, выполняемая в рабочем процессе: расчёт строк [start, stop) с записью результата на месте"""
+    params = SharedArray.from_descriptor(params)
+    table = SharedArray.from_descriptor(table)
+    try:
+        designs = ProfileArray.__new__(ProfileArray)
+        designs.profile_cls = profile_cls
+        designs.data = params.array[:, start:stop]
+        table.array[start:stop] = pad_segments(evaluate(designs), table.array.shape[1])
+    finally:
+        params.close()
+        table.close()
+    return stop - start
+
+
+def evaluate_parallel(designs, processes=None, chunk_size=100_000, dtype=None):
+    """
+    Функция для расчёта таблиц участков хранилища ProfileArray в пуле процессов.
+    Колонки параметров и выходная таблица размещаются в разделяемой памяти: рабочие процессы
+    пишут результат на месте, между процессами передаются только описания блоков и границы строк.
+    Возвращает SharedArray с таблицей формы (n, k, 7); после использования его нужно закрыть
+    (close или with), иначе блок разделяемой памяти не будет освобождён.
+    """
+    dtype = np.dtype(designs.dtype if dtype is None else dtype)
+    size = len(designs)
+    segments = segment_count(designs)
+
+    params = SharedArray(designs.data.shape, dtype)
+    params.array[:] = designs.data
+    table = SharedArray((size, segments, len(SEGMENT_FIELDS)), dtype)
+
+    try:
+        bounds = [(start, min(start + chunk_size, size)) for start in range(0, size, chunk_size)]
+        processes = min(processes or os.cpu_count() or 1, max(len(bounds), 1))
+
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            futures = [
+                executor.submit(_evaluate_chunk, designs.profile_cls, params.descriptor, table.descriptor, start, stop)
+                for start, stop in bounds
+            ]
+            for future in futures:
+                future.result()
+    except BaseException:
+        table.close()
+        raise
+    finally:
+        params.close()
+
+    return table
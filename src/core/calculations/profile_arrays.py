@@ -0,0 +1,116 @@
+import numpy as np
+
+
+class ProfileArray:
+    """
+    Класс, описывающий колоночное хранилище множества проектов профилей одного вида.
+    Каждый параметр профиля хранится в отдельном непрерывном массиве, строка хранилища
+    (один проект) представляется видом на эти массивы без копирования данных.
+    Параметры, необходимые для создания объекта:
+    :параметр profile_cls: класс профиля (наследник DirectionalProfile или HorizontalProfile);
+    :параметр size: int, size >= 0, количество проектов;
+    :параметр dtype: тип элементов, np.float64 или np.float32;
+    """
+
+    __slots__ = ('profile_cls', 'data')
+
+    def __init__(self, profile_cls, size, dtype=np.float64):
+        self.profile_cls = profile_cls
+        # Строка массива data - один параметр профиля (колонка хранилища)
+        self.data = np.zeros((len(profile_cls._PARAMS), size), dtype=dtype)
+
+    @classmethod
+    def from_columns(cls, profile_cls, dtype=np.float64, **columns):
+        """Метод для создания хранилища по массивам значений каждого параметра"""
+        missing = [name for name in profile_cls._PARAMS if name not in columns]
+        if missing:
+            raise ValueError(f"Не заданы параметры: {', '.join(missing)}")
+
+        size = np.broadcast(*(np.atleast_1d(columns[name]) for name in profile_cls._PARAMS)).shape[0]
+        array = cls(profile_cls, size, dtype)
+        for i, name in enumerate(profile_cls._PARAMS):
+            array.data[i] = columns[name]
+        return array
+
+    @classmethod
+    def from_rows(cls, profile_cls, rows, dtype=np.float64):
+        """Метод для создания хранилища по списку наборов параметров (по одному на проект)"""
+        rows = np.asarray(rows, dtype=dtype).reshape(-1, len(profile_cls._PARAMS))
+        array = cls(profile_cls, len(rows), dtype)
+        array.data[:] = rows.T
+        return array
+
+    @classmethod
+    def from_profiles(cls, profiles, dtype=np.float64):
+        """Метод для создания хранилища по списку объектов профилей одного вида"""
+        profiles = list(profiles)
+        if not profiles:
+            raise ValueError("Список профилей пуст")
+
+        profile_cls = type(profiles[0])
+        if any(type(profile) is not profile_cls for profile in profiles):
+            raise TypeError("Профили в хранилище должны быть одного вида")
+
+        rows = [[getattr(profile, name) for name in profile_cls._PARAMS] for profile in profiles]
+        return cls.from_rows(profile_cls, rows, dtype)
+
+    @property
+    def names(self):
+        """Свойство для получения имён параметров (колонок) хранилища"""
+        return self.profile_cls._PARAMS
+
+    @property
+    def dtype(self):
+        return self.data.dtype
+
+    @property
+    def nbytes(self):
+        """Свойство для получения объёма памяти, занимаемого значениями параметров"""
+        return self.data.nbytes
+
+    def __len__(self):
+        return self.data.shape[1]
+
+    def __getattr__(self, name):
+        # Доступ к колонке по имени параметра: designs.H, designs.R1 и т.д.
+        if name in type(self).__slots__:
+            raise AttributeError(name)
+        try:
+            return self.data[self.profile_cls._PARAMS.index(name)]
+        except ValueError:
+            raise AttributeError(f"У профиля {self.profile_cls.__name__} нет параметра '{name}'") from None
+
+    def column(self, name):
+        """Метод для получения колонки значений параметра (вид без копирования)"""
+        return getattr(self, name)
+
+    def row(self, index):
+        """Метод для получения значений параметров одного проекта (вид без копирования)"""
+        return self.data[:, index]
+
+    def profile(self, index):
+        """Метод для создания объекта профиля по одной строке хранилища"""
+        return self.profile_cls(*self.data[:, index].tolist())
+
+    def __getitem__(self, key):
+        if isinstance(key, (int, np.integer)):
+            return self.profile(key)
+
+        # Срез, маска или массив индексов - подмножество проектов того же вида
+        subset = ProfileArray.__new__(ProfileArray)
+        subset.profile_cls = self.profile_cls
+        subset.data = self.data[:, key]
+        return subset
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self.profile(index)
+
+    def astype(self, dtype):
+        """Метод для получения копии хранилища с другим типом элементов"""
+        array = ProfileArray(self.profile_cls, len(self), dtype)
+        array.data[:] = self.data
+        return array
+
+    def __repr__(self):
+        return f"ProfileArray({self.profile_cls.__name__}, size={len(self)}, dtype={self.dtype})"
@@ -0,0 +1,89 @@
+import numpy as np
+
+from src.core.calculations.corridor import map_coordinates
+
+
+class FieldProjection:
+    """
+    Класс, описывающий станции нескольких скважин в общей системе координат месторождения.
+    Станции всех скважин хранятся в общих массивах; границы скважин задаются массивом starts.
+    Плановые координаты рассчитываются один раз при построении, поэтому проекция на
+    вертикальную плоскость с любым азимутом - одна векторная операция без пересчёта траекторий.
+    Параметры, необходимые для создания объекта:
+    :параметр names: список имён скважин;
+    :параметр starts: массив номеров первых станций скважин в общих массивах;
+    :параметр md, tvd: длины ствола и глубины по вертикали станций, м;
+    :параметр x, y: плановые координаты станций (восток, север), м;
+    """
+
+    __slots__ = ('names', 'starts', 'md', 'tvd', 'x', 'y')
+
+    def __init__(self, names, starts, md, tvd, x, y):
+        self.names = list(names)
+        self.starts = np.asarray(starts, dtype=np.intp)
+        self.md = np.asarray(md, dtype=np.float64)
+        self.tvd = np.asarray(tvd, dtype=np.float64)
+        self.x = np.asarray(x, dtype=np.float64)
+        self.y = np.asarray(y, dtype=np.float64)
+
+    @classmethod
+    def from_stations(cls, wells):
+        """
+        Метод для построения проекции по станциям скважин.
+        wells - список кортежей (имя, md, tvd, offset, устье (x, y), азимут плоскости профиля, град).
+        """
+        names, md, tvd, offset, heads, azimuths, counts = [], [], [], [], [], [], []
+        for name, well_md, well_tvd, well_offset, wellhead, azimuth in wells:
+            names.append(name)
+            md.append(np.asarray(well_md, dtype=np.float64))
+            tvd.append(np.asarray(well_tvd, dtype=np.float64))
+            offset.append(np.asarray(well_offset, dtype=np.float64))
+            heads.append(wellhead)
+            azimuths.append(azimuth)
+            counts.append(len(md[-1]))
+
+        counts = np.array(counts, dtype=np.intp)
+        heads = np.asarray(heads, dtype=np.float64).reshape(-1, 2)
+        # Устье и азимут размножаются на станции скважины - пересчёт всех скважин одной операцией
+        x, y = map_coordinates(
+            np.concatenate(offset) if offset else np.empty(0),
+            (np.repeat(heads[:, 0], counts), np.repeat(heads[:, 1], counts)),
+            np.repeat(np.asarray(azimuths, dtype=np.float64), counts)
+        )
+        starts = np.concatenate([[0], np.cumsum(counts)[:-1]]).astype(np.intp)
+        return cls(names, starts, np.concatenate(md) if md else np.empty(0),
+                   np.concatenate(tvd) if tvd else np.empty(0), x, y)
+
+    @classmethod
+    def from_trajectories(cls, wells, step=10.0):
+        """
+        Метод для построения проекции по траекториям с шагом станций step.
+        wells - список кортежей (имя, Trajectory, устье (x, y), азимут плоскости профиля, град).
+        """
+        stations = []
+        for name, trajectory, wellhead, azimuth in wells:
+            md, tvd, offset, _ = trajectory.stations(step)
+            stations.append((name, md, tvd, offset, wellhead, azimuth))
+        return cls.from_stations(stations)
+
+    def __len__(self):
+        return len(self.names)
+
+    def split(self, values):
+        """Метод для разбиения массива по станциям на список массивов по скважинам"""
+        return np.split(values, self.starts[1:], axis=-1)
+
+    def plan(self):
+        """Метод для получения плановых координат станций (восток, север)"""
+        return self.x, self.y
+
+    def section(self, azimuth, origin=(0.0, 0.0)):
+        """
+        Метод для проекции станций на вертикальную плоскость с азимутом azimuth (град),
+        проходящую через точку origin. Возвращает смещение вдоль плоскости и глубину по вертикали.
+        azimuth может быть массивом формы (k,): тогда смещение - массив формы (k, n).
+        """
+        azimuth = np.radians(np.asarray(azimuth, dtype=np.float64))
+        x0, y0 = origin
+        offset = np.multiply.outer(np.sin(azimuth), self.x - x0) + np.multiply.outer(np.cos(azimuth), self.y - y0)
+        return offset, self.tvd
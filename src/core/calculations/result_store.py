@@ -0,0 +1,140 @@
+import os
+import struct
+
+import numpy as np
+
+
+# Заголовок файла результатов: сигнатура, версия, число скважин, колонки таблиц участков и станций,
+# число строк участков и станций, смещения (байт) блоков имён, индексов, участков и станций, размер имён
+RESULT_MAGIC = b'DNRSLT'
+RESULT_VERSION = 1
+RESULT_HEADER = struct.Struct('<6sHIIIQQQQQQQ')
+
+# Блоки данных выравниваются по 8 байтам, чтобы массивы float64 отображались без копирования
+ALIGNMENT = 8
+
+
+def _aligned(offset):
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+class ResultStore:
+    """
+    Класс, описывающий файл результатов расчёта множества скважин: таблицы участков и станции.
+    Таблицы всех скважин хранятся подряд в одном массиве '<f8' формы (строки, колонки), границы
+    скважин - в массивах смещений. Файл отображается в память (np.memmap), таблица скважины -
+    вид на отображение без копирования, поэтому открытие файла не зависит от числа скважин.
+    Параметры, необходимые для создания объекта:
+    :параметр names: список имён скважин;
+    :параметр segment_bounds, station_bounds: массивы (n + 1) границ строк скважин;
+    :параметр segments, stations: массивы всех строк таблиц участков и станций;
+    """
+
+    __slots__ = ('names', 'segment_bounds', 'station_bounds', 'segments', 'stations')
+
+    def __init__(self, names, segment_bounds, station_bounds, segments, stations):
+        self.names = names
+        self.segment_bounds = segment_bounds
+        self.station_bounds = station_bounds
+        self.segments = segments
+        self.stations = stations
+
+    @classmethod
+    def open(cls, path):
+        """Метод для отображения файла результатов в память (данные таблиц не читаются)"""
+        data = np.memmap(path, dtype=np.uint8, mode='r')
+        if len(data) < RESULT_HEADER.size:
+            raise ValueError(f"Неподдерживаемый формат результатов: {path}")
+        (magic, version, count, segment_columns, station_columns, segment_rows, station_rows,
+         names_offset, names_size, index_offset, segment_offset, station_offset) = RESULT_HEADER.unpack(
+            data[:RESULT_HEADER.size].tobytes()
+        )
+        if magic != RESULT_MAGIC or version != RESULT_VERSION:
+            raise ValueError(f"Неподдерживаемый формат результатов: {path}")
+
+        names = data[names_offset:names_offset + names_size].tobytes().decode('utf-8')
+        bounds = np.ndarray((2, count + 1), dtype='<i8', buffer=data, offset=index_offset)
+        return cls(
+            names.split('\n') if count else [],
+            bounds[0],
+            bounds[1],
+            np.ndarray((segment_rows, segment_columns), dtype='<f8', buffer=data, offset=segment_offset),
+            np.ndarray((station_rows, station_columns), dtype='<f8', buffer=data, offset=station_offset),
+        )
+
+    def __len__(self):
+        return len(self.names)
+
+    def index(self, name):
+        """Метод для получения номера скважины по имени"""
+        return self.names.index(name)
+
+    def table(self, index):
+        """Метод для получения таблицы участков скважины (вид на файл, без копирования)"""
+        return self.segments[self.segment_bounds[index]:self.segment_bounds[index + 1]]
+
+    def station_table(self, index):
+        """Метод для получения станций скважины (вид на файл, без копирования)"""
+        return self.stations[self.station_bounds[index]:self.station_bounds[index + 1]]
+
+    def wells(self):
+        """Метод для перебора скважин: (имя, таблица участков, станции)"""
+        for index, name in enumerate(self.names):
+            yield name, self.table(index), self.station_table(index)
+
+
+def save_results(path, wells, segment_columns=7, station_columns=5):
+    """
+    Функция для записи результатов в двоичный файл. wells - список (имя, таблица участков (k, 7),
+    станции (m, c) или None). Файл сначала пишется во временный и затем заменяет целевой,
+    поэтому открытые отображения старого файла остаются корректными.
+    Возвращает число записанных скважин.
+    """
+    wells = [
+        (name, np.asarray(table, dtype='<f8').reshape(-1, segment_columns),
+         np.empty((0, station_columns)) if stations is None else np.asarray(stations, dtype='<f8').reshape(-1, station_columns))
+        for name, table, stations in wells
+    ]
+    if any('\n' in name for name, _, _ in wells):
+        raise ValueError("Имя скважины не может содержать перевод строки")
+
+    names = '\n'.join(name for name, _, _ in wells).encode('utf-8')
+    bounds = np.zeros((2, len(wells) + 1), dtype='<i8')
+    bounds[0, 1:] = np.cumsum([len(table) for _, table, _ in wells])
+    bounds[1, 1:] = np.cumsum([len(stations) for _, _, stations in wells])
+
+    names_offset = RESULT_HEADER.size
+    index_offset = _aligned(names_offset + len(names))
+    segment_offset = _aligned(index_offset + bounds.nbytes)
+    station_offset = segment_offset + int(bounds[0, -1]) * segment_columns * 8
+
+    temporary = f"{path}.tmp"
+    with open(temporary, 'wb') as file:
+        file.write(RESULT_HEADER.pack(
+            RESULT_MAGIC, RESULT_VERSION, len(wells), segment_columns, station_columns,
+            int(bounds[0, -1]), int(bounds[1, -1]), names_offset, len(names), index_offset, segment_offset, station_offset
+        ))
+        file.write(names)
+        file.write(bytes(index_offset - names_offset - len(names)))
+        bounds.tofile(file)
+        file.write(bytes(segment_offset - index_offset - bounds.nbytes))
+        for _, table, _ in wells:
+            np.ascontiguousarray(table).tofile(file)
+        for _, _, stations in wells:
+            np.ascontiguousarray(stations).tofile(file)
+    os.replace(temporary, path)
+    return len(wells)
+
+
+def append_results(path, wells):
+    """Функция для добавления скважин в файл результатов (файл создаётся, если его нет)"""
+    existing = []
+    if os.path.exists(path):
+        store = ResultStore.open(path)
+        # Копии: отображение старого файла закрывается до его замены
+        existing = [(name, np.array(table), np.array(stations)) for name, table, stations in store.wells()]
+        columns = store.segments.shape[1], store.stations.shape[1]
+        del store
+    else:
+        columns = 7, 5
+    return save_results(path, existing + list(wells), *columns)
@@ -0,0 +1,138 @@
+import numpy as np
+
+from src.core.calculations.trajectory import Trajectory
+
+
+def pareto_mask(kickoff, added, intensity):
+    """
+    Функция для выделения недоминируемых вариантов: глубина зарезки kickoff - чем больше, тем лучше
+    (больше используется существующий ствол), добавляемая длина added и интенсивность intensity -
+    чем меньше, тем лучше. Интенсивность принимает немного различных значений (по числу радиусов),
+    поэтому проверка идёт по уровням интенсивности: для каждого уровня строится отсортированная по
+    глубине зарезки лестница наименьших длин, и доминирование проверяется бинарным поиском.
+    """
+    kickoff, added, intensity = (np.asarray(value, dtype=np.float64) for value in (kickoff, added, intensity))
+    dominated = np.zeros(len(kickoff), dtype=bool)
+
+    def best_added(pool, query, side):
+        """Наименьшая длина среди вариантов pool с глубиной зарезки >= query (side='left') или > (side='right')"""
+        if not len(pool):
+            return np.full(len(query), np.inf)
+        order = np.argsort(kickoff[pool], kind='stable')
+        sorted_kickoff = kickoff[pool][order]
+        suffix = np.minimum.accumulate(added[pool][order][::-1])[::-1]
+        position = np.searchsorted(sorted_kickoff, query, side=side)
+        return np.append(suffix, np.inf)[position]
+
+    for level in np.unique(intensity):
+        same = np.flatnonzero(intensity == level)
+        lower = np.flatnonzero(intensity < level)
+        query = kickoff[same]
+        dominated[same] = (
+            (best_added(lower, query, 'left') <= added[same])
+            | (best_added(same, query, 'right') <= added[same])
+            | (best_added(same, query, 'left') < added[same])
+        )
+    return ~dominated
+
+
+class SidetrackResult:
+    """
+    Класс, описывающий варианты зарезки бокового ствола: для каждой станции существующего ствола
+    и каждого радиуса - дуга набора или снижения зенитного угла и прямолинейный участок до цели.
+    Массивы вариантов имеют форму (число станций, число радиусов); недопустимые варианты - nan.
+    :атрибут stations: станции существующего ствола (md, tvd, offset, angle);
+    :атрибут radii: радиусы дуги, м;
+    :атрибут turns: изменение зенитного угла на дуге (град, снижение - отрицательное);
+    :атрибут tangents: длина прямолинейного участка до цели, м;
+    :атрибут added: добавляемая длина ствола от точки зарезки до цели, м;
+    :атрибут intensities: интенсивность искривления дуги, град/10м;
+    :атрибут pareto: номера (станция, радиус) недоминируемых вариантов по возрастанию глубины зарезки;
+    """
+
+    __slots__ = ('stations', 'radii', 'turns', 'tangents', 'added', 'intensities', 'pareto')
+
+    def __init__(self, stations, radii, turns, tangents, added, intensities, pareto):
+        self.stations = stations
+        self.radii = radii
+        self.turns = turns
+        self.tangents = tangents
+        self.added = added
+        self.intensities = intensities
+        self.pareto = pareto
+
+    @property
+    def kickoff(self):
+        """Свойство для получения глубин зарезки вариантов Парето (по длине ствола)"""
+        return self.stations[0][self.pareto[0]]
+
+    def trajectory(self, station, radius):
+        """Метод для построения траектории варианта: существующий ствол до зарезки, дуга и участок до цели"""
+        md, tvd, offset, angle = (column[:station + 1] for column in self.stations)
+        R, turn, tangent = self.radii[radius], np.radians(self.turns[station, radius]), self.tangents[station, radius]
+        a0 = np.radians(angle[-1])
+        a1 = a0 + turn
+
+        sign = 1.0 if turn >= 0 else -1.0
+        arc_tvd = tvd[-1] + sign * R * (np.sin(a1) - np.sin(a0))
+        arc_offset = offset[-1] + sign * R * (np.cos(a0) - np.cos(a1))
+        arc_md = md[-1] + R * abs(turn)
+        # Станции существующего ствола (Trajectory.stations, инклинометрия) не совпадают с узлами его
+        # участков, поэтому проверка узлов отключена: дуга и прямолинейный участок строятся точно
+        return Trajectory(
+            np.append(md, [arc_md, arc_md + tangent]),
+            np.append(tvd, [arc_tvd, arc_tvd + tangent * np.cos(a1)]),
+            np.append(offset, [arc_offset, arc_offset + tangent * np.sin(a1)]),
+            np.append(angle, np.degrees([a1, a1])),
+            check=False
+        )
+
+
+def sidetrack_options(stations, target, radii):
+    """
+    Функция для векторного расчёта вариантов зарезки со всех станций существующего ствола.
+    stations - массивы (md, tvd, offset, angle) инклинометрии или плановой траектории (Trajectory.stations);
+    target - цель (глубина по вертикали, смещение) в плоскости профиля; radii - радиусы дуги.
+    С каждой станции рассматриваются дуга набора и дуга снижения зенитного угла с касательной
+    к цели; выбирается вариант с меньшей добавляемой длиной.
+    """
+    md, tvd, offset, angle = (np.asarray(column, dtype=np.float64) for column in stations)
+    radii = np.atleast_1d(np.asarray(radii, dtype=np.float64))
+    H, A = target
+
+    a0 = np.radians(angle)[:, None]
+    R = radii[None, :]
+    best_added = np.full((len(md), len(radii)), np.inf)
+    best_turn = np.full_like(best_added, np.nan)
+    best_tangent = np.full_like(best_added, np.nan)
+
+    with np.errstate(invalid='ignore'):
+        for sign in (1.0, -1.0):
+            # Центр дуги - на нормали к стволу в сторону увеличения (sign = 1) или уменьшения зенитного угла
+            X = A - (offset[:, None] + sign * R * np.cos(a0))
+            Z = H - (tvd[:, None] - sign * R * np.sin(a0))
+            tangent = np.sqrt(X ** 2 + Z ** 2 - R ** 2)
+            if sign > 0:
+                a1 = np.arctan2(Z, -X) - np.arctan2(tangent, R)
+            else:
+                a1 = np.arctan2(-Z, X) + np.arctan2(tangent, R)
+            turn = np.mod(sign * (a1 - a0), 2 * np.pi)
+
+            added = R * turn + tangent
+            valid = np.isfinite(added) & (turn < np.pi)
+            better = valid & (added < best_added)
+            best_added[better] = added[better]
+            best_turn[better] = sign * np.degrees(turn[better])
+            best_tangent[better] = tangent[better]
+
+    best_added[~np.isfinite(best_added)] = np.nan
+    intensities = np.broadcast_to(57.3 / (R / 10), best_added.shape)
+
+    feasible = np.flatnonzero(np.isfinite(best_added).ravel())
+    station_index, radius_index = np.unravel_index(feasible, best_added.shape)
+    mask = pareto_mask(md[station_index], best_added.ravel()[feasible], intensities.ravel()[feasible])
+    order = np.argsort(md[station_index[mask]], kind='stable')
+    pareto = (station_index[mask][order], radius_index[mask][order])
+
+    return SidetrackResult((md, tvd, offset, angle), radii, best_turn, best_tangent, best_added, intensities, pareto)
+
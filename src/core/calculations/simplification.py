@@ -0,0 +1,99 @@
+import numpy as np
+
+from src.core.calculations.export import CsvWriter
+
+
+def arc_stations(trajectory, tolerance=0.05):
+    """
+    Функция для расчёта минимального набора длин ствола, при котором хорды между соседними
+    точками отклоняются от траектории не более чем на tolerance (м).
+    Участки траектории - прямые и дуги постоянной кривизны, поэтому число точек считается
+    аналитически: стрела прогиба хорды дуги радиуса R с углом d равна R * (1 - cos(d / 2)),
+    откуда наибольший допустимый угол хорды d = 2 * arccos(1 - tolerance / R).
+    Прямолинейные участки представлены только своими концами.
+    """
+    md, angle = trajectory.md, np.radians(trajectory.angle)
+    lengths = np.diff(md)
+    turns = np.abs(np.diff(angle))
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        radii = lengths / turns
+        max_turn = 2 * np.arccos(np.clip(1 - tolerance / radii, -1.0, 1.0))
+        pieces = np.where((turns > 1e-12) & (lengths > 0), np.ceil(turns / max_turn), 1).astype(np.intp)
+
+    # Равномерное деление каждого участка на pieces частей одной векторной операцией
+    segment = np.repeat(np.arange(len(lengths)), pieces)
+    first = np.cumsum(pieces) - pieces
+    fraction = (np.arange(pieces.sum()) - first[segment]) / pieces[segment]
+    return np.append(md[:-1][segment] + fraction * lengths[segment], md[-1])
+
+
+def douglas_peucker(points, tolerance):
+    """
+    Функция для прореживания ломаной (точки формы (n, d)) алгоритмом Дугласа - Пекера.
+    Все интервалы одного уровня разбиения обрабатываются одной векторной операцией,
+    поэтому число проходов порядка log n. Возвращает маску сохраняемых точек.
+    """
+    points = np.asarray(points, dtype=np.float64)
+    n = len(points)
+    keep = np.zeros(n, dtype=bool)
+    keep[[0, -1]] = True
+    if n < 3:
+        return keep
+
+    starts, ends = np.array([0]), np.array([n - 1])
+    while len(starts):
+        inner = ends - starts - 1
+        starts, ends, inner = starts[inner > 0], ends[inner > 0], inner[inner > 0]
+        if not len(starts):
+            break
+
+        # Внутренние точки всех интервалов и номера их интервалов
+        owner = np.repeat(np.arange(len(starts)), inner)
+        offsets = np.cumsum(inner) - inner
+        index = starts[owner] + 1 + np.arange(inner.sum()) - offsets[owner]
+
+        a, b = points[starts[owner]], points[ends[owner]]
+        chord = b - a
+        with np.errstate(divide='ignore', invalid='ignore'):
+            t = np.clip(((points[index] - a) * chord).sum(axis=1) / (chord * chord).sum(axis=1), 0.0, 1.0)
+        t = np.nan_to_num(t)
+        distance = np.linalg.norm(points[index] - a - t[:, None] * chord, axis=1)
+
+        # Наибольшее отклонение и его положение в каждом интервале
+        worst = np.maximum.reduceat(distance, offsets)
+        is_worst = distance == worst[owner]
+        position = np.full(len(starts), n)
+        np.minimum.at(position, owner[is_worst], index[is_worst])
+
+        split = worst > tolerance
+        middle = position[split]
+        keep[middle] = True
+        starts = np.concatenate([starts[split], middle])
+        ends = np.concatenate([middle, ends[split]])
+    return keep
+
+
+def simplify_trajectory(trajectory, tolerance=0.05):
+    """
+    Функция для получения прореженных точек траектории с отклонением не более tolerance.
+    Возвращает массивы длины ствола, глубины по вертикали, смещения и зенитного угла.
+    """
+    md = arc_stations(trajectory, tolerance)
+    return (md, *trajectory.position_at(md))
+
+
+def simplify_survey(md, tvd, offset, *columns, tolerance=0.05):
+    """
+    Функция для прореживания замеренных станций (инклинометрии) по отклонению в плоскости профиля.
+    Дополнительные колонки columns (например, зенитный угол) прореживаются вместе со станциями.
+    """
+    keep = douglas_peucker(np.column_stack([offset, tvd]), tolerance)
+    return tuple(np.asarray(column)[keep] for column in (md, tvd, offset, *columns))
+
+
+def export_points(path, columns, names, precision=3, delimiter=','):
+    """Функция для записи точек в текстовый файл с заголовком (CSV, export.CsvWriter); возвращает число строк"""
+    with CsvWriter(path, names, precision=precision, delimiter=delimiter) as writer:
+        writer.write(np.column_stack(columns))
+    return writer.rows
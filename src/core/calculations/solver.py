@@ -0,0 +1,161 @@
+import numpy as np
+
+from src.core.calculations.catalog import KDTree, KEY_SCALES
+
+
+# Ключи таблицы решённых проектов: цель направляющей части
+SEED_KEYS = ('H', 'A', 'a')
+
+
+class SolveResult:
+    """
+    Класс, описывающий результат итерационного подбора параметра профиля.
+    :атрибут value: найденное значение свободного параметра;
+    :атрибут profile: объект профиля с найденным значением;
+    :атрибут iterations: количество расчётов профиля;
+    :атрибут converged: достигнута ли требуемая точность;
+    :атрибут seed: номер проекта таблицы, взятого за начальное приближение (-1 - начальное значение по умолчанию);
+    """
+
+    __slots__ = ('value', 'profile', 'iterations', 'converged', 'seed')
+
+    def __init__(self, value, profile, iterations, converged, seed):
+        self.value = value
+        self.profile = profile
+        self.iterations = iterations
+        self.converged = converged
+        self.seed = seed
+
+
+def secant(function, x0, x1, tolerance=1e-6, max_iterations=50):
+    """
+    Функция для поиска корня function методом секущих из приближений x0, x1.
+    Если значение функции не определено, шаг уменьшается вдвое в сторону последней
+    допустимой точки. Возвращает корень, количество вычислений функции и признак сходимости.
+    """
+    f0, f1 = function(x0), function(x1)
+    calls = 2
+    while calls < max_iterations:
+        if not np.isfinite(f1):
+            x1 = (x0 + x1) / 2
+            f1 = function(x1)
+            calls += 1
+            continue
+        if abs(f1) <= tolerance:
+            return x1, calls, True
+        if not np.isfinite(f0) or f1 == f0:
+            return x1, calls, False
+        x0, x1, f0 = x1, x1 - f1 * (x1 - x0) / (f1 - f0), f1
+        f1 = function(x1)
+        calls += 1
+    return x1, calls, bool(np.isfinite(f1) and abs(f1) <= tolerance)
+
+
+class WarmStartSolver:
+    """
+    Класс, описывающий подбор свободного параметра профиля, при котором расчётная величина
+    равна заданной (например, радиус R1 трёхинтервального профиля по глубине зарезки H_v).
+    Решённые проекты запоминаются в таблице с ключами H, A, a; новый подбор начинается
+    со значения ближайшего решённого проекта, что сокращает число итераций на плотно
+    разбуренных участках.
+    Параметры, необходимые для создания объекта:
+    :параметр profile_cls: класс профиля направляющей части;
+    :параметр free: str, имя подбираемого параметра;
+    :параметр objective: str, имя расчётной величины профиля или функция profile -> float;
+    :параметр default: float, начальное приближение при пустой таблице;
+    """
+
+    def __init__(self, profile_cls, free, objective, default, tolerance=1e-6, max_iterations=50):
+        self.profile_cls = profile_cls
+        self.free = free
+        self.objective = objective
+        self.default = default
+        self.tolerance = tolerance
+        self.max_iterations = max_iterations
+
+        self.keys = np.empty((0, len(SEED_KEYS)))
+        self.targets = np.empty(0)
+        self.values = np.empty(0)
+        self._tree = None
+        self._indexed = 0   # количество записей, вошедших в дерево; остальные просматриваются перебором
+
+        self.solves = 0
+        self.iterations = 0
+
+    @property
+    def mean_iterations(self):
+        return self.iterations / self.solves if self.solves else 0.0
+
+    def __len__(self):
+        return len(self.values)
+
+    def evaluate(self, profile):
+        if callable(self.objective):
+            return float(self.objective(profile))
+        return float(getattr(profile, self.objective))
+
+    def add(self, params, target, value):
+        """Метод для добавления решённого проекта в таблицу"""
+        self.keys = np.vstack([self.keys, [[params[key] for key in SEED_KEYS]]])
+        self.targets = np.append(self.targets, target)
+        self.values = np.append(self.values, value)
+
+    def seed(self, params):
+        """Метод для поиска ближайшего решённого проекта; возвращает его номер или -1"""
+        if not len(self):
+            return -1
+
+        pending = len(self) - self._indexed
+        if self._tree is None or pending > max(64, self._indexed // 4):
+            self._tree = KDTree(self.keys)
+            self._indexed = len(self)
+
+        weights = np.array([KEY_SCALES[key] for key in SEED_KEYS])
+        point = np.array([params[key] for key in SEED_KEYS], dtype=np.float64)
+        distances, index = self._tree.query_nearest(point, 1, weights)
+        best, nearest = distances[0], index[0]
+
+        if self._indexed < len(self):
+            tail = np.sqrt((((self.keys[self._indexed:] - point) * weights) ** 2).sum(axis=1))
+            i = int(np.argmin(tail))
+            if tail[i] < best:
+                nearest = self._indexed + i
+        return int(nearest)
+
+    def solve(self, target, remember=True, **params):
+        """
+        Метод для подбора параметра free, при котором величина objective равна target.
+        params - остальные параметры профиля (обязательно H, A, a).
+        """
+        seed = self.seed(params)
+        start = self.default if seed < 0 else float(self.values[seed])
+        step = 1e-3 * abs(start) or 1e-3
+
+        # Конструкторы профилей всех семейств принимают параметры в порядке _PARAMS
+        profile = self.profile_cls(*(params.get(name, 0.0) for name in self.profile_cls._PARAMS))
+
+        def residual(x):
+            # Изменение параметра сбрасывает только зависящие от него величины профиля
+            setattr(profile, self.free, x)
+            return self.evaluate(profile) - target
+
+        with np.errstate(all='ignore'):
+            value, calls, converged = secant(residual, start, start + step, self.tolerance, self.max_iterations)
+            setattr(profile, self.free, value)
+
+        self.solves += 1
+        self.iterations += calls
+        if converged and remember:
+            self.add(params, target, value)
+        return SolveResult(value, profile, calls, converged, seed)
+
+    def save(self, path):
+        """Метод для сохранения таблицы решённых проектов (формат .npz)"""
+        np.savez(path, keys=self.keys, targets=self.targets, values=self.values)
+
+    def load(self, path):
+        """Метод для загрузки таблицы решённых проектов"""
+        with np.load(path) as data:
+            self.keys, self.targets, self.values = data['keys'], data['targets'], data['values']
+        self._tree = None
+        self._indexed = 0
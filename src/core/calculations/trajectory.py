@@ -0,0 +1,144 @@
+import numpy as np
+
+from src.core.calculations.batch import segment_table, DEPTH, BORE, DISLOCATION, ANGLE
+
+
+# Допустимое расхождение конца дуги участка с узлом траектории (доля наибольшей длины ствола)
+NODE_TOLERANCE = 1e-6
+
+
+class Trajectory:
+    """
+    Класс, описывающий траекторию ствола в вертикальной плоскости, составленную из участков
+    постоянной кривизны (прямолинейных и круговых). Траектория задаётся узлами - началом
+    ствола и концами участков таблиц профилей.
+    Параметры, необходимые для создания объекта:
+    :параметр md: массив длин ствола в узлах (по возрастанию), м;
+    :параметр tvd: массив глубин по вертикали в узлах, м;
+    :параметр offset: массив смещений в узлах, м;
+    :параметр angle: массив зенитных углов в узлах, град;
+    :параметр check: проверять, что каждый узел лежит на дуге участка (иначе ValueError);
+    """
+
+    __slots__ = ('md', 'tvd', 'offset', 'angle')
+
+    def __init__(self, md, tvd, offset, angle, check=True):
+        self.md = np.asarray(md, dtype=np.float64)
+        self.tvd = np.asarray(tvd, dtype=np.float64)
+        self.offset = np.asarray(offset, dtype=np.float64)
+        self.angle = np.asarray(angle, dtype=np.float64)
+
+        if check:
+            errors = self.node_errors()
+            tolerance = NODE_TOLERANCE * max(1.0, float(np.abs(self.md).max(initial=0.0)))
+            bad = np.flatnonzero(errors > tolerance)
+            if len(bad):
+                raise ValueError(
+                    f"Конец {bad[0] + 1}-го участка траектории не лежит на его дуге: "
+                    f"расхождение {errors[bad[0]]:.3f} м"
+                )
+
+    @classmethod
+    def from_profiles(cls, directional_profile, horizontal_profile=None, start=(0.0, 0.0, 0.0, 0.0)):
+        """
+        Метод для построения траектории по направляющей и (необязательно) горизонтальной частям.
+        start - длина ствола, глубина, смещение и зенитный угол в начале профиля.
+        Длины стволов горизонтальной части отсчитываются от конца направляющей части.
+        """
+        return cls.from_table(profile_table(directional_profile, horizontal_profile), start)
+
+    @classmethod
+    def from_table(cls, table, start=(0.0, 0.0, 0.0, 0.0)):
+        """Метод для построения траектории по таблице участков (концы участков - узлы траектории)"""
+        md0, tvd0, offset0, angle0 = start
+        return cls(
+            np.concatenate([[md0], table[:, BORE]]),
+            np.concatenate([[tvd0], table[:, DEPTH]]),
+            np.concatenate([[offset0], table[:, DISLOCATION]]),
+            np.concatenate([[angle0], table[:, ANGLE]])
+        )
+
+    @property
+    def length(self):
+        """Свойство для получения длины ствола в конце траектории"""
+        return self.md[-1]
+
+    def _arcs(self, index, s):
+        """
+        Метод для расчёта приращений глубины, смещения и зенитного угла (рад) на длине s
+        от начала участков index по дуге постоянной кривизны между зенитными углами в узлах
+        """
+        length = self.md[index + 1] - self.md[index]
+        a0, a1 = np.radians(self.angle[index]), np.radians(self.angle[index + 1])
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            curvature = np.where(length > 0, (a1 - a0) / length, 0.0)
+            straight = np.abs(curvature) < 1e-12
+            angle = a0 + curvature * s
+            k = np.where(straight, 1.0, curvature)
+            d_tvd = np.where(straight, s * np.cos(a0), (np.sin(angle) - np.sin(a0)) / k)
+            d_offset = np.where(straight, s * np.sin(a0), (np.cos(a0) - np.cos(angle)) / k)
+        return d_tvd, d_offset, angle
+
+    def node_errors(self):
+        """
+        Метод для проверки согласованности узлов: расстояние (м) между концом дуги каждого
+        участка, построенной от его начального узла, и конечным узлом участка
+        """
+        index = np.arange(len(self.md) - 1)
+        d_tvd, d_offset, _ = self._arcs(index, self.md[1:] - self.md[:-1])
+        return np.hypot(self.tvd[:-1] + d_tvd - self.tvd[1:], self.offset[:-1] + d_offset - self.offset[1:])
+
+    def position_at(self, md):
+        """
+        Метод для векторного расчёта положения ствола на заданных длинах ствола.
+        Поиск участка - бинарный (O(log n)), внутри участка положение вычисляется по дуге
+        постоянной кривизны между зенитными углами в узлах. Возвращает глубину по вертикали,
+        смещение и зенитный угол (град) для каждого значения md.
+        """
+        md = np.asarray(md, dtype=np.float64)
+        index = np.clip(np.searchsorted(self.md, md, side='right') - 1, 0, len(self.md) - 2)
+
+        d_tvd, d_offset, angle = self._arcs(index, md - self.md[index])
+        return self.tvd[index] + d_tvd, self.offset[index] + d_offset, np.degrees(angle)
+
+    def stations(self, step=1.0, md_start=None, md_end=None):
+        """
+        Метод для расчёта станций с шагом step по длине ствола в интервале [md_start, md_end].
+        Возвращает массивы длины ствола, глубины по вертикали, смещения и зенитного угла.
+        """
+        md_start = self.md[0] if md_start is None else md_start
+        md_end = self.md[-1] if md_end is None else md_end
+
+        md = np.arange(md_start, md_end, step, dtype=np.float64)
+        md = np.append(md, md_end)
+        return (md, *self.position_at(md))
+
+    def iter_stations(self, step=1.0, chunk=100_000, md_start=None, md_end=None):
+        """
+        Генератор станций с шагом step блоками не более chunk станций: те же станции, что и
+        у stations, но в памяти одновременно находится только один блок.
+        Каждый блок - массивы длины ствола, глубины по вертикали, смещения и зенитного угла.
+        """
+        md_start = self.md[0] if md_start is None else md_start
+        md_end = self.md[-1] if md_end is None else md_end
+
+        count = max(int(np.ceil((md_end - md_start) / step)), 0)
+        for start in range(0, count + 1, chunk):
+            md = md_start + np.arange(start, min(start + chunk, count), dtype=np.float64) * step
+            if start + chunk > count:
+                md = np.append(md, md_end)
+            yield (md, *self.position_at(md))
+
+
+def profile_table(directional_profile, horizontal_profile=None):
+    """
+    Функция для получения общей таблицы участков направляющей и (необязательно) горизонтальной
+    частей: длины стволов горизонтальной части отсчитываются от конца направляющей части.
+    """
+    tables = [segment_table(directional_profile)]
+    if horizontal_profile is not None:
+        table = segment_table(horizontal_profile).copy()
+        table[:, BORE] += tables[0][-1, BORE]
+        tables.append(table)
+    return np.concatenate(tables)
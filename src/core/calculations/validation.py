@@ -0,0 +1,234 @@
+from enum import IntFlag
+
+import numpy as np
+
+from src.core.calculations.horizontal_wells import (
+    TwoInterval, ThreeInterval, TangentialFourInterval, TangentialFiveInterval, FourInterval,
+    Tangential, Descending, Ascending, Undulant
+)
+from src.core.calculations.inclined_wells import inclined_profiles as inclined
+
+
+class Reason(IntFlag):
+    """Коды причин недопустимости проекта (битовые флаги: у строки может быть несколько причин)"""
+    NOT_FINITE = 1 # параметр не задан или не является числом
+    DEPTH = 2 # неположительная проектная глубина
+    DISPLACEMENT = 4 # отрицательное смещение
+    ANGLE = 8 # угол вне диапазона 0..90 град
+    RADIUS = 16 # неположительный радиус кривизны
+    LENGTH = 32 # недопустимая длина участка или отрицательное отклонение горизонтального участка
+    SINGULAR = 64 # вырожденное сочетание параметров (деление на ноль, выход из области определения)
+    NEGATIVE_INTERVAL = 128 # профиль рассчитан, но длина одного из участков отрицательна (batch.table_reasons)
+    NOT_FINITE_RESULT = 256 # профиль не рассчитывается при заданных параметрах (batch.table_reasons)
+
+
+def _rule(reason, message, names, predicate):
+    """Функция для описания правила: predicate получает колонки names и возвращает маску нарушений"""
+    return reason, message, names, predicate
+
+
+def _positive(name, reason, what):
+    return _rule(reason, f"{what} ({name}) должен быть больше нуля", (name,), lambda value: ~(value > 0))
+
+
+def _angle(name):
+    return _rule(Reason.ANGLE, f"Угол {name} должен быть в диапазоне от 0 до 90 град", (name,),
+                 lambda value: ~((value >= 0) & (value <= 90)))
+
+
+_TARGET = (
+    _positive('H', Reason.DEPTH, "Проектная глубина"),
+    _rule(Reason.DISPLACEMENT, "Смещение (A) не может быть отрицательным", ('A',), lambda A: ~(A >= 0)),
+    _angle('a'),
+)
+
+# Общие правила профилей наклонно направленных скважин
+_INCLINED = (
+    _positive('H', Reason.DEPTH, "Проектная глубина"),
+    _positive('A', Reason.DISPLACEMENT, "Проектное смещение"),
+    _rule(Reason.DEPTH, "Конечная глубина (H1) не может быть меньше проектной (H)", ('H', 'H1'), lambda H, H1: ~(H1 >= H)),
+    _rule(Reason.LENGTH, "Длина вертикального участка (L_v) должна быть в диапазоне от 0 до H", ('H', 'L_v'),
+          lambda H, L_v: ~((L_v >= 0) & (L_v < H))),
+    _positive('R2', Reason.RADIUS, "Радиус 2-го участка"),
+)
+
+
+def _tangent_missing(X, Z, R):
+    """Функция для получения маски проектов, у которых касательная к окружности радиуса R не существует"""
+    return X ** 2 + Z ** 2 < R ** 2
+
+
+def _last_arc_missing(W, R4):
+    """Функция для получения маски проектов, у которых последняя дуга радиуса R4 не достигает проектной точки"""
+    return ~(abs(W) <= R4)
+
+
+def _final_angle_outside(a1, turn, W, R4):
+    """
+    Функция для получения маски проектов, у которых конечный угол a = a1 + turn * arccos(W / R4)
+    (turn = 1 - набор, -1 - снижение угла на последней дуге) выходит из диапазона 0..90 град.
+    Проекты, у которых дуга не достигает проектной точки, отмечает _last_arc_missing
+    """
+    reached = abs(W) <= R4
+    a = a1 + turn * np.degrees(np.arccos(np.clip(W / R4, -1.0, 1.0)))
+    return reached & ~((a >= 0) & (a <= 90))
+
+
+def _j_shaped_w(H, A, L_v, R2, a1, R4):
+    """Функция для расчёта проекции проектной точки J-образного профиля на нормаль к участку стабилизации"""
+    sin_a1, cos_a1 = np.sin(np.radians(a1)), np.cos(np.radians(a1))
+    return (H - L_v - (R2 - R4) * sin_a1) * sin_a1 - (A - R2 * (1 - cos_a1) - R4 * cos_a1) * cos_a1
+
+
+def _s_shaped_w(H, A, L_v, R2, a1, R4):
+    """Функция для расчёта проекции проектной точки S-образного профиля на нормаль к участку стабилизации"""
+    sin_a1, cos_a1 = np.sin(np.radians(a1)), np.cos(np.radians(a1))
+    return (A - R2 * (1 - cos_a1) + R4 * cos_a1) * cos_a1 - (H - L_v - (R2 + R4) * sin_a1) * sin_a1
+
+
+# Правила областей определения по видам профиля (помимо проверки, что все параметры - конечные числа)
+RULES = {
+    TwoInterval: _TARGET + (
+        _rule(Reason.SINGULAR, "При нулевом угле a радиус набора не определён", ('a',), lambda a: a == 0),
+    ),
+    ThreeInterval: _TARGET + (
+        _angle('a1'),
+        _positive('R1', Reason.RADIUS, "Радиус 1-го участка"),
+        _rule(Reason.SINGULAR, "Углы a1 и a не должны совпадать", ('a', 'a1'), lambda a, a1: a == a1),
+    ),
+    TangentialFourInterval: _TARGET + (
+        _angle('a1'),
+        _positive('R1', Reason.RADIUS, "Радиус 1-го участка"),
+        _positive('R3', Reason.RADIUS, "Радиус 3-го участка"),
+        _rule(Reason.SINGULAR, "При нулевом угле a1 длина участка стабилизации не определена", ('a1',), lambda a1: a1 == 0),
+    ),
+    TangentialFiveInterval: _TARGET + (
+        _angle('a1'),
+        _angle('a3'),
+        _positive('R1', Reason.RADIUS, "Радиус 1-го участка"),
+        _positive('R3', Reason.RADIUS, "Радиус 3-го участка"),
+        _positive('R4', Reason.RADIUS, "Радиус 4-го участка"),
+        _rule(Reason.SINGULAR, "При нулевом угле a1 длина участка стабилизации не определена", ('a1',), lambda a1: a1 == 0),
+    ),
+    FourInterval: _TARGET + (
+        _angle('a1'),
+        _angle('a3'),
+        _positive('R1', Reason.RADIUS, "Радиус 1-го участка"),
+        _positive('R3', Reason.RADIUS, "Радиус 2-го участка"),
+        _rule(Reason.SINGULAR, "Углы a3 и a не должны совпадать", ('a', 'a3'), lambda a, a3: a == a3),
+    ),
+    Tangential: _TARGET + (
+        _positive('S_l', Reason.LENGTH, "Протяжённость горизонтального участка"),
+    ),
+    Descending: _TARGET + (
+        _positive('S_l', Reason.LENGTH, "Протяжённость горизонтального участка"),
+        _positive('T1', Reason.LENGTH, "Предельное отклонение оси"),
+    ),
+    Ascending: _TARGET + (
+        _positive('S_l', Reason.LENGTH, "Протяжённость горизонтального участка"),
+        _positive('T1', Reason.LENGTH, "Предельное отклонение оси"),
+    ),
+    Undulant: _TARGET + (
+        _positive('S_l', Reason.LENGTH, "Протяжённость горизонтального участка"),
+        _rule(Reason.LENGTH, "Отклонения оси T1, T2 не могут быть отрицательными", ('T1', 'T2'),
+              lambda T1, T2: ~((T1 >= 0) & (T2 >= 0))),
+        _positive('R1', Reason.RADIUS, "Радиус дуг волны"),
+        _rule(Reason.SINGULAR, "Волна не укладывается в радиус: должно быть 2 * R1 >= T1 + T2", ('T1', 'T2', 'R1'),
+              lambda T1, T2, R1: 2 * R1 < T1 + T2),
+    ),
+    inclined.TangentialThreeInterval: _INCLINED + (
+        _rule(Reason.SINGULAR, "Проектная точка лежит внутри окружности набора угла радиуса R2", ('H', 'A', 'L_v', 'R2'),
+              lambda H, A, L_v, R2: _tangent_missing(A - R2, H - L_v, R2)),
+    ),
+    inclined.TangentialFourInterval: _INCLINED + (
+        _rule(Reason.ANGLE, "Угол a1 должен быть в диапазоне от 0 до 90 град (не включая 90)", ('a1',),
+              lambda a1: ~((a1 >= 0) & (a1 < 90))),
+        _positive('R3', Reason.RADIUS, "Радиус 3-го участка"),
+        _rule(Reason.SINGULAR, "Участок стабилизации не существует: радиусы R2 и R3 слишком велики", ('H', 'A', 'L_v', 'R2', 'a1', 'R3'),
+              lambda H, A, L_v, R2, a1, R3: _tangent_missing(
+                  A - R2 - R3 * np.cos(np.radians(a1)), H - L_v + R3 * np.sin(np.radians(a1)), R2 + R3)),
+    ),
+    inclined.JShaped: _INCLINED + (
+        _angle('a1'),
+        _positive('R4', Reason.RADIUS, "Радиус 4-го участка"),
+        _rule(Reason.SINGULAR, "Дуга радиуса R4 не достигает проектной точки", ('H', 'A', 'L_v', 'R2', 'a1', 'R4'),
+              lambda H, A, L_v, R2, a1, R4: _last_arc_missing(_j_shaped_w(H, A, L_v, R2, a1, R4), R4)),
+        _rule(Reason.ANGLE, "Конечный угол a должен быть в диапазоне от 0 до 90 град", ('H', 'A', 'L_v', 'R2', 'a1', 'R4'),
+              lambda H, A, L_v, R2, a1, R4: _final_angle_outside(a1, 1, _j_shaped_w(H, A, L_v, R2, a1, R4), R4)),
+    ),
+    inclined.SShaped: _INCLINED + (
+        _angle('a1'),
+        _positive('R4', Reason.RADIUS, "Радиус 4-го участка"),
+        _rule(Reason.SINGULAR, "Дуга радиуса R4 не достигает проектной точки", ('H', 'A', 'L_v', 'R2', 'a1', 'R4'),
+              lambda H, A, L_v, R2, a1, R4: _last_arc_missing(_s_shaped_w(H, A, L_v, R2, a1, R4), R4)),
+        _rule(Reason.ANGLE, "Конечный угол a должен быть в диапазоне от 0 до 90 град", ('H', 'A', 'L_v', 'R2', 'a1', 'R4'),
+              lambda H, A, L_v, R2, a1, R4: _final_angle_outside(a1, -1, _s_shaped_w(H, A, L_v, R2, a1, R4), R4)),
+    ),
+}
+
+MESSAGES = {
+    Reason.NOT_FINITE: "Параметр не задан или не является числом",
+    Reason.NEGATIVE_INTERVAL: "Профиль не существует при заданных параметрах: длина одного из участков отрицательна",
+    Reason.NOT_FINITE_RESULT: "Профиль не рассчитывается при заданных параметрах",
+}
+
+
+def rules(profile_cls):
+    """Функция для получения правил вида профиля; для вида без правил - ValueError"""
+    try:
+        return RULES[profile_cls]
+    except KeyError:
+        raise ValueError(f"Нет правил проверки для вида профиля {profile_cls.__name__}") from None
+
+
+def _columns(profile_cls, columns):
+    """Функция для приведения колонок параметров вида профиля к массивам общей формы"""
+    values = [np.asarray(columns[name], dtype=np.float64) for name in profile_cls._PARAMS]
+    shape = np.broadcast_shapes(*(value.shape for value in values))
+    return {name: np.broadcast_to(value, shape) for name, value in zip(profile_cls._PARAMS, values)}, shape
+
+
+def validate(profile_cls, **columns):
+    """
+    Функция для векторной проверки областей определения параметров проектов одного вида.
+    Колонки - массивы значений параметров (или скаляры). Возвращает массив кодов Reason
+    по строкам (0 - строка допустима); проверки выполняются без расчёта профиля.
+    """
+    profile_rules = rules(profile_cls)
+    values, shape = _columns(profile_cls, columns)
+    codes = np.zeros(shape, dtype=np.uint16)
+    finite = np.ones(shape, dtype=bool)
+    for value in values.values():
+        finite &= np.isfinite(value)
+    codes[~finite] |= np.uint16(Reason.NOT_FINITE)
+
+    with np.errstate(invalid='ignore'):
+        for reason, _, names, predicate in profile_rules:
+            codes[finite & predicate(*(values[name] for name in names))] |= np.uint16(reason)
+    return codes
+
+
+def validate_designs(designs):
+    """Функция для проверки всех проектов хранилища ProfileArray"""
+    return validate(designs.profile_cls, **dict(zip(designs.names, designs.data)))
+
+
+def explain(profile_cls, **values):
+    """
+    Функция для получения текстов нарушений одного проекта (для сообщений интерфейса).
+    В отличие от кодов, тексты указывают конкретный параметр и условие.
+    """
+    profile_rules = rules(profile_cls)
+    missing = [name for name in profile_cls._PARAMS if name not in values or not np.isfinite(values[name])]
+    if missing:
+        return [f"{MESSAGES[Reason.NOT_FINITE]}: {', '.join(missing)}"]
+    with np.errstate(invalid='ignore'):
+        return [
+            message for _, message, names, predicate in profile_rules
+            if predicate(*(np.float64(values[name]) for name in names))
+        ]
+
+
+def describe(code):
+    """Функция для получения списка названий причин по коду строки"""
+    return [reason.name for reason in Reason if code & reason]
@@ -0,0 +1,184 @@
+import numpy as np
+from PyQt6.QtCore import QThread, pyqtSignal
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QFormLayout, QComboBox, QLineEdit, QPushButton, QLabel
+from matplotlib import colormaps
+from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg
+from matplotlib.figure import Figure
+
+from src.core.calculations.batch import design_map
+
+
+# Наибольшее число проектов, рассчитываемых за один шаг рабочего потока (проверка отмены между шагами)
+BLOCK_SIZE = 100_000
+
+
+def refinement_levels(resolution, coarsest=32):
+    """Функция для получения размеров сеток от грубой к заданной: каждая следующая вдвое подробнее"""
+    levels = [resolution]
+    while levels[-1] // 2 >= coarsest:
+        levels.append(levels[-1] // 2)
+    return levels[::-1]
+
+
+class FeasibilityWorker(QThread):
+    """
+    Рабочий поток расчёта карты допустимости по сетке двух параметров.
+    Карта уточняется от грубой сетки к подробной; каждая готовая сетка передаётся
+    сигналом level_ready (размер сетки, значения x, значения y, карта длин ствола).
+    """
+
+    level_ready = pyqtSignal(int, object, object, object)
+
+    def __init__(self, profile_cls, fixed, x_name, x_range, y_name, y_range, resolution, parent=None):
+        super().__init__(parent)
+        self.profile_cls = profile_cls
+        self.fixed = fixed
+        self.x_name, self.x_range = x_name, x_range
+        self.y_name, self.y_range = y_name, y_range
+        self.resolution = resolution
+
+    def run(self):
+        for size in refinement_levels(self.resolution):
+            x = np.linspace(*self.x_range, size)
+            y = np.linspace(*self.y_range, size)
+            rows = max(BLOCK_SIZE // size, 1)
+            result = np.empty((size, size))
+            for start in range(0, size, rows):
+                if self.isInterruptionRequested():
+                    return
+                result[start:start + rows] = design_map(
+                    self.profile_cls, self.fixed, self.x_name, x, self.y_name, y[start:start + rows]
+                )
+            self.level_ready.emit(size, x, y, result)
+
+
+class FeasibilityMap(QWidget):
+    """
+    Окно карты допустимости проекта по паре параметров направляющей части.
+    Цвет - длина ствола в конце профиля, серым отмечены недопустимые сочетания
+    (отрицательная длина участка или выход из области определения формул).
+    Параметры, необходимые для создания объекта:
+    :параметр profile_cls: класс направляющей части;
+    :параметр values: словарь значений параметров из формы (начальные значения и фиксированные параметры);
+    """
+
+    def __init__(self, profile_cls, values, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle(f"Карта допустимости: {profile_cls.__name__}")
+        self.resize(800, 700)
+
+        self.profile_cls = profile_cls
+        self.values = values
+        self.worker = None
+
+        # Подбирать имеет смысл параметры кроме цели (H, A, a)
+        names = [name for name in profile_cls._PARAMS if name not in ('H', 'A', 'a')]
+
+        form = QFormLayout()
+        self.x_name, self.y_name = QComboBox(), QComboBox()
+        self.x_name.addItems(names)
+        self.y_name.addItems(names)
+        self.y_name.setCurrentIndex(min(1, len(names) - 1))
+        self.x_min, self.x_max, self.y_min, self.y_max = (QLineEdit() for _ in range(4))
+        self.resolution = QLineEdit("1000")
+
+        form.addRow("Параметр по горизонтали:", self.row(self.x_name, self.x_min, self.x_max))
+        form.addRow("Параметр по вертикали:", self.row(self.y_name, self.y_min, self.y_max))
+        form.addRow("Размер сетки:", self.resolution)
+
+        self.x_name.currentTextChanged.connect(lambda name: self.set_default_range(name, self.x_min, self.x_max))
+        self.y_name.currentTextChanged.connect(lambda name: self.set_default_range(name, self.y_min, self.y_max))
+        self.set_default_range(self.x_name.currentText(), self.x_min, self.x_max)
+        self.set_default_range(self.y_name.currentText(), self.y_min, self.y_max)
+
+        build = QPushButton("Построить")
+        build.clicked.connect(self.start)
+        self.status = QLabel()
+
+        self.figure = Figure(tight_layout=True)
+        self.canvas = FigureCanvasQTAgg(self.figure)
+        self.axes = self.figure.add_subplot()
+        self.image = None
+
+        layout = QVBoxLayout(self)
+        layout.addLayout(form)
+        buttons = QHBoxLayout()
+        buttons.addWidget(self.status, 1)
+        buttons.addWidget(build)
+        layout.addLayout(buttons)
+        layout.addWidget(self.canvas, 1)
+
+    @staticmethod
+    def row(*widgets):
+        container = QWidget()
+        layout = QHBoxLayout(container)
+        layout.setContentsMargins(0, 0, 0, 0)
+        for widget in widgets:
+            layout.addWidget(widget)
+        return container
+
+    def set_default_range(self, name, low, high):
+        """Метод для подстановки диапазона по умолчанию: углы 0..90 град, радиусы 0.2..3 значения из формы"""
+        if name.startswith('a'):
+            low.setText("0.5")
+            high.setText("89.5")
+        else:
+            value = self.values.get(name) or 1000.0
+            low.setText(f"{0.2 * value:g}")
+            high.setText(f"{3 * value:g}")
+
+    def start(self):
+        """Метод для запуска (перезапуска) расчёта карты в рабочем потоке"""
+        try:
+            x_range = (float(self.x_min.text()), float(self.x_max.text()))
+            y_range = (float(self.y_min.text()), float(self.y_max.text()))
+            resolution = int(self.resolution.text())
+        except ValueError:
+            self.status.setText("Некорректные границы или размер сетки")
+            return
+
+        self.stop()
+        x_name, y_name = self.x_name.currentText(), self.y_name.currentText()
+        fixed = {name: value for name, value in self.values.items() if name in self.profile_cls._PARAMS}
+        missing = [name for name in self.profile_cls._PARAMS if name not in fixed and name not in (x_name, y_name)]
+        if missing or x_name == y_name:
+            self.status.setText(f"Не заданы параметры: {', '.join(missing)}" if missing else "Выберите разные параметры")
+            return
+
+        self.worker = FeasibilityWorker(self.profile_cls, fixed, x_name, x_range, y_name, y_range, resolution, self)
+        self.worker.level_ready.connect(self.show_level)
+        self.worker.start()
+        self.status.setText("Расчёт...")
+
+    def stop(self):
+        if self.worker is not None:
+            # Сетки, уже отправленные остановленным потоком, не должны попасть на график
+            self.worker.level_ready.disconnect()
+            self.worker.requestInterruption()
+            self.worker.wait()
+            self.worker = None
+
+    def show_level(self, size, x, y, lengths):
+        """Обработчик готовой сетки: обновляет изображение без пересоздания осей"""
+        extent = (x[0], x[-1], y[0], y[-1])
+        if self.image is None:
+            cmap = colormaps['viridis'].with_extremes(bad='lightgray')
+            self.image = self.axes.imshow(lengths, origin='lower', extent=extent, aspect='auto',
+                                          interpolation='nearest', cmap=cmap)
+            self.figure.colorbar(self.image, ax=self.axes, label="Длина ствола, м")
+        else:
+            self.image.set_data(lengths)
+            self.image.set_extent(extent)
+
+        if np.isfinite(lengths).any():
+            self.image.set_clim(np.nanmin(lengths), np.nanmax(lengths))
+        self.axes.set_xlabel(self.worker.x_name if self.worker else "")
+        self.axes.set_ylabel(self.worker.y_name if self.worker else "")
+        self.canvas.draw_idle()
+
+        share = np.isfinite(lengths).mean()
+        self.status.setText(f"Сетка {size}x{size}: допустимо {share:.0%} сочетаний")
+
+    def closeEvent(self, event):
+        self.stop()
+        super().closeEvent(event)
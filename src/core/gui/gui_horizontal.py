@@ -1,14 +1,26 @@
 from PyQt6.QtWidgets import (
     QWidget, QLabel, QPushButton, QRadioButton, QFormLayout, QScrollArea,
-    QLineEdit, QVBoxLayout, QGridLayout, QStackedWidget, QButtonGroup, QDialog, QTableWidget, QTableWidgetItem, QVBoxLayout
+    QLineEdit, QVBoxLayout, QGridLayout, QStackedWidget, QButtonGroup, QDialog, QTableView, QTabWidget, QVBoxLayout,
+    QHBoxLayout, QSlider, QMessageBox, QFileDialog
 )
 from PyQt6.QtCore import Qt
 from src.core.gui import (
     TwoInterval, ThreeInterval, TangentialFourInterval, TangentialFiveInterval, 
     FourInterval, Tangential, Descending, Ascending, Undulant
 )
+from src.core.gui.table_models import ArrayTableModel, StationTableModel, station_listing
+from src.core.gui.profile_canvas import ProfileCanvas
+from src.core.gui.feasibility_map import FeasibilityMap
+from src.core.calculations.auto_design import auto_design
+from src.core.calculations.batch import segment_table, table_reasons
+from src.core.calculations.validation import MESSAGES, Reason, explain
+from src.core.calculations.trajectory import Trajectory, profile_table
+from src.core.calculations.result_store import append_results
+from src.core.calculations.export import CHUNK_ROWS, LAS_CURVES, open_writer
+import numpy as np
 import pandas as pd
 import os
+import sys
 
 profile_dict = {
     0: TwoInterval,
@@ -18,15 +30,19 @@ profile_dict = {
     4: FourInterval
 }
 
+# Имена параметров полей страниц горизонтальной части (порядок create_horizontal_profile)
+HORIZONTAL_FIELDS = ('S_l', 'T1', 'T2', 'R1')
+
 class Horizontal_Well(QWidget):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Профиль горизонтальной скважины")
         self.setMinimumSize(900, 700)
         
-        # Сразу создаем страницу горизонтального профиля
-        layout = QVBoxLayout()
-        layout.addWidget(self.horizontal_page())
+        # Сразу создаем страницу горизонтального профиля и панель с графиком профиля
+        layout = QHBoxLayout()
+        layout.addWidget(self.horizontal_page(), 3)
+        layout.addWidget(self.preview_panel(), 2)
         self.setLayout(layout) 
     
     def horizontal_page(self):
@@ -157,6 +173,14 @@ class Horizontal_Well(QWidget):
         finish.clicked.connect(self.on_confirm_horizontal)
         grid.addWidget(finish, 13, 1, alignment=Qt.AlignmentFlag.AlignRight)
 
+        feasibility = QPushButton("Карта допустимости")
+        feasibility.clicked.connect(self.open_feasibility_map)
+        grid.addWidget(feasibility, 14, 1, alignment=Qt.AlignmentFlag.AlignRight)
+
+        auto = QPushButton("Автоподбор профиля")
+        auto.clicked.connect(self.open_auto_design)
+        grid.addWidget(auto, 15, 1, alignment=Qt.AlignmentFlag.AlignRight)
+
 
 
         # --- Оборачиваем все это в QScrollArea ---
@@ -172,35 +196,217 @@ class Horizontal_Well(QWidget):
         self.params_stack.setCurrentIndex(0)
         self.stacked_stem.setCurrentIndex(0)
 
+        # Любое изменение параметров обновляет график профиля
+        for le in (self.inputs_h1 + self.inputs_h2 + self.inputs_h3 + self.inputs_h4 + self.inputs_h5 +
+                   self.inputs_straight + self.inputs_desc + self.inputs_asc + self.inputs_wave):
+            le.textChanged.connect(self.update_preview)
+
         return scroll
 
+    def preview_panel(self):
+        """Метод для создания панели с графиком профиля и ползунками параметров a и R1"""
+        panel = QWidget()
+        layout = QVBoxLayout(panel)
+
+        self.canvas = ProfileCanvas(panel)
+        layout.addWidget(self.canvas, 1)
+
+        form = QFormLayout()
+        # Угол задаётся с шагом 0.1 град, радиус - с шагом 1 м
+        self.slider_a = QSlider(Qt.Orientation.Horizontal)
+        self.slider_a.setRange(0, 900)
+        self.slider_R1 = QSlider(Qt.Orientation.Horizontal)
+        self.slider_R1.setRange(50, 3000)
+        form.addRow("Угол на проектной глубине:", self.slider_a)
+        form.addRow("Радиус 1-го участка:", self.slider_R1)
+        layout.addLayout(form)
+
+        self.slider_a.valueChanged.connect(lambda value: self.set_current_param(2, f"{value / 10:g}"))
+        self.slider_R1.valueChanged.connect(lambda value: self.set_current_param(4, str(value)))
+        self.slider_R1.setEnabled(False)
+
+        return panel
+
+    def current_inputs(self):
+        """Метод для получения полей ввода активной страницы направляющей части"""
+        return [self.inputs_h1, self.inputs_h2, self.inputs_h3, self.inputs_h4, self.inputs_h5][self.params_stack.currentIndex()]
+
+    def set_current_param(self, position, text):
+        """Обработчик ползунка: записывает значение в поле активной страницы (график обновится по textChanged)"""
+        inputs = self.current_inputs()
+        if position < len(inputs):
+            inputs[position].setText(text)
+
+    def update_preview(self):
+        """Метод для пересчёта профиля по текущим значениям полей и обновления графика"""
+        try:
+            idx_nav, vals_nav, idx_horz, vals_horz = self.read_params()
+            if self.check_params(idx_nav, vals_nav, idx_horz, vals_horz):
+                raise ValueError("Параметры вне области определения")
+            directional_profile = self.create_profile(idx_nav, vals_nav, profile_dict)
+            horizontal_profile = self.create_horizontal_profile(vals_nav, idx_horz, vals_horz)
+            with np.errstate(divide='raise', invalid='raise'):
+                trajectory = Trajectory.from_profiles(directional_profile, horizontal_profile)
+                md, depth, offset, _ = trajectory.stations(5.0)
+        except Exception:
+            self.canvas.set_profile([None, None])
+            return
+
+        landing = np.searchsorted(md, directional_profile.lengths_of_the_bores[-1], side='right')
+        self.canvas.set_profile([(offset[:landing], depth[:landing]), (offset[landing - 1:], depth[landing - 1:])])
+
+    def open_feasibility_map(self):
+        """Обработчик кнопки карты допустимости для выбранного вида направляющей части"""
+        profile_cls = profile_dict[self.params_stack.currentIndex()]
+        if len(profile_cls._PARAMS) < 5:
+            QMessageBox.information(self, "Карта допустимости", "У выбранного вида профиля нет подбираемых параметров")
+            return
+
+        # Заполненные поля формы - фиксированные параметры и начальные диапазоны карты
+        values = {}
+        for name, le in zip(profile_cls._PARAMS, self.current_inputs()):
+            try:
+                values[name] = float(le.text())
+            except ValueError:
+                pass
+
+        self._feasibility_win = FeasibilityMap(profile_cls, values)
+        self._feasibility_win.show()
+
+    def form_values(self):
+        """
+        Метод для сбора заполненных полей всех страниц формы по именам параметров.
+        Значения активной страницы направляющей части имеют приоритет над остальными.
+        """
+        def collect(names, inputs, values):
+            for name, le in zip(names, inputs):
+                try:
+                    values[name] = float(le.text())
+                except ValueError:
+                    pass
+
+        pages = [self.inputs_h1, self.inputs_h2, self.inputs_h3, self.inputs_h4, self.inputs_h5]
+        current = self.params_stack.currentIndex()
+        directional = {}
+        for idx in sorted(profile_dict, key=lambda idx: idx == current):
+            collect(profile_dict[idx]._PARAMS, pages[idx], directional)
+
+        horizontal = {}
+        for inputs in (self.inputs_straight, self.inputs_desc, self.inputs_asc, self.inputs_wave):
+            collect(HORIZONTAL_FIELDS, inputs, horizontal)
+        return directional, horizontal
+
+    def open_auto_design(self):
+        """Обработчик кнопки автоподбора: все сочетания видов частей профиля для введённой цели"""
+        directional, horizontal = self.form_values()
+        missing = [name for name in ('H', 'A', 'a') if name not in directional]
+        if missing or 'S_l' not in horizontal:
+            QMessageBox.information(self, "Автоподбор профиля", "Задайте H, A, a направляющей части и S_l горизонтальной части")
+            return
+
+        result = auto_design(directional, horizontal)
+        if not result.counts[0]:
+            QMessageBox.information(self, "Автоподбор профиля", "Нет допустимых сочетаний для введённых параметров")
+            return
+
+        ranked = result.ranked(0)
+        rows = np.array([
+            (directional_cls.__name__, horizontal_cls.__name__, length, intensity)
+            for directional_cls, horizontal_cls, length, intensity in ranked
+        ], dtype=object)
+        dialog = QDialog(self)
+        dialog.setWindowTitle("Автоподбор профиля")
+        dialog.resize(600, 400)
+        layout = QVBoxLayout(dialog)
+        layout.addWidget(QLabel("Допустимые сочетания по возрастанию длины ствола (двойной щелчок - выбрать):"))
+        view = ResultDialog.create_view(ArrayTableModel(
+            rows, ["Направляющая часть", "Горизонтальная часть", "Длина ствола, м", "Интенсивность, град/10м"]
+        ))
+        layout.addWidget(view)
+
+        def choose(index):
+            self.apply_combination(ranked[index.row()][0], ranked[index.row()][1], directional, horizontal)
+            dialog.accept()
+
+        view.doubleClicked.connect(choose)
+        dialog.exec()
+
+    def apply_combination(self, directional_cls, horizontal_cls, directional, horizontal):
+        """Метод для переключения формы на выбранное сочетание и заполнения пустых полей его страниц"""
+        d_idx = next(idx for idx, cls in profile_dict.items() if cls is directional_cls)
+        h_idx = [Tangential, Descending, Ascending, Undulant].index(horizontal_cls)
+
+        d_inputs = [self.inputs_h1, self.inputs_h2, self.inputs_h3, self.inputs_h4, self.inputs_h5][d_idx]
+        h_inputs = [self.inputs_straight, self.inputs_desc, self.inputs_asc, self.inputs_wave][h_idx]
+        for names, inputs, values in ((directional_cls._PARAMS, d_inputs, directional),
+                                      (HORIZONTAL_FIELDS, h_inputs, horizontal)):
+            for name, le in zip(names, inputs):
+                if not le.text() and name in values:
+                    le.setText(f"{values[name]:g}")
+
+        self.radio_group.button(d_idx).setChecked(True)
+        self.on_horizontal_type_changed(self.radio_group.button(d_idx))
+        self.stem_group.button(h_idx).setChecked(True)
+        self.on_stem_type_changed(self.stem_group.button(h_idx))
+
 # Методы для обработки переключения радиокнопок
     def on_horizontal_type_changed(self, button):
         """Обработчик смены типа направляющей части"""
         index = self.radio_group.id(button)
         self.params_stack.setCurrentIndex(index)
+        self.slider_R1.setEnabled(index > 0)
+        self.update_preview()
 
     def on_stem_type_changed(self, button):
         """Обработчик смены типа горизонтального профиля"""
         index = self.stem_group.id(button)
         self.stacked_stem.setCurrentIndex(index)
+        self.update_preview()
 
     def on_confirm_horizontal(self):
         
         try:
             idx_nav, vals_nav, idx_horz, vals_horz = self.read_params()
+            messages = self.check_params(idx_nav, vals_nav, idx_horz, vals_horz)
+            if messages:
+                QMessageBox.warning(self, "Некорректные параметры", "\n".join(messages))
+                return
+
             directional_profile = self.create_profile(idx_nav, vals_nav, profile_dict)
             horizontal_profile = self.create_horizontal_profile(vals_nav, idx_horz, vals_horz)
-            table_data = self.build_table_data(directional_profile, horizontal_profile)
-
-            dlg = ResultDialog(table_data, self)
+            with np.errstate(all='ignore'):
+                codes = table_reasons(segment_table(directional_profile)) | table_reasons(segment_table(horizontal_profile))
+            if codes:
+                QMessageBox.warning(self, "Некорректные параметры", "\n".join(
+                    MESSAGES[reason] for reason in (Reason.NEGATIVE_INTERVAL, Reason.NOT_FINITE_RESULT) if codes & reason
+                ))
+                return
+
+            # Расчёт ведётся через numpy: деление на ноль и выход из области определения - исключения
+            with np.errstate(divide='raise', invalid='raise'):
+                table_data = self.build_table_data(directional_profile, horizontal_profile)
+                trajectory = Trajectory.from_profiles(directional_profile, horizontal_profile)
+                stations = [("Скважина", station_listing(trajectory))]
+                segments = profile_table(directional_profile, horizontal_profile)
+
+            dlg = ResultDialog(table_data, self, stations=stations, segments=segments)
             dlg.exec()
 
         except Exception as e:
-            from PyQt6.QtWidgets import QMessageBox
             QMessageBox.warning(self, "Ошибка", f"Ошибка при вычислениях:\n{e}")
         
     
+    def check_params(self, idx_nav, vals_nav, idx_horz, vals_horz):
+        """Метод для проверки областей определения параметров обеих частей профиля; возвращает тексты нарушений"""
+        directional_cls = profile_dict[idx_nav]
+        horizontal_cls = [Tangential, Descending, Ascending, Undulant][idx_horz]
+        # Недостающие параметры горизонтальной части create_horizontal_profile заполняет нулями
+        horizontal = dict(zip(('H', 'A', 'a'), vals_nav))
+        horizontal.update(zip(HORIZONTAL_FIELDS, list(vals_horz) + [0.0] * (len(HORIZONTAL_FIELDS) - len(vals_horz))))
+        # Правила H, A, a общие для обеих частей - повторяющиеся тексты выводятся один раз
+        return list(dict.fromkeys(explain(directional_cls, **dict(zip(directional_cls._PARAMS, vals_nav)))
+                                  + explain(horizontal_cls, **horizontal)))
+
     def read_params(self):
         def safe_float(text):
             try:
@@ -335,8 +541,9 @@ class Horizontal_Well(QWidget):
         horiz_intervals = hp.lengths_of_the_intervals if hasattr(hp, 'lengths_of_the_intervals') else []
         horiz_intensities = hp.intensities if hasattr(hp, 'intensities') else []
 
-        interval_len = horiz_intervals[0] if len(horiz_intervals) > 0 else None
-        intensity = horiz_intensities[0] if len(horiz_intensities) > 0 else None
+        # Волнообразный участок состоит из многих дуг: длина - суммарная, интенсивность - наибольшая по модулю
+        interval_len = sum(horiz_intervals) if len(horiz_intervals) > 0 else None
+        intensity = max(horiz_intensities, key=abs) if len(horiz_intensities) > 0 else None
 
         rows.append([
             "Горизонтальный участок",
@@ -351,13 +558,12 @@ class Horizontal_Well(QWidget):
         return rows
 
 class ResultDialog(QDialog):
-    def __init__(self, table_data, parent=None):
+    def __init__(self, table_data, parent=None, stations=None, segments=None):
         super().__init__(parent)
         self.setWindowTitle("Результаты расчёта профиля")
-        self.resize(950, 220)
+        self.resize(950, 220 if not stations else 600)
         layout = QVBoxLayout(self)
 
-        self.table = QTableWidget(len(table_data), 7)
         self.headers = [
             "Номер участка",
             "Глубина по вертикали, м",
@@ -367,23 +573,87 @@ class ResultDialog(QDialog):
             "Зенитный угол, град.",
             "Интенсивность искривления, град./10м"
         ]
-        self.table.setHorizontalHeaderLabels(self.headers)
-
-        for row_idx, row_data in enumerate(table_data):
-            for col_idx, val in enumerate(row_data):
-                item = QTableWidgetItem(val)
-                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                self.table.setItem(row_idx, col_idx, item)
-
-        self.table.resizeColumnsToContents()
-        layout.addWidget(self.table)
+        self.table = self.create_view(ArrayTableModel(np.array(table_data, dtype=object).reshape(-1, 7), self.headers))
+
+        # Поинтервальная таблица и (если переданы) станции скважин с шагом 1 м
+        if stations:
+            tabs = QTabWidget()
+            tabs.addTab(self.table, "Участки")
+            self.stations_table = self.create_view(StationTableModel(stations))
+            tabs.addTab(self.stations_table, "Станции")
+            layout.addWidget(tabs)
+        else:
+            layout.addWidget(self.table)
+
+        buttons = QHBoxLayout()
+        buttons.addStretch(1)
+        # Двоичный файл хранит значения без округления (таблица участков и станции)
+        if segments is not None:
+            btn_binary = QPushButton("Сохранить в двоичный файл")
+            btn_binary.clicked.connect(self.on_save_binary)
+            buttons.addWidget(btn_binary)
+        if stations:
+            btn_export = QPushButton("Экспорт станций...")
+            btn_export.clicked.connect(self.on_export_stations)
+            buttons.addWidget(btn_export)
         btn_excel = QPushButton("Открыть файл с результатами")
         btn_excel.clicked.connect(self.on_open_excel)
-        layout.addWidget(btn_excel, alignment=Qt.AlignmentFlag.AlignRight)
-        self.table.horizontalHeader().setDefaultSectionSize(120)     
-        self.table.horizontalHeader().setStretchLastSection(True) 
+        buttons.addWidget(btn_excel)
+        layout.addLayout(buttons)
         self._excel_path = "results.xlsx"
+        self._binary_path = "results.dnr"
         self._table_data = table_data
+        self._segments = segments
+        self._stations = stations
+
+    @staticmethod
+    def create_view(model):
+        """Метод для создания представления таблицы: строки фиксированной высоты, без объектов ячеек"""
+        view = QTableView()
+        view.setModel(model)
+        view.verticalHeader().setDefaultSectionSize(view.fontMetrics().height() + 8)
+        view.verticalHeader().setSectionResizeMode(view.verticalHeader().ResizeMode.Fixed)
+        view.horizontalHeader().setDefaultSectionSize(120)
+        view.horizontalHeader().setStretchLastSection(True)
+        view.setWordWrap(False)
+        return view
+
+    def on_save_binary(self):
+        """Обработчик кнопки сохранения: скважина дописывается в двоичный файл результатов"""
+        name, stations = self._stations[0] if self._stations else ("Скважина", None)
+        try:
+            count = append_results(self._binary_path, [(name, self._segments, stations)])
+        except (OSError, ValueError) as e:
+            QMessageBox.warning(self, "Ошибка", f"Не удалось сохранить результаты:\n{e}")
+            return
+        QMessageBox.information(self, "Сохранение", f"Результаты сохранены в {self._binary_path} (скважин в файле: {count})")
+
+    def on_export_stations(self):
+        """Обработчик кнопки экспорта станций: потоковая запись в CSV, XLSX или LAS по выбранному расширению"""
+        path, _ = QFileDialog.getSaveFileName(
+            self, "Экспорт станций", "stations.csv", "CSV (*.csv);;Excel (*.xlsx);;LAS (*.las)"
+        )
+        if not path:
+            return
+
+        names = ('MD', 'TVD', 'VS', 'INC', 'DLS')
+        if path.lower().endswith('.las'):
+            # LAS - формат одной скважины
+            options = {'curves': LAS_CURVES + (('DLS', 'DEG/10M', 'Интенсивность искривления'),),
+                       'well': self._stations[0][0]}
+        else:
+            options = {'label': 'WELL'}
+        try:
+            with open_writer(path, names, **options) as writer:
+                for name, stations in self._stations:
+                    for start in range(0, len(stations), CHUNK_ROWS):
+                        writer.write(stations[start:start + CHUNK_ROWS], name)
+        except (OSError, ValueError) as e:
+            QMessageBox.warning(self, "Ошибка", f"Не удалось записать файл:\n{e}")
+            return
+        QMessageBox.information(
+            self, "Экспорт станций", f"Записано строк: {writer.rows} ({writer.rows_per_second:,.0f} строк/с)"
+        )
 
     def on_open_excel(self):
         import numpy as np
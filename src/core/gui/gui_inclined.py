@@ -1,8 +1,22 @@
 from PyQt6.QtWidgets import (
     QWidget, QLabel, QPushButton, QRadioButton, QFormLayout, QScrollArea,
-    QLineEdit, QVBoxLayout, QGridLayout, QStackedWidget, QButtonGroup, QDialog, QTableWidget, QTableWidgetItem, QVBoxLayout
+    QLineEdit, QVBoxLayout, QGridLayout, QStackedWidget, QButtonGroup, QMessageBox
 )
 from PyQt6.QtCore import Qt
+from src.core.calculations.inclined_wells import TangentialThreeInterval, TangentialFourInterval, JShaped, SShaped
+from src.core.calculations.batch import segment_table, table_reasons, DEPTH, BORE, INTERVAL, DISLOCATION, ANGLE, INTENSITY
+from src.core.calculations.validation import MESSAGES, Reason, explain
+from src.core.calculations.trajectory import Trajectory
+from src.core.gui.gui_horizontal import ResultDialog
+from src.core.gui.table_models import station_listing
+import numpy as np
+
+profile_dict = {
+    0: TangentialThreeInterval,
+    1: TangentialFourInterval,
+    2: JShaped,
+    3: SShaped
+}
 
 class Inclined_Well(QWidget):
     def __init__(self):
@@ -62,13 +76,14 @@ class Inclined_Well(QWidget):
         L_v = "Длина вертикального участка, м"
         R2 = "Радиус кривизны 2-го участка, м"
         a1 = "Начальный зенитный угол, град"
+        a_t = "Зенитный угол на проектной глубине, град"
         R3 = "Радиус кривизны 3-го участка, м"
         R4 = "Радиус кривизны 4-го участка, м"
 
 
         # Создаем страницы с полями для разных типов направляющей части
         page1, self.inputs_h1 = create_params_page([H, A, H1, L_v, R2])  
-        page2, self.inputs_h2 = create_params_page([H, A, H1, L_v, R2, a1, R3])                   
+        page2, self.inputs_h2 = create_params_page([H, A, H1, L_v, R2, a_t, R3])                   
         page3, self.inputs_h3 = create_params_page([H, A, H1, L_v, R2, a1, R4])       
         page4, self.inputs_h4 = create_params_page([H, A, H1, L_v, R2, a1, R4])      
 
@@ -84,7 +99,7 @@ class Inclined_Well(QWidget):
         grid.addWidget(back, 9, 0)
 
         finish = QPushButton("Готово")
-        # finish.clicked.connect(self.on_confirm_horizontal)
+        finish.clicked.connect(self.on_confirm_inclined)
         grid.addWidget(finish, 9, 1, alignment=Qt.AlignmentFlag.AlignRight)
 
         # --- Оборачиваем все это в QScrollArea ---
@@ -107,21 +122,44 @@ class Inclined_Well(QWidget):
         self.params_stack.setCurrentIndex(index)
 
 
-    def on_confirm_horizontal(self):
-        
-        try:
-            idx_nakl, vals_nakl = self.read_params()
-            horizontal_profile = self.create_horizontal_profile(idx_nakl, vals_nakl)
-            table_data = self.build_table_data(horizontal_profile)
+    def on_confirm_inclined(self):
 
-            dlg = ResultDialog(table_data, self)
+        try:
+            idx, vals = self.read_params()
+            messages = self.check_params(idx, vals)
+            if messages:
+                QMessageBox.warning(self, "Некорректные параметры", "\n".join(messages))
+                return
+
+            profile = self.create_profile(idx, vals)
+            with np.errstate(all='ignore'):
+                codes = table_reasons(segment_table(profile))
+            if codes:
+                QMessageBox.warning(self, "Некорректные параметры", "\n".join(
+                    MESSAGES[reason] for reason in (Reason.NEGATIVE_INTERVAL, Reason.NOT_FINITE_RESULT) if codes & reason
+                ))
+                return
+
+            # Расчёт ведётся через numpy: деление на ноль и выход из области определения - исключения
+            with np.errstate(divide='raise', invalid='raise'):
+                table_data = self.build_table_data(profile)
+                trajectory = Trajectory.from_profiles(profile)
+                stations = [("Скважина", station_listing(trajectory))]
+
+            dlg = ResultDialog(table_data, self, stations=stations, segments=segment_table(profile))
             dlg.exec()
 
         except Exception as e:
-            from PyQt6.QtWidgets import QMessageBox
             QMessageBox.warning(self, "Ошибка", f"Ошибка при вычислениях:\n{e}")
         
     
+    def check_params(self, idx, vals):
+        """Метод для проверки области определения параметров профиля; возвращает тексты нарушений"""
+        profile_cls = profile_dict.get(idx)
+        if profile_cls is None:
+            raise ValueError("Неверный тип профиля")
+        return explain(profile_cls, **dict(zip(profile_cls._PARAMS, vals)))
+
     def read_params(self):
         def safe_float(text):
             try:
@@ -138,140 +176,31 @@ class Inclined_Well(QWidget):
             vals_nakl = [safe_float(le.text()) for le in self.inputs_h3]
         elif idx_nakl == 3:
             vals_nakl = [safe_float(le.text()) for le in self.inputs_h4]
-        elif idx_nakl == 4:
-            vals_nakl = [safe_float(le.text()) for le in self.inputs_h5]
         else:
             vals_nakl = []
 
         return idx_nakl, vals_nakl
 
+    def create_profile(self, idx, vals):
+        # Поля ввода каждой страницы идут в порядке параметров _PARAMS класса профиля
+        profile_cls = profile_dict.get(idx)
+        if profile_cls:
+            return profile_cls(*vals)
+        else:
+            raise ValueError("Неверный тип профиля")
 
-    
-    def create_horizontal_profile(self, nav_vals, idx, vals):
-
-        # Безопасно достаем H, A, a (если есть)
-        H = nav_vals[0] if len(nav_vals) > 0 else 0
-        A = nav_vals[1] if len(nav_vals) > 1 else 0
-        a = nav_vals[2] if len(nav_vals) > 2 else 0
-
-        # Дополняем vals (от пользователя из горизонтальной части) недостающими параметрами
-        # vals обычно содержит только введенные параметры от GUI (могут быть 1-4), докомплектуем до 7
-        # Позиции: H, A, a, S_l, T1, T2, R1
-        # Для параметров, которые не вводят, подставляем 0 по умолчанию
-        S_l = vals[0] if len(vals) > 0 else 0
-        T1 = vals[1] if len(vals) > 1 else 0
-        T2 = vals[2] if len(vals) > 2 else 0
-        R1 = vals[3] if len(vals) > 3 else 0
-
-        full_vals = [H, A, a, S_l, T1, T2, R1]
-
-        # if idx == 0:  # Tangential
-        #     profile = Tangential(*full_vals)
-        # elif idx == 1:  # Descending
-        #     profile = Descending(*full_vals)
-        # elif idx == 2:  # Ascending
-        #     profile = Ascending(*full_vals)
-        # elif idx == 3:  # Undulant (волнообразный)
-        #     profile = Undulant(*full_vals)
-        # else:
-        #     raise ValueError("Неверный тип горизонтального профиля")
-
-        # return profile
-
-
-    
-    def build_table_data(self, directional_profile, horizontal_profile):
+    def build_table_data(self, profile):
         def format_float(val):
             try:
                 return f"{val:.2f}" if val is not None else ""
             except Exception:
                 return ""
 
-        dp = directional_profile
-        hp = horizontal_profile
-
+        table = segment_table(profile)
         rows = []
+        for i, row in enumerate(table):
+            rows.append([str(i + 1)] + [format_float(row[column]) for column in (DEPTH, BORE, INTERVAL, DISLOCATION, ANGLE, INTENSITY)])
 
-        # Данные направляющей части
-        depths = getattr(dp, 'depth', getattr(dp, 'depths', []))
-        lengths = getattr(dp, 'lengths_of_the_bores', [])
-        intervals = getattr(dp, 'lengths_of_the_intervals', [])
-        offsets = getattr(dp, 'dislocations', [])
-        angles = getattr(dp, 'angles', [])
-        intensities = getattr(dp, 'intensities', [])
-
-        for i in range(len(depths)):
-            rows.append([
-                str(i + 1),
-                format_float(depths[i] if i < len(depths) else None),
-                format_float(lengths[i] if i < len(lengths) else None),
-                format_float(intervals[i] if i < len(intervals) else None),
-                format_float(offsets[i] if i < len(offsets) else None),
-                format_float(angles[i] if i < len(angles) else None),
-                format_float(intensities[i] if i < len(intensities) else None),
-            ])
-
-        # --- Горизонтальный участок ---
-
-        last_length = lengths[-1] if lengths else 0
-        L_h = hp.L_h if hp.L_h is not None else 0
-
-        horiz_total_length = last_length + L_h
-
-        stem_idx = self.stacked_stem.currentIndex()
-        if stem_idx == 0:
-            zenith_angle = angles[-1] if angles else 0
-        else:
-            zenith_angle = hp.a_h if hp.a_h is not None else 0
-
-        # Для других параметров берем соответствующие свойтва, с обработкой отсутствия данных
-        horiz_depth = hp.H_h if hasattr(hp, 'H_h') else None
-        horiz_offset = hp.A_h if hasattr(hp, 'A_h') else None
-        horiz_intervals = hp.lengths_of_the_intervals if hasattr(hp, 'lengths_of_the_intervals') else []
-        horiz_intensities = hp.intensities if hasattr(hp, 'intensities') else []
-
-        interval_len = horiz_intervals[0] if len(horiz_intervals) > 0 else None
-        intensity = horiz_intensities[0] if len(horiz_intensities) > 0 else None
-
-        rows.append([
-            "Горизонтальный участок",
-            format_float(horiz_depth),
-            format_float(horiz_total_length),
-            format_float(interval_len),
-            format_float(horiz_offset),
-            format_float(zenith_angle),
-            format_float(intensity)
-        ])
-
+        # Последний участок - продолжение ствола от проектной до конечной глубины
+        rows[-1][0] = "До конечной глубины"
         return rows
-
-class ResultDialog(QDialog):
-    def __init__(self, table_data, parent=None):
-        super().__init__(parent)
-        self.setWindowTitle("Результаты расчёта профиля")
-        self.resize(950, 220)
-        layout = QVBoxLayout(self)
-
-        table = QTableWidget(len(table_data), 7)
-        headers = [
-            "Номер участка",
-            "Глубина по вертикали, м",
-            "Длина ствола, м",
-            "Длина интервала, м",
-            "Смещение, м",
-            "Зенитный угол, град.",
-            "Интенсивность искривления, град./10м"
-        ]
-        table.setHorizontalHeaderLabels(headers)
-
-        for row_idx, row_data in enumerate(table_data):
-            for col_idx, val in enumerate(row_data):
-                item = QTableWidgetItem(val)
-                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                table.setItem(row_idx, col_idx, item)
-
-        table.resizeColumnsToContents()
-        layout.addWidget(table)
-        layout.addWidget(QPushButton("Открыть файл с результатами"), alignment=Qt.AlignmentFlag.AlignRight)
-
-
@@ -2,6 +2,7 @@ from PyQt6.QtWidgets import QWidget, QVBoxLayout, QPushButton, QHBoxLayout
 from .gui_horizontal import Horizontal_Well
 from .gui_inclined import Inclined_Well
 import os
+import sys
 
 class Menu(QWidget):
     def __init__(self):
@@ -35,7 +36,7 @@ class Menu(QWidget):
 
     def open_inclined(self):
         # сохраняем в атрибут, чтобы объект не был сборщиком уничтожен
-        self._directional_win = Directional_Well()
+        self._directional_win = Inclined_Well()
         self._directional_win.show()
 
     def open_excel_horiz(self):
@@ -0,0 +1,85 @@
+import numpy as np
+from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg
+from matplotlib.figure import Figure
+
+
+class ProfileCanvas(FigureCanvasQTAgg):
+    """
+    Встраиваемый в Qt график профиля скважины с инкрементальной перерисовкой.
+    Линии направляющей и горизонтальной частей создаются один раз; при изменении
+    параметров у них обновляются данные, а на экран выводятся только эти линии
+    поверх сохранённого фона (blitting). Полная перерисовка выполняется лишь
+    при выходе профиля за текущие границы осей или изменении размера окна.
+    """
+
+    def __init__(self, parent=None):
+        self.figure = Figure(figsize=(5, 6), tight_layout=True)
+        super().__init__(self.figure)
+        self.setParent(parent)
+
+        self.axes = self.figure.add_subplot()
+        self.axes.set_xlabel("Смещение, м")
+        self.axes.set_ylabel("Глубина по вертикали, м")
+        self.axes.grid(True, alpha=0.3)
+
+        self.lines = [
+            self.axes.plot([], [], linewidth=2.3, animated=True, label='Направляющая часть')[0],
+            self.axes.plot([], [], linewidth=2.4, animated=True, label='Горизонтальный участок')[0]
+        ]
+        self.axes.legend(loc='lower left', fontsize=9)
+
+        self._background = None
+        self.mpl_connect('draw_event', self.on_draw)
+
+    def on_draw(self, event):
+        """Обработчик полной перерисовки: сохраняет фон осей и дорисовывает линии профиля"""
+        self._background = self.copy_from_bbox(self.axes.bbox)
+        self.draw_lines()
+
+    def draw_lines(self):
+        for line in self.lines:
+            self.axes.draw_artist(line)
+
+    def set_profile(self, parts):
+        """
+        Метод для обновления графика. parts - список пар массивов (смещение, глубина по вертикали)
+        для направляющей и горизонтальной частей; None скрывает соответствующую линию.
+        """
+        for line, part in zip(self.lines, parts):
+            if part is None:
+                line.set_data([], [])
+            else:
+                offset, depth = part
+                line.set_data(offset, -np.asarray(depth))
+
+        if self._background is None or self.rescale():
+            self.draw()
+            return
+
+        self.restore_region(self._background)
+        self.draw_lines()
+        self.blit(self.axes.bbox)
+
+    def rescale(self):
+        """Метод для подбора границ осей; возвращает True, если границы изменились"""
+        points = [line.get_xydata() for line in self.lines if len(line.get_xdata())]
+        if not points:
+            return False
+        points = np.concatenate(points)
+        (x_min, y_min), (x_max, y_max) = points.min(axis=0), points.max(axis=0)
+
+        (left, right), (bottom, top) = self.axes.get_xlim(), self.axes.get_ylim()
+        width, height = right - left, top - bottom
+        inside = left <= x_min and x_max <= right and bottom <= y_min and y_max <= top
+        # Профиль внутри осей и не сильно уменьшился - границы не меняем, чтобы не сбивать blitting.
+        # Оси равного масштаба подбираются по большему размаху, поэтому и сравнивается больший размах:
+        # узкий профиль по другой оси всегда занимает малую долю осей
+        if inside and max(x_max - x_min, y_max - y_min) > 0.3 * max(width, height):
+            return False
+
+        span = max(x_max - x_min, y_max - y_min, 1.0)
+        margin = 0.1 * span
+        self.axes.set_xlim(x_min - margin, x_min + span + margin)
+        self.axes.set_ylim(y_max - span - margin, y_max + margin)
+        self.axes.set_aspect('equal', adjustable='box')
+        return True
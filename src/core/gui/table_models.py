@@ -0,0 +1,93 @@
+import numpy as np
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex
+
+
+class ArrayTableModel(QAbstractTableModel):
+    """
+    Модель таблицы, читающая значения непосредственно из двумерного массива numpy.
+    Ячейки не хранятся как объекты: текст формируется только для видимых ячеек
+    в момент запроса представлением.
+    Параметры, необходимые для создания объекта:
+    :параметр values: массив формы (строки, колонки), числовой или строковый;
+    :параметр headers: список заголовков колонок;
+    :параметр precision: int, число знаков после запятой для числовых значений;
+    """
+
+    def __init__(self, values, headers, precision=2, parent=None):
+        super().__init__(parent)
+        self._values = np.asarray(values)
+        self._headers = list(headers)
+        self._format = f"{{:.{precision}f}}"
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._values.shape[0]
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._headers)
+
+    def cell_text(self, row, column):
+        """Метод для получения текста ячейки"""
+        value = self._values[row, column]
+        if isinstance(value, (float, np.floating)):
+            return self._format.format(value) if np.isfinite(value) else ""
+        return str(value)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.cell_text(index.row(), index.column())
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return Qt.AlignmentFlag.AlignCenter
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self._headers[section]
+        return str(section + 1)
+
+
+class StationTableModel(ArrayTableModel):
+    """
+    Модель таблицы станций одной или нескольких скважин.
+    Станции всех скважин хранятся в одном массиве, имя скважины для строки
+    определяется бинарным поиском по границам скважин.
+    Параметры, необходимые для создания объекта:
+    :параметр wells: список пар (имя скважины, массив станций формы (n, 5)):
+    длина ствола, глубина по вертикали, смещение, зенитный угол, интенсивность искривления;
+    """
+
+    HEADERS = [
+        "Скважина",
+        "Длина ствола, м",
+        "Глубина по вертикали, м",
+        "Смещение, м",
+        "Зенитный угол, град.",
+        "Интенсивность искривления, град./10м"
+    ]
+
+    def __init__(self, wells, precision=2, parent=None):
+        names = [name for name, _ in wells]
+        arrays = [np.asarray(stations, dtype=np.float64) for _, stations in wells]
+        values = np.concatenate(arrays) if arrays else np.empty((0, len(self.HEADERS) - 1))
+        super().__init__(values, self.HEADERS, precision, parent)
+
+        self._names = names
+        self._starts = np.cumsum([0] + [len(stations) for stations in arrays])[:-1]
+
+    def cell_text(self, row, column):
+        if column == 0:
+            return self._names[np.searchsorted(self._starts, row, side='right') - 1]
+        return super().cell_text(row, column - 1)
+
+
+def station_listing(trajectory, step=1.0):
+    """Функция для расчёта массива станций траектории формы (n, 5) для StationTableModel"""
+    md, tvd, offset, angle = trajectory.stations(step)
+    intensity = np.zeros_like(md)
+    if len(md) > 1:
+        with np.errstate(divide='ignore', invalid='ignore'):
+            intensity[1:] = np.abs(np.diff(angle)) / np.diff(md) * 10
+    return np.column_stack([md, tvd, offset, angle, intensity])
@@ -0,0 +1,2 @@
+from .server import ProfileService, MicroBatcher
+from .client import ServiceClient, load_test
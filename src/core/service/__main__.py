@@ -0,0 +1,24 @@
+import argparse
+import asyncio
+
+from src.core.service.server import ProfileService, BATCH_WINDOW
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Локальный сервис расчёта профилей (HTTP/JSON)")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--processes', type=int, default=None, help="число рабочих процессов")
+    parser.add_argument('--window', type=float, default=BATCH_WINDOW, help="окно объединения запросов, с")
+    args = parser.parse_args(argv)
+
+    service = ProfileService(args.host, args.port, args.processes, args.window)
+    print(f"Сервис расчёта профилей: http://{args.host}:{args.port}")
+    try:
+        asyncio.run(service.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+import argparse
+import asyncio
+import json
+import random
+import time
+
+import numpy as np
+
+
+class ServiceClient:
+    """
+    Класс, описывающий клиента сервиса расчёта профилей на одном постоянном соединении (keep-alive).
+    Параметры, необходимые для создания объекта:
+    :параметр host, port: адрес сервиса;
+    """
+
+    def __init__(self, host='127.0.0.1', port=8765):
+        self.host = host
+        self.port = port
+        self.reader = None
+        self.writer = None
+
+    async def __aenter__(self):
+        self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+        return self
+
+    async def __aexit__(self, *exc):
+        self.writer.close()
+        await self.writer.wait_closed()
+
+    async def request(self, method, path, payload=None):
+        """Метод для отправки запроса; возвращает код ответа, заголовки и тело (bytes)"""
+        body = json.dumps(payload).encode() if payload is not None else b''
+        self.writer.write(
+            f"{method} {path} HTTP/1.1\r\nHost: {self.host}\r\nContent-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n\r\n".encode() + body
+        )
+        await self.writer.drain()
+
+        head = await self.reader.readuntil(b'\r\n\r\n')
+        lines = head.decode('latin-1').split('\r\n')
+        status = int(lines[0].split(' ')[1])
+        headers = {name.strip().lower(): value.strip() for name, value in
+                   (line.split(':', 1) for line in lines[1:] if ':' in line)}
+
+        if headers.get('transfer-encoding') == 'chunked':
+            parts = []
+            while True:
+                size = int((await self.reader.readline()).strip(), 16)
+                data = await self.reader.readexactly(size + 2)
+                if not size:
+                    break
+                parts.append(data[:-2])
+            return status, headers, b''.join(parts)
+        return status, headers, await self.reader.readexactly(int(headers.get('content-length', 0)))
+
+    async def json(self, method, path, payload=None):
+        """Метод для запроса с ответом JSON"""
+        status, _, body = await self.request(method, path, payload)
+        return status, json.loads(body)
+
+
+def random_design(rng):
+    """Функция для создания случайного проекта трёхинтервальной направляющей части для нагрузочного теста"""
+    return {
+        'H': rng.uniform(1500, 3000), 'A': rng.uniform(300, 1500), 'a': rng.uniform(80, 90),
+        'a1': rng.uniform(10, 30), 'R1': rng.uniform(300, 900)
+    }
+
+
+async def load_test(host='127.0.0.1', port=8765, requests=2000, concurrency=32, repeat=0.0, seed=0):
+    """
+    Функция для нагрузочного теста точки /solve: concurrency соединений отправляют
+    requests запросов в сумме; доля repeat запросов повторяет уже отправленные проекты
+    (проверка кэша). Возвращает словарь с пропускной способностью и задержками.
+    """
+    rng = random.Random(seed)
+    designs = []
+    for _ in range(requests):
+        if designs and rng.random() < repeat:
+            designs.append(rng.choice(designs))
+        else:
+            designs.append(random_design(rng))
+
+    latencies, errors = [], 0
+    queue = iter(designs)
+
+    async def worker():
+        nonlocal errors
+        async with ServiceClient(host, port) as client:
+            for design in queue:
+                start = time.perf_counter()
+                status, _ = await client.json('POST', '/solve', {'type': 'ThreeInterval', 'params': design})
+                latencies.append(time.perf_counter() - start)
+                errors += status != 200
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    async with ServiceClient(host, port) as client:
+        _, stats = await client.json('GET', '/stats')
+
+    latencies = np.array(latencies) * 1000
+    return {
+        'requests': requests,
+        'errors': errors,
+        'elapsed_s': elapsed,
+        'requests_per_s': requests / elapsed,
+        'latency_ms': dict(zip(('p50', 'p95', 'p99'), np.percentile(latencies, [50, 95, 99]).round(2).tolist())),
+        'server': stats,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Нагрузочный тест сервиса расчёта профилей")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--concurrency', type=int, default=32)
+    parser.add_argument('--repeat', type=float, default=0.0, help="доля повторяющихся проектов")
+    args = parser.parse_args(argv)
+
+    result = asyncio.run(load_test(args.host, args.port, args.requests, args.concurrency, args.repeat))
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+
+
+if __name__ == '__main__':
+    main()
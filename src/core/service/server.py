@@ -0,0 +1,306 @@
+import asyncio
+import json
+import multiprocessing
+import os
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from src.core.calculations.batch import SEGMENT_FIELDS
+from src.core.calculations.log_conversion import format_rows
+from src.core.calculations.validation import describe
+from src.core.service.workers import profile_class, solve_rows, sweep, trajectory_stations
+
+
+# Окно ожидания запросов для объединения в один пакет, с
+BATCH_WINDOW = 0.005
+
+# Наибольшее число проектов в одном пакете рабочего процесса
+MAX_BATCH = 4096
+
+# Число строк в одном фрагменте потокового ответа
+STREAM_ROWS = 5000
+
+STATUS_TEXT = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed', 500: 'Internal Server Error'}
+
+
+class HttpError(Exception):
+    """Исключение, прерывающее обработку запроса с заданным кодом ответа"""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+class MicroBatcher:
+    """
+    Класс, объединяющий одиночные запросы расчёта профиля в пакеты.
+    Запросы одного вида профиля, пришедшие в течение window секунд, рассчитываются одним
+    векторным вызовом в пуле процессов. Результаты хранятся в LRU-кэше по набору параметров,
+    одинаковые одновременные запросы ожидают один и тот же расчёт.
+    """
+
+    def __init__(self, executor, window=BATCH_WINDOW, max_batch=MAX_BATCH, cache_size=100_000):
+        self.executor = executor
+        self.window = window
+        self.max_batch = max_batch
+        self.cache_size = cache_size
+        self.cache = OrderedDict()
+        self.pending = {}
+        self.queues = defaultdict(list)
+        self.timers = {}
+        self.stats = {'requests': 0, 'cache_hits': 0, 'batches': 0, 'rows': 0}
+
+    async def solve(self, type_name, row):
+        """Метод для расчёта одного проекта; возвращает таблицу участков и код причины"""
+        self.stats['requests'] += 1
+        key = (type_name, row)
+        if key in self.cache:
+            self.stats['cache_hits'] += 1
+            self.cache.move_to_end(key)
+            return self.cache[key]
+        if key in self.pending:
+            return await asyncio.shield(self.pending[key])
+
+        future = asyncio.get_running_loop().create_future()
+        self.pending[key] = future
+        queue = self.queues[type_name]
+        queue.append(key)
+        if len(queue) >= self.max_batch:
+            self.flush(type_name)
+        elif type_name not in self.timers:
+            self.timers[type_name] = asyncio.get_running_loop().call_later(self.window, self.flush, type_name)
+        return await asyncio.shield(future)
+
+    def flush(self, type_name):
+        """Метод для отправки накопленного пакета вида type_name в пул процессов"""
+        timer = self.timers.pop(type_name, None)
+        if timer is not None:
+            timer.cancel()
+        keys = self.queues.pop(type_name, [])
+        if keys:
+            asyncio.get_running_loop().create_task(self.run(type_name, keys))
+
+    async def run(self, type_name, keys):
+        self.stats['batches'] += 1
+        self.stats['rows'] += len(keys)
+        try:
+            tables, codes = await asyncio.get_running_loop().run_in_executor(
+                self.executor, solve_rows, type_name, [row for _, row in keys]
+            )
+        except Exception as error:
+            for key in keys:
+                self.pending.pop(key).set_exception(error)
+            return
+
+        for key, table, code in zip(keys, tables, codes):
+            result = (table, int(code))
+            self.cache[key] = result
+            self.pending.pop(key).set_result(result)
+        while len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+
+
+def _json_values(values):
+    """Функция для перевода массива в списки JSON (nan и inf - null)"""
+    values = np.asarray(values, dtype=np.float64)
+    return np.where(np.isfinite(values), values, None).tolist()
+
+
+def _row(profile_cls, params):
+    """Функция для получения набора параметров в порядке _PARAMS из словаря запроса"""
+    missing = [name for name in profile_cls._PARAMS if name not in params]
+    if missing:
+        raise HttpError(400, f"Не заданы параметры: {', '.join(missing)}")
+    try:
+        return tuple(float(params[name]) for name in profile_cls._PARAMS)
+    except (TypeError, ValueError):
+        raise HttpError(400, "Параметры должны быть числами") from None
+
+
+class ProfileService:
+    """
+    Класс, описывающий локальный HTTP/JSON-сервис расчёта профилей.
+    Обработка запросов - asyncio, расчёты - в пуле процессов (через MicroBatcher для расчёта
+    проектов). Точки доступа:
+    POST /solve - таблицы участков: {"type": ..., "params": {...} или [{...}, ...]};
+    POST /stations - станции траектории (CSV, потоково): {"directional": {"type", "params"},
+    "horizontal": {...} (необязательно), "step": 1.0};
+    POST /sweep - карта длин ствола (CSV, потоково): {"type", "fixed", "x": {"name", "values"}, "y": {...}};
+    GET /health, GET /stats - состояние и статистика объединения запросов.
+    """
+
+    def __init__(self, host='127.0.0.1', port=8765, processes=None, window=BATCH_WINDOW):
+        self.host = host
+        self.port = port
+        self.processes = processes or os.cpu_count() or 1
+        self.window = window
+        self.executor = None
+        self.batcher = None
+        self.server = None
+
+    async def start(self):
+        # Рабочие процессы не должны наследовать сокеты соединений: при запуске через fork
+        # в момент обработки первого запроса соединение клиента не закрывалось бы
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+        self.executor = ProcessPoolExecutor(max_workers=self.processes, mp_context=context)
+        self.batcher = MicroBatcher(self.executor, self.window)
+        self.server = await asyncio.start_server(self.handle_connection, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+        return self
+
+    async def stop(self):
+        self.server.close()
+        await self.server.wait_closed()
+        self.executor.shutdown(cancel_futures=True)
+
+    async def serve_forever(self):
+        await self.start()
+        try:
+            async with self.server:
+                await self.server.serve_forever()
+        finally:
+            self.executor.shutdown(cancel_futures=True)
+
+    async def handle_connection(self, reader, writer):
+        """Обработчик соединения: запросы читаются последовательно, пока клиент держит соединение"""
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b'\r\n\r\n')
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    break
+                method, path, headers = _parse_head(head)
+                body = await reader.readexactly(int(headers.get('content-length', 0)))
+                await self.dispatch(writer, method, path, body)
+                if headers.get('connection', '').lower() == 'close':
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def dispatch(self, writer, method, path, body):
+        routes = {
+            ('GET', '/health'): self.health,
+            ('GET', '/stats'): self.statistics,
+            ('POST', '/solve'): self.solve,
+            ('POST', '/stations'): self.stations,
+            ('POST', '/sweep'): self.sweep,
+        }
+        try:
+            handler = routes.get((method, path))
+            if handler is None:
+                raise HttpError(405 if any(route == path for _, route in routes) else 404, f"Нет обработчика {method} {path}")
+            try:
+                payload = json.loads(body) if body else {}
+            except ValueError:
+                raise HttpError(400, "Тело запроса не является JSON") from None
+            await handler(writer, payload)
+        except HttpError as error:
+            await _send_json(writer, {'error': str(error)}, error.status)
+        except ValueError as error:
+            await _send_json(writer, {'error': str(error)}, 400)
+        except Exception as error:
+            await _send_json(writer, {'error': f"{type(error).__name__}: {error}"}, 500)
+
+    async def health(self, writer, payload):
+        await _send_json(writer, {'status': 'ok', 'processes': self.processes})
+
+    async def statistics(self, writer, payload):
+        await _send_json(writer, {**self.batcher.stats, 'cached': len(self.batcher.cache)})
+
+    async def solve(self, writer, payload):
+        type_name = payload.get('type')
+        profile_cls = profile_class(type_name)
+        params = payload.get('params', {})
+        single = isinstance(params, dict)
+        rows = [_row(profile_cls, item) for item in ([params] if single else params)]
+
+        results = await asyncio.gather(*(self.batcher.solve(type_name, row) for row in rows))
+        items = [
+            {'table': _json_values(table), 'code': code, 'reasons': describe(code)}
+            for table, code in results
+        ]
+        response = {'type': type_name, 'fields': SEGMENT_FIELDS}
+        response.update(items[0] if single else {'results': items})
+        await _send_json(writer, response)
+
+    async def stations(self, writer, payload):
+        parts = []
+        for key in ('directional', 'horizontal'):
+            part = payload.get(key)
+            if part:
+                parts.append((part.get('type'), _row(profile_class(part.get('type')), part.get('params', {}))))
+            else:
+                parts.append((None, ()))
+        if parts[0][0] is None:
+            raise HttpError(400, "Не задана направляющая часть")
+        step = float(payload.get('step', 1.0))
+        if not step > 0:
+            raise HttpError(400, "Шаг станций должен быть больше нуля")
+
+        loop = asyncio.get_running_loop()
+        values, code, messages = await loop.run_in_executor(self.executor, trajectory_stations, *parts, step)
+        if code:
+            await _send_json(writer, {'error': '\n'.join(messages), 'code': code, 'reasons': describe(code)}, 400)
+            return
+        await _send_csv(writer, ('md', 'tvd', 'offset', 'angle'), values)
+
+    async def sweep(self, writer, payload):
+        type_name = payload.get('type')
+        profile_cls = profile_class(type_name)
+        x, y = payload.get('x', {}), payload.get('y', {})
+        for axis in (x, y):
+            if axis.get('name') not in profile_cls._PARAMS or not axis.get('values'):
+                raise HttpError(400, "Оси x и y должны содержать имя параметра (name) и значения (values)")
+
+        loop = asyncio.get_running_loop()
+        lengths = await loop.run_in_executor(
+            self.executor, sweep, type_name, payload.get('fixed', {}), x['name'], x['values'], y['name'], y['values']
+        )
+        # Строка ответа - значение y и длины ствола по всем значениям x
+        values = np.column_stack([np.asarray(y['values'], dtype=np.float64), lengths])
+        await _send_csv(writer, [y['name']] + [f"{x['name']}={value:g}" for value in x['values']], values)
+
+
+def _parse_head(head):
+    """Функция для разбора строки запроса и заголовков HTTP"""
+    lines = head.decode('latin-1').split('\r\n')
+    try:
+        method, target, _ = lines[0].split(' ', 2)
+    except ValueError:
+        raise ConnectionError("Некорректная строка запроса") from None
+    headers = {}
+    for line in lines[1:]:
+        if ':' in line:
+            name, value = line.split(':', 1)
+            headers[name.strip().lower()] = value.strip()
+    return method, target.split('?', 1)[0], headers
+
+
+async def _send_json(writer, payload, status=200):
+    body = json.dumps(payload, ensure_ascii=False).encode()
+    writer.write(
+        f"HTTP/1.1 {status} {STATUS_TEXT[status]}\r\nContent-Type: application/json; charset=utf-8\r\n"
+        f"Content-Length: {len(body)}\r\n\r\n".encode() + body
+    )
+    await writer.drain()
+
+
+async def _send_csv(writer, names, values, precision=3):
+    """Функция для потоковой отправки таблицы в CSV фрагментами по STREAM_ROWS строк (chunked)"""
+    writer.write(
+        b"HTTP/1.1 200 OK\r\nContent-Type: text/csv; charset=utf-8\r\nTransfer-Encoding: chunked\r\n\r\n"
+    )
+    chunks = [(','.join(names) + '\n').encode()]
+    chunks += (format_rows(values[start:start + STREAM_ROWS], precision, ',') for start in range(0, len(values), STREAM_ROWS))
+    for chunk in chunks:
+        if chunk:
+            writer.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+            # Ожидание отправки фрагмента ограничивает память при медленном клиенте
+            await writer.drain()
+    writer.write(b"0\r\n\r\n")
+    await writer.drain()
@@ -0,0 +1,61 @@
+import numpy as np
+
+from src.core.calculations.batch import design_map, evaluate_valid, table_reasons
+from src.core.calculations.catalog import DIRECTIONAL_CLASSES, HORIZONTAL_CLASSES
+from src.core.calculations.profile_arrays import ProfileArray
+from src.core.calculations.trajectory import Trajectory, profile_table
+from src.core.calculations.validation import MESSAGES, Reason, explain, validate
+
+
+# Виды профилей, доступные по имени в запросах к сервису
+PROFILE_CLASSES = {**DIRECTIONAL_CLASSES, **HORIZONTAL_CLASSES}
+
+
+def profile_class(name):
+    """Функция для получения класса профиля по имени из запроса"""
+    try:
+        return PROFILE_CLASSES[name]
+    except KeyError:
+        raise ValueError(f"Неизвестный вид профиля: {name}") from None
+
+
+def solve_rows(type_name, rows):
+    """
+    Функция, выполняемая в рабочем процессе: расчёт пакета проектов одного вида.
+    rows - список наборов параметров в порядке _PARAMS. Возвращает таблицы участков
+    (n, k, 7) и коды причин недопустимости по строкам.
+    """
+    designs = ProfileArray.from_rows(profile_class(type_name), rows)
+    return evaluate_valid(designs)
+
+
+def trajectory_stations(directional, horizontal, step):
+    """
+    Функция, выполняемая в рабочем процессе: станции траектории по направляющей и
+    (необязательно) горизонтальной частям. Части задаются парами (имя вида, набор параметров).
+    Перед расчётом параметры проверяются (validation.validate), затем проверяется таблица участков.
+    Возвращает массив формы (n, 4): длина ствола, глубина по вертикали, смещение, зенитный угол,
+    код причин validation.Reason и тексты нарушений; для недопустимого проекта массив - None.
+    """
+    parts, code, messages = [], 0, []
+    for name, params in (directional, horizontal):
+        if name:
+            profile_cls = profile_class(name)
+            values = dict(zip(profile_cls._PARAMS, params))
+            code |= int(validate(profile_cls, **values))
+            messages += explain(profile_cls, **values)
+            parts.append(profile_cls(*params))
+    if code:
+        return None, code, list(dict.fromkeys(messages))
+
+    with np.errstate(all='ignore'):
+        table = profile_table(*parts)
+    code = int(table_reasons(table))
+    if code:
+        return None, code, [MESSAGES[reason] for reason in (Reason.NEGATIVE_INTERVAL, Reason.NOT_FINITE_RESULT) if code & reason]
+    return np.column_stack(Trajectory.from_table(table).stations(step)), 0, []
+
+
+def sweep(type_name, fixed, x_name, x_values, y_name, y_values):
+    """Функция, выполняемая в рабочем процессе: карта длин ствола по сетке двух параметров (см. design_map)"""
+    return design_map(profile_class(type_name), fixed, x_name, np.asarray(x_values), y_name, np.asarray(y_values))
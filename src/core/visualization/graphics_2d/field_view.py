@@ -0,0 +1,39 @@
+import numpy as np
+from matplotlib.collections import LineCollection
+
+
+def well_segments(projection, x, y):
+    """Функция для разбиения координат станций на линии по скважинам (для LineCollection)"""
+    return [np.column_stack(part) for part in zip(projection.split(x), projection.split(y))]
+
+
+def draw_field_overview(projection, plan_axes, section_axes, azimuth, origin=(0.0, 0.0), linewidth=1.2):
+    """
+    Функция для построения обзорных графиков месторождения: план и вертикальный разрез
+    по азимуту azimuth. Все скважины выводятся одной коллекцией линий на каждый график.
+    Возвращает коллекцию линий разреза: при смене азимута достаточно обновить её сегменты.
+    """
+    plan_axes.add_collection(LineCollection(well_segments(projection, *projection.plan()), linewidth=linewidth))
+    plan_axes.set_xlabel("Восток, м")
+    plan_axes.set_ylabel("Север, м")
+    plan_axes.set_aspect('equal', adjustable='datalim')
+    plan_axes.autoscale_view()
+    plan_axes.grid(True, alpha=0.3)
+
+    offset, tvd = projection.section(azimuth, origin)
+    section = LineCollection(well_segments(projection, offset, -tvd), linewidth=linewidth)
+    section_axes.add_collection(section)
+    section_axes.set_xlabel(f"Смещение по азимуту {azimuth:g}°, м")
+    section_axes.set_ylabel("Глубина по вертикали, м")
+    section_axes.autoscale_view()
+    section_axes.grid(True, alpha=0.3)
+    return section
+
+
+def update_section(projection, section, azimuth, origin=(0.0, 0.0)):
+    """Функция для перепроецирования разреза на новый азимут без пересчёта траекторий"""
+    offset, tvd = projection.section(azimuth, origin)
+    section.set_segments(well_segments(projection, offset, -tvd))
+    section.axes.set_xlabel(f"Смещение по азимуту {azimuth:g}°, м")
+    section.axes.relim()
+    section.axes.autoscale_view()
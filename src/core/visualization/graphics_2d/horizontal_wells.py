@@ -1,5 +1,7 @@
 from src.core.calculations.horizontal_wells.directional_profiles import *
 from src.core.calculations.horizontal_wells.horizontal_profiles import *
+from src.core.calculations.inclined_wells.inclined_profiles import InclinedProfile
+from math import sin, cos, atan, acos, sqrt, pi
 import matplotlib.pyplot as plt
 import numpy as np
 
@@ -17,7 +19,7 @@ class ProfileGraphic(ABC):
         self.profile, self.axes = profile, axes
 
         x0, y0 = start_point
-        x = [x0] + profile.dislocations
+        x = [x0] + list(profile.dislocations)
         y = [y0] + list(map(lambda depth: -depth, profile.depths))
 
         self.x, self.y = x, y
@@ -49,6 +51,7 @@ class ProfileGraphic(ABC):
         """Метод для добавления участков профиля скважины на график"""
 
         for i in range(len(self.pairs_of_points)):
+            self.segment = i
             if not self.radii[i]:
                 self.draw_straight(*self.pairs_of_points[i], linewidth=2.3)
             else:
@@ -58,10 +61,10 @@ class ProfileGraphic(ABC):
 
 
 class DirectionalProfilesGraphic(ProfileGraphic):
-    """Класс, описывающий график направляющей части профиля скважины"""
+    """Класс, описывающий график направляющей части профиля или профиля наклонно направленной скважины"""
 
     def __init__(self, direction_profile, axes):
-        if not isinstance(direction_profile, DirectionalProfile):
+        if not isinstance(direction_profile, (DirectionalProfile, InclinedProfile)):
             raise TypeError(f"Unsupported profile type: {type(direction_profile)}")
         super().__init__(direction_profile, axes)
 
@@ -72,6 +75,16 @@ class DirectionalProfilesGraphic(ProfileGraphic):
 
         y1, y2 = -y1, -y2
 
+        angles = self.profile.angles
+        if angles[self.segment] < angles[self.segment - 1]:
+            # Дуга снижения зенитного угла (профили наклонно направленных скважин) строится по углам в узлах
+            a0, a1 = np.radians(angles[self.segment - 1]), np.radians(angles[self.segment])
+            fi = np.linspace(a0, a1, 100)
+            x = x1 - radius * (np.cos(a0) - np.cos(fi))
+            y = -(y1 - radius * (np.sin(fi) - np.sin(a0)))
+            self.axes.plot(x, y, label='Снижение зенитного угла', linewidth=linewidth)
+            return
+
         angle_b1 = atan((x2 - x1) / (y2 - y1))
         angle_b2 = atan((y2 - y1) / (x2 - x1))
         angle_y = acos(sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2) / (2 * radius))
@@ -124,10 +137,20 @@ class HorizontalProfilesGraphic(ProfileGraphic):
             label = 'Горизонтальный участок (нисходящий)'
 
         if isinstance(self.profile, Undulant):
-
-            #Код
-
-            label = 'Горизонтальный участок (Волнообразный)'
+            # Дуги волны строятся по зенитным углам в начале и в конце участка
+            angles = self.profile.angles
+            a0 = np.radians(angles[self.segment - 1] if self.segment else self.profile.a)
+            a1 = np.radians(angles[self.segment])
+            sign = 1 if a1 > a0 else -1
+            fi = np.linspace(a0, a1, 100)
+
+            x = x1 + sign * radius * (np.cos(a0) - np.cos(fi))
+            y = -(y1 + sign * radius * (np.sin(fi) - np.sin(a0)))
+
+            # Волна состоит из десятков дуг - в легенду попадает только первая
+            label = 'Горизонтальный участок (Волнообразный)' if self.segment == 0 else None
+            self.axes.plot(x, y, label=label, linewidth=linewidth)
+            return
 
         x = np.linspace(x1, x2, 100)
         y = circle(x)
@@ -0,0 +1,105 @@
+import hashlib
+import logging
+import os
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+
+from matplotlib.figure import Figure
+
+from src.core.visualization.graphics_2d.horizontal_wells import DirectionalProfilesGraphic, HorizontalProfilesGraphic
+
+
+# Версия оформления графиков: входит в хэш, чтобы изменение оформления не оставляло устаревших файлов
+RENDER_VERSION = 1
+FIGURE_SIZE = (12, 7)
+DPI = 100
+
+# Фигура рабочего процесса: создаётся один раз и очищается перед каждой скважиной
+_figure = None
+
+
+def profile_key(directional_profile, horizontal_profile=None, fmt='png'):
+    """Функция для расчёта хэша параметров профиля и настроек построения (имя файла графика)"""
+    parts = [str(RENDER_VERSION), str(FIGURE_SIZE), str(DPI), fmt]
+    for profile in (directional_profile, horizontal_profile):
+        if profile is not None:
+            parts.append(type(profile).__name__)
+            parts.extend(repr(float(getattr(profile, name))) for name in profile._PARAMS)
+    return hashlib.sha1('|'.join(parts).encode()).hexdigest()[:16]
+
+
+def _init_worker():
+    """Функция инициализации рабочего процесса: построение без экрана на Agg и одна фигура на процесс"""
+    global _figure
+    # Предупреждения об осях и легенде в пакетном режиме не нужны
+    logging.getLogger('matplotlib').setLevel(logging.ERROR)
+    warnings.simplefilter('ignore', UserWarning)
+    _figure = Figure(figsize=FIGURE_SIZE, dpi=DPI)
+    _figure.subplots(1, 2)
+
+
+def _render(task):
+    """Функция построения графика одной скважины в рабочем процессе; возвращает путь и признак ошибки"""
+    name, directional_profile, horizontal_profile, path = task
+    if _figure is None:
+        _init_worker()
+
+    directional_axes, horizontal_axes = _figure.axes
+    directional_axes.clear()
+    horizontal_axes.clear()
+    try:
+        DirectionalProfilesGraphic(directional_profile, directional_axes).draw()
+        if horizontal_profile is not None:
+            HorizontalProfilesGraphic(horizontal_profile, horizontal_axes).draw()
+        horizontal_axes.set_visible(horizontal_profile is not None)
+        _figure.suptitle(name)
+        _figure.savefig(path)
+    except Exception as e:
+        return path, f"{name}: {e}"
+    return path, None
+
+
+class RenderReport:
+    """
+    Класс, описывающий результат пакетного построения графиков.
+    :атрибут paths: пути к файлам графиков в порядке исходного списка скважин;
+    :атрибут rendered: количество построенных графиков;
+    :атрибут skipped: количество графиков, уже имевшихся на диске;
+    :атрибут errors: список сообщений об ошибках построения;
+    """
+
+    __slots__ = ('paths', 'rendered', 'skipped', 'errors')
+
+    def __init__(self, paths, rendered, skipped, errors):
+        self.paths = paths
+        self.rendered = rendered
+        self.skipped = skipped
+        self.errors = errors
+
+
+def render_profiles(wells, directory, fmt='png', processes=None, chunksize=8):
+    """
+    Функция для пакетного построения графиков профилей без вывода на экран.
+    wells - список кортежей (имя, направляющая часть, горизонтальная часть или None).
+    Графики распределяются по пулу процессов, каждый процесс переиспользует одну фигуру.
+    Имя файла содержит хэш параметров профиля: если файл уже есть, график не строится заново.
+    """
+    os.makedirs(directory, exist_ok=True)
+
+    paths, tasks = [], []
+    for name, directional_profile, horizontal_profile in wells:
+        key = profile_key(directional_profile, horizontal_profile, fmt)
+        path = os.path.join(directory, f"{name}_{key}.{fmt}")
+        paths.append(path)
+        if not os.path.exists(path):
+            tasks.append((name, directional_profile, horizontal_profile, path))
+
+    errors = []
+    if tasks:
+        processes = min(processes or os.cpu_count() or 1, len(tasks))
+        with ProcessPoolExecutor(max_workers=processes, initializer=_init_worker) as executor:
+            for _, error in executor.map(_render, tasks, chunksize=chunksize):
+                if error:
+                    errors.append(error)
+
+    return RenderReport(paths, len(tasks) - len(errors), len(paths) - len(tasks), errors)
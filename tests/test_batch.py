@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+
+from src.core.calculations.batch import evaluate_valid, feasible, pad_segments, segment_table
+from src.core.calculations.catalog import DIRECTIONAL_CLASSES, HORIZONTAL_CLASSES
+from src.core.calculations.inclined_wells import inclined_profiles
+from src.core.calculations.profile_arrays import ProfileArray
+
+
+# Диапазоны случайных параметров проектов
+RANGES = {
+    'H': (1500, 3500), 'A': (300, 1500), 'a': (30, 89), 'a1': (5, 25), 'a3': (30, 45),
+    'R1': (200, 800), 'R3': (200, 800), 'R4': (200, 800), 'R2': (200, 800),
+    'S_l': (100, 800), 'T1': (1, 10), 'T2': (1, 10), 'H1': (3500, 4000), 'L_v': (100, 500),
+}
+
+CLASSES = [*DIRECTIONAL_CLASSES.values(), *HORIZONTAL_CLASSES.values(),
+           *inclined_profiles.InclinedProfile.__subclasses__()]
+
+
+def random_designs(profile_cls, size=200, seed=0):
+    rng = np.random.default_rng(seed)
+    columns = {name: rng.uniform(*RANGES[name], size) for name in profile_cls._PARAMS}
+    return ProfileArray.from_columns(profile_cls, **columns)
+
+
+@pytest.mark.parametrize('profile_cls', CLASSES, ids=lambda cls: f"{cls.__module__.rsplit('.', 1)[-1]}.{cls.__name__}")
+def test_batch_table_matches_scalar_profiles(profile_cls):
+    designs = random_designs(profile_cls)
+    table, codes = evaluate_valid(designs)
+    valid = np.flatnonzero((codes == 0) & feasible(table))
+    assert len(valid) > 0
+
+    for index in valid[:50]:
+        scalar = segment_table(designs.profile(index))
+        np.testing.assert_allclose(table[index], pad_segments(scalar, table.shape[1]), rtol=1e-9, atol=1e-9)
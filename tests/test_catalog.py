@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+
+from src.core.calculations.catalog import KDTree, ProfileCatalog
+from src.core.calculations.horizontal_wells.directional_profiles import TwoInterval, ThreeInterval
+from src.core.calculations.horizontal_wells.horizontal_profiles import Tangential
+from src.core.calculations.solver import WarmStartSolver
+
+
+@pytest.fixture
+def points():
+    rng = np.random.default_rng(0)
+    return rng.uniform(0, 1000, (2000, 5))
+
+
+@pytest.mark.parametrize('leaf_size', [1, 8, 32])
+def test_query_range_matches_brute_force(points, leaf_size):
+    tree = KDTree(points, leaf_size=leaf_size)
+    rng = np.random.default_rng(1)
+    for _ in range(50):
+        lower = rng.uniform(0, 800, points.shape[1])
+        upper = lower + rng.uniform(0, 600, points.shape[1])
+        expected = np.flatnonzero(((points >= lower) & (points <= upper)).all(axis=1))
+        np.testing.assert_array_equal(np.sort(tree.query_range(lower, upper)), expected)
+
+
+@pytest.mark.parametrize('k', [1, 5, 20])
+def test_query_nearest_matches_brute_force(points, k):
+    tree = KDTree(points, leaf_size=16)
+    rng = np.random.default_rng(2)
+    for weights in (None, np.array([1.0, 0.5, 2.0, 0.0, 1.0])):
+        w = np.ones(points.shape[1]) if weights is None else weights
+        for _ in range(30):
+            point = rng.uniform(-100, 1100, points.shape[1])
+            expected = np.sort(np.sqrt((((points - point) * w) ** 2).sum(axis=1)))[:k]
+            distances, index = tree.query_nearest(point, k, weights)
+            np.testing.assert_allclose(distances, expected)
+            np.testing.assert_allclose(np.sqrt((((points[index] - point) * w) ** 2).sum(axis=1)), distances)
+
+
+def test_query_nearest_more_than_points():
+    points = np.arange(6, dtype=np.float64).reshape(3, 2)
+    distances, index = KDTree(points).query_nearest([0.0, 0.0], k=5)
+    np.testing.assert_array_equal(index, [0, 1, 2])
+
+
+def test_catalog_nearest_weights_angle():
+    catalog = ProfileCatalog()
+    catalog.add(TwoInterval(2500, 800, 60), Tangential(2500, 800, 60, 500), 'a=60')
+    catalog.add(TwoInterval(2500, 805, 88), Tangential(2500, 805, 88, 500), 'a=88')
+
+    # Расхождение 5 м по смещению ближе, чем 28 градусов по углу
+    distances, index = catalog.nearest(2, H=2500, A=800, a=88)
+    assert [catalog.names[i] for i in index] == ['a=88', 'a=60']
+    np.testing.assert_allclose(distances, [5.0, 280.0])
+
+
+def test_solver_seed_weights_angle():
+    solver = WarmStartSolver(ThreeInterval, 'R1', 'H', 500.0)
+    solver.add({'H': 2500, 'A': 800, 'a': 60}, 0.0, 400.0)
+    solver.add({'H': 2500, 'A': 805, 'a': 88}, 0.0, 600.0)
+    assert solver.seed({'H': 2500, 'A': 800, 'a': 88}) == 1
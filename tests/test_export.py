@@ -0,0 +1,88 @@
+import numpy as np
+import pytest
+from openpyxl import load_workbook
+
+from src.core.calculations.batch import SEGMENT_FIELDS, evaluate_valid
+from src.core.calculations.export import (
+    CsvWriter, LasWriter, TABLE_COLUMNS, export_stations, export_tables, open_table_writer, open_writer
+)
+from src.core.calculations.horizontal_wells.directional_profiles import ThreeInterval
+from src.core.calculations.log_conversion import read_header, read_log_chunks
+from src.core.calculations.profile_arrays import ProfileArray
+from src.core.calculations.trajectory import Trajectory
+
+
+@pytest.fixture
+def trajectory():
+    return Trajectory.from_profiles(ThreeInterval(2500, 800, 60, 20, 400))
+
+
+@pytest.fixture
+def designs():
+    return ProfileArray.from_columns(
+        ThreeInterval, H=2500, A=[800, 900, 1000, 5000], a=60, a1=20, R1=[400, 400, 500, 400]
+    )
+
+
+def test_csv_stations_match_trajectory(tmp_path, trajectory):
+    path = tmp_path / 'stations.csv'
+    with CsvWriter(path, ('MD', 'TVD', 'VS', 'INC'), label='WELL') as writer:
+        rows = export_stations(writer, [('Скв-1', trajectory), ('Скв-2', trajectory)], step=10.0, chunk=50)
+
+    lines = path.read_text(encoding='utf-8').splitlines()
+    assert lines[0] == 'WELL,MD,TVD,VS,INC'
+    assert len(lines) == rows + 1
+    md, tvd, offset, angle = trajectory.stations(10.0)
+    assert rows == 2 * len(md)
+    values = np.array([line.split(',')[1:] for line in lines[1:len(md) + 1]], dtype=np.float64)
+    np.testing.assert_allclose(values, np.column_stack([md, tvd, offset, angle]), atol=1e-3)
+    assert {line.split(',')[0] for line in lines[1:]} == {'Скв-1', 'Скв-2'}
+
+
+def test_table_indices_written_as_integers(tmp_path, designs):
+    table, codes = evaluate_valid(designs)
+    valid = np.flatnonzero(codes == 0)
+
+    path = tmp_path / 'tables.csv'
+    with open_table_writer(path) as writer:
+        rows = export_tables(writer, designs, chunk=2)
+    lines = path.read_text().splitlines()
+    assert lines[0] == ','.join(TABLE_COLUMNS)
+    assert rows == len(valid) * table.shape[1]
+    design, segment = lines[1].split(',')[:2]
+    assert (design, segment) == (str(valid[0]), '0')
+
+    path = tmp_path / 'tables.xlsx'
+    with open_table_writer(path) as writer:
+        export_tables(writer, designs)
+    sheet = load_workbook(path, read_only=True).active
+    rows = list(sheet.iter_rows(values_only=True))
+    assert rows[0] == TABLE_COLUMNS
+    assert all(isinstance(row[0], int) and isinstance(row[1], int) for row in rows[1:])
+    np.testing.assert_allclose(rows[1][2:], table[valid[0], 0])
+
+
+def test_las_single_well(tmp_path, trajectory):
+    path = tmp_path / 'well.las'
+    with open_writer(path, ('DEPT', 'TVD', 'VS', 'INC')) as writer:
+        rows = export_stations(writer, [('Скв-1', trajectory)], step=10.0, chunk=50)
+
+    header = read_header(path)
+    assert header.curves == ['DEPT', 'TVD', 'VS', 'INC']
+    text = path.read_text(encoding='utf-8')
+    assert ' Скв-1 : WELL' in text
+    strt = next(line for line in text.splitlines() if line.startswith(' STRT'))
+    stop = next(line for line in text.splitlines() if line.startswith(' STOP'))
+    assert float(strt.split()[1]) == 0.0
+    assert float(stop.split()[1]) == pytest.approx(trajectory.length, abs=1e-4)
+    assert sum(len(chunk) for chunk in read_log_chunks(path)) == rows
+
+    with pytest.raises(ValueError):
+        with LasWriter(tmp_path / 'two.las') as writer:
+            export_stations(writer, [('1', trajectory), ('2', trajectory)], step=100.0)
+
+    # Длинное имя обрезается по ширине поля в байтах без разрыва символов UTF-8
+    with LasWriter(path, well='Скважина ' * 10) as writer:
+        export_stations(writer, [(None, trajectory)], step=100.0)
+    line = next(line for line in path.read_text(encoding='utf-8').splitlines() if line.endswith(': WELL'))
+    assert line.split(' : ')[0].split('.', 1)[1].strip().startswith('Скважина')
@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+
+from src.core.calculations.batch import DEPTH, DISLOCATION, ANGLE
+from src.core.calculations.catalog import HORIZONTAL_CLASSES
+from src.core.calculations.horizontal_wells.directional_profiles import ThreeInterval
+from src.core.calculations.landing import solve_landing
+from src.core.calculations.trajectory import profile_table, Trajectory
+
+
+HORIZONTAL_PARAMS = {'T1': 5.0, 'T2': 5.0, 'R1': 300.0}
+
+
+@pytest.mark.parametrize('horizontal_cls', HORIZONTAL_CLASSES.values(), ids=lambda cls: cls.__name__)
+def test_landing_joins_both_parts_and_reaches_end(horizontal_cls):
+    H_e = np.array([2520.0, 2560.0, 2600.0, 2500.0])
+    A_e = np.array([1600.0, 1800.0, 2300.0, 1300.0])
+    result = solve_landing(
+        (2500.0, 800.0), (H_e, A_e), ThreeInterval, horizontal_cls,
+        directional_params={'a1': 20.0, 'R1': 400.0},
+        horizontal_params={name: HORIZONTAL_PARAMS[name] for name in horizontal_cls._PARAMS if name in HORIZONTAL_PARAMS}
+    )
+    valid = np.flatnonzero(result.codes == 0)
+    assert len(valid) > 0
+
+    for index in valid:
+        directional, horizontal = result.directional_tables[index], result.horizontal_tables[index]
+        # Направляющая часть приходит в начало горизонтального участка с углом посадки
+        assert directional[-1, DEPTH] == pytest.approx(2500.0)
+        assert directional[-1, DISLOCATION] == pytest.approx(800.0)
+        assert directional[-1, ANGLE] == pytest.approx(result.a[index])
+        assert horizontal[-1, DEPTH] == pytest.approx(H_e[index])
+        assert horizontal[-1, DISLOCATION] == pytest.approx(A_e[index])
+
+        # Общая траектория проходит через конец горизонтального участка без разрывов
+        trajectory = Trajectory.from_table(profile_table(*result.profiles(index)))
+        tvd, offset, _ = trajectory.position_at(trajectory.length)
+        assert (tvd, offset) == pytest.approx((H_e[index], A_e[index]))
@@ -0,0 +1,32 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from src.core.calculations.pad_assignment import solve_assignment
+
+
+def brute_force(cost):
+    """Наименьшая суммарная стоимость перебором всех назначений строк (n <= m)"""
+    n, m = cost.shape
+    return min(cost[np.arange(n), list(columns)].sum() for columns in itertools.permutations(range(m), n))
+
+
+@pytest.mark.parametrize('shape', [(1, 1), (3, 3), (5, 5), (6, 6), (3, 6), (4, 7)])
+def test_solve_assignment_matches_brute_force(shape):
+    rng = np.random.default_rng(sum(shape))
+    for _ in range(20):
+        cost = rng.uniform(0, 100, shape).round(1)
+        cols = solve_assignment(cost)
+        assert len(set(cols.tolist())) == shape[0]
+        assert cost[np.arange(shape[0]), cols].sum() == pytest.approx(brute_force(cost))
+
+
+def test_solve_assignment_more_rows_than_columns():
+    rng = np.random.default_rng(7)
+    for _ in range(20):
+        cost = rng.uniform(0, 100, (6, 4))
+        cols = solve_assignment(cost)
+        rows = np.flatnonzero(cols >= 0)
+        assert len(rows) == 4 and sorted(cols[rows].tolist()) == [0, 1, 2, 3]
+        assert cost[rows, cols[rows]].sum() == pytest.approx(brute_force(cost.T))
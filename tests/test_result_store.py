@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+from src.core.calculations.result_store import ResultStore, save_results, append_results
+
+
+def make_wells(rng, names):
+    return [
+        (name, rng.normal(size=(rng.integers(1, 8), 7)), rng.normal(size=(rng.integers(0, 50), 5)) if i % 2 else None)
+        for i, name in enumerate(names)
+    ]
+
+
+def assert_store(store, wells):
+    assert len(store) == len(wells)
+    assert store.names == [name for name, _, _ in wells]
+    for i, (name, table, stations) in enumerate(wells):
+        assert store.index(name) == i
+        np.testing.assert_array_equal(store.table(i), table)
+        expected = np.empty((0, 5)) if stations is None else stations
+        np.testing.assert_array_equal(store.station_table(i), expected)
+
+
+def test_result_store_round_trip(tmp_path):
+    path = tmp_path / 'results.bin'
+    wells = make_wells(np.random.default_rng(0), ['Скв-1', 'Скв-2', 'well 3'])
+    assert save_results(path, wells) == 3
+    assert_store(ResultStore.open(path), wells)
+
+
+def test_result_store_append(tmp_path):
+    path = tmp_path / 'results.bin'
+    rng = np.random.default_rng(1)
+    first, second = make_wells(rng, ['A', 'B']), make_wells(rng, ['C'])
+    append_results(path, first)
+    append_results(path, second)
+    assert_store(ResultStore.open(path), first + second)
+
+
+def test_result_store_empty_and_invalid(tmp_path):
+    path = tmp_path / 'results.bin'
+    save_results(path, [])
+    assert len(ResultStore.open(path)) == 0
+
+    with pytest.raises(ValueError):
+        save_results(path, [('a\nb', np.zeros((1, 7)), None)])
+
+    path.write_bytes(b'not a result file' * 10)
+    with pytest.raises(ValueError):
+        ResultStore.open(path)
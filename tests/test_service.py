@@ -0,0 +1,75 @@
+import asyncio
+import json
+
+import numpy as np
+import pytest
+
+from src.core.calculations.validation import Reason
+from src.core.service.client import ServiceClient
+from src.core.service.server import ProfileService
+from src.core.service.workers import trajectory_stations
+
+
+def test_trajectory_stations_reaches_target():
+    values, code, messages = trajectory_stations(('ThreeInterval', (2500, 800, 60, 20, 400)), (None, ()), 10.0)
+    assert code == 0 and messages == []
+    np.testing.assert_allclose(values[-1, 1:3], [2500, 800], atol=1e-6)
+
+
+def test_trajectory_stations_rejects_invalid_designs():
+    values, code, messages = trajectory_stations(('TwoInterval', (2500, 800, 0)), (None, ()), 10.0)
+    assert values is None and code & Reason.SINGULAR and messages
+
+    # Параметры в области определения, но участок стабилизации получается отрицательной длины
+    values, code, messages = trajectory_stations(('ThreeInterval', (500, 800, 60, 20, 3000)), (None, ()), 10.0)
+    assert values is None and code & (Reason.NEGATIVE_INTERVAL | Reason.NOT_FINITE_RESULT) and messages
+
+
+async def _closing_request(port, path, payload):
+    """Запрос с Connection: close - ответ должен завершаться закрытием соединения сервером"""
+    body = json.dumps(payload).encode()
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    writer.write(
+        f"POST {path} HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\nContent-Length: {len(body)}\r\n\r\n".encode()
+        + body
+    )
+    await writer.drain()
+    response = await asyncio.wait_for(reader.read(), timeout=30)
+    writer.close()
+    return response
+
+
+def test_service_endpoints():
+    async def scenario():
+        service = await ProfileService(port=0, processes=1).start()
+        try:
+            # Первый запрос запускает рабочие процессы: они не должны удерживать соединение клиента
+            response = await _closing_request(service.port, '/stations', {
+                'directional': {'type': 'TwoInterval', 'params': {'H': 2500, 'A': 800, 'a': 60}}, 'step': 100.0
+            })
+            assert response.startswith(b'HTTP/1.1 200')
+
+            async with ServiceClient(port=service.port) as client:
+                status, body = await client.json('POST', '/solve', {
+                    'type': 'ThreeInterval', 'params': {'H': 2500, 'A': 800, 'a': 60, 'a1': 20, 'R1': 400}
+                })
+                assert status == 200 and body['code'] == 0
+
+                status, _, csv = await client.request('POST', '/stations', {
+                    'directional': {'type': 'ThreeInterval', 'params': {'H': 2500, 'A': 800, 'a': 60, 'a1': 20, 'R1': 400}},
+                    'step': 50.0
+                })
+                assert status == 200
+                assert csv.decode().splitlines()[0] == 'md,tvd,offset,angle'
+
+                status, body = await client.json('POST', '/stations', {
+                    'directional': {'type': 'TwoInterval', 'params': {'H': 2500, 'A': 800, 'a': 0}}
+                })
+                assert status == 400 and 'SINGULAR' in body['reasons']
+
+                status, body = await client.json('POST', '/solve', {'type': 'Unknown', 'params': {}})
+                assert status == 400
+        finally:
+            await service.stop()
+
+    asyncio.run(scenario())
@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+
+from src.core.calculations.horizontal_wells.directional_profiles import ThreeInterval
+from src.core.calculations.sidetrack import pareto_mask, sidetrack_options
+from src.core.calculations.trajectory import Trajectory
+
+
+@pytest.fixture
+def result():
+    stations = Trajectory.from_profiles(ThreeInterval(2500, 800, 60, 20, 400)).stations(30)
+    return sidetrack_options(stations, (2600, 1500), [200, 400, 800])
+
+
+def test_pareto_trajectories_reach_target(result):
+    assert len(result.pareto[0]) > 0
+    for station, radius in zip(*result.pareto):
+        trajectory = result.trajectory(station, radius)
+        tvd, offset, _ = trajectory.position_at(trajectory.length)
+        assert tvd == pytest.approx(2600, abs=1e-6)
+        assert offset == pytest.approx(1500, abs=1e-6)
+        assert trajectory.length - result.stations[0][station] == pytest.approx(result.added[station, radius])
+        # Добавленные дуга и прямолинейный участок согласованы с узлами
+        assert np.all(trajectory.node_errors()[-2:] < 1e-6)
+
+
+def test_pareto_mask_matches_brute_force():
+    rng = np.random.default_rng(0)
+    kickoff = rng.integers(0, 30, 300).astype(float)
+    added = rng.integers(0, 30, 300).astype(float)
+    intensity = rng.choice([0.7, 1.4, 2.9], 300)
+
+    expected = np.array([
+        not np.any(
+            (kickoff >= kickoff[i]) & (added <= added[i]) & (intensity <= intensity[i])
+            & ((kickoff > kickoff[i]) | (added < added[i]) | (intensity < intensity[i]))
+        )
+        for i in range(len(kickoff))
+    ])
+    np.testing.assert_array_equal(pareto_mask(kickoff, added, intensity), expected)
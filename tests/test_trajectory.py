@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+
+from src.core.calculations.batch import DEPTH, DISLOCATION, ANGLE, evaluate_valid, feasible
+from src.core.calculations.horizontal_wells.horizontal_profiles import HorizontalProfile
+from src.core.calculations.trajectory import Trajectory
+
+from tests.test_batch import CLASSES, random_designs
+
+
+@pytest.mark.parametrize('profile_cls', CLASSES, ids=lambda cls: f"{cls.__module__.rsplit('.', 1)[-1]}.{cls.__name__}")
+def test_position_at_reproduces_table_nodes(profile_cls):
+    designs = random_designs(profile_cls, seed=1)
+    table, codes = evaluate_valid(designs)
+    valid = np.flatnonzero((codes == 0) & feasible(table))
+    assert len(valid) > 0
+
+    for index in valid[:50]:
+        # Горизонтальная часть начинается в конце направляющей (H, A, a)
+        start = (0.0, 0.0, 0.0, 0.0)
+        if issubclass(profile_cls, HorizontalProfile):
+            profile = designs.profile(index)
+            start = (0.0, profile.H, profile.A, profile.a)
+        trajectory = Trajectory.from_table(table[index], start)
+        tvd, offset, angle = trajectory.position_at(trajectory.md[1:])
+        np.testing.assert_allclose(tvd, table[index][:, DEPTH], atol=1e-6)
+        np.testing.assert_allclose(offset, table[index][:, DISLOCATION], atol=1e-6)
+        np.testing.assert_allclose(angle, table[index][:, ANGLE], atol=1e-9)
+
+
+def test_node_off_arc_is_rejected():
+    # Вертикальный участок 100 м, конец которого смещён на 1 м в сторону
+    with pytest.raises(ValueError):
+        Trajectory([0, 100], [0, 100], [0, 1], [0, 0])
+    Trajectory([0, 100], [0, 100], [0, 1], [0, 0], check=False)
+
+
+def test_stations_follow_arc():
+    # Дуга набора радиусом 100 м от 0 до 90 градусов
+    radius = 100.0
+    trajectory = Trajectory([0, np.pi / 2 * radius], [0, radius], [0, radius], [0, 90])
+    md, tvd, offset, angle = trajectory.stations(step=10.0)
+    np.testing.assert_allclose(tvd, radius * np.sin(md / radius), atol=1e-9)
+    np.testing.assert_allclose(offset, radius * (1 - np.cos(md / radius)), atol=1e-9)
+    np.testing.assert_allclose(angle, np.degrees(md / radius), atol=1e-9)
+
+    chunks = list(trajectory.iter_stations(step=10.0, chunk=4))
+    np.testing.assert_array_equal(np.concatenate([chunk[0] for chunk in chunks]), md)
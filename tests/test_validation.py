@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+
+from src.core.calculations.batch import evaluate_valid
+from src.core.calculations.catalog import DIRECTIONAL_CLASSES, HORIZONTAL_CLASSES
+from src.core.calculations.horizontal_wells import Tangential, Undulant
+from src.core.calculations.inclined_wells import inclined_profiles as inclined
+from src.core.calculations.profile_arrays import ProfileArray
+from src.core.calculations.validation import Reason, RULES, explain, rules, validate
+
+from tests.test_batch import CLASSES, random_designs
+
+
+BAD_TARGET = dict(H=-5, A=-3, a=120)
+
+
+def test_every_profile_class_has_rules():
+    for profile_cls in CLASSES:
+        assert profile_cls in RULES
+    with pytest.raises(ValueError):
+        rules(object)
+
+
+@pytest.mark.parametrize('profile_cls', [*DIRECTIONAL_CLASSES.values(), *HORIZONTAL_CLASSES.values()],
+                         ids=lambda cls: cls.__name__)
+def test_target_rules_cover_every_class(profile_cls):
+    params = {name: 300.0 for name in profile_cls._PARAMS}
+    params.update(BAD_TARGET, a1=10.0, a3=40.0, T1=3.0, T2=3.0)
+    code = validate(profile_cls, **{name: params[name] for name in profile_cls._PARAMS})
+    assert code & (Reason.DEPTH | Reason.DISPLACEMENT | Reason.ANGLE) == Reason.DEPTH | Reason.DISPLACEMENT | Reason.ANGLE
+
+
+def test_undulant_target_matches_tangential():
+    undulant = validate(Undulant, S_l=1000, T1=3, T2=3, R1=300, **BAD_TARGET)
+    tangential = validate(Tangential, S_l=1000, **BAD_TARGET)
+    assert undulant == tangential == Reason.DEPTH | Reason.DISPLACEMENT | Reason.ANGLE
+
+
+def test_s_shaped_final_angle_outside_range():
+    params = dict(H=2000, A=600, H1=2200, L_v=300, R2=600, a1=30, R4=800)
+    assert inclined.SShaped(*params.values()).a < 0
+    assert validate(inclined.SShaped, **params) == Reason.ANGLE
+    assert explain(inclined.SShaped, **params) == ["Конечный угол a должен быть в диапазоне от 0 до 90 град"]
+
+    _, codes = evaluate_valid(ProfileArray.from_columns(inclined.SShaped, **{k: [v] for k, v in params.items()}))
+    assert codes[0] & Reason.ANGLE
+
+
+@pytest.mark.parametrize('profile_cls', CLASSES, ids=lambda cls: f"{cls.__module__.rsplit('.', 1)[-1]}.{cls.__name__}")
+def test_valid_rows_compute(profile_cls):
+    designs = random_designs(profile_cls, size=2000, seed=3)
+    table, codes = evaluate_valid(designs)
+    valid = codes == 0
+    assert np.isfinite(table[valid]).all()
+    if 'a' not in profile_cls._PARAMS:
+        # Конечный угол рассчитывается - он должен оставаться в диапазоне 0..90 град
+        for index in np.flatnonzero(valid)[:200]:
+            assert 0 <= designs.profile(index).a <= 90